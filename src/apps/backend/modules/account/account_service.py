@@ -1,13 +1,21 @@
+from typing import List
+
+from modules.account.errors import AccountWithPhoneNumberExistsError
+from modules.account.internal.account_cache import AccountCache
+from modules.account.internal.account_provisioning_writer import AccountProvisioningWriter
 from modules.account.internal.account_reader import AccountReader
 from modules.account.internal.account_writer import AccountWriter
 from modules.account.types import (
     Account,
+    AccountCacheMetrics,
+    AccountProvisioningResult,
     AccountSearchByIdParams,
     AccountSearchParams,
     CreateAccountByPhoneNumberParams,
     CreateAccountByUsernameAndPasswordParams,
     AccountDeletionResult,
     PhoneNumber,
+    ProvisionAccountsParams,
     ResetPasswordParams,
     UpdateAccountProfileParams,
 )
@@ -23,14 +31,12 @@ from modules.notification.types import (
 class AccountService:
     @staticmethod
     def create_account_by_username_and_password(*, params: CreateAccountByUsernameAndPasswordParams) -> Account:
-        account = AccountWriter.create_account_by_username_and_password(params=params)
-        AccountService.create_or_update_account_notification_preferences(
-            account_id=account.id,
-            preferences=CreateOrUpdateAccountNotificationPreferencesParams(
-                email_enabled=True, push_enabled=True, sms_enabled=True
-            ),
-        )
-        return account
+        # No notification preferences are written: an account without stored ones has the defaults
+        return AccountWriter.create_account_by_username_and_password(params=params)
+
+    @staticmethod
+    def provision_accounts(*, params: ProvisionAccountsParams) -> AccountProvisioningResult:
+        return AccountProvisioningWriter.provision_accounts(params=params)
 
     @staticmethod
     def get_account_by_phone_number(*, phone_number: PhoneNumber) -> Account:
@@ -41,13 +47,11 @@ class AccountService:
         account = AccountReader.get_account_by_phone_number_optional(phone_number=params.phone_number)
 
         if account is None:
-            account = AccountWriter.create_account_by_phone_number(params=params)
-            AccountService.create_or_update_account_notification_preferences(
-                account_id=account.id,
-                preferences=CreateOrUpdateAccountNotificationPreferencesParams(
-                    email_enabled=True, push_enabled=True, sms_enabled=True
-                ),
-            )
+            try:
+                account = AccountWriter.create_account_by_phone_number(params=params)
+            except AccountWithPhoneNumberExistsError:
+                # A concurrent request created the account between the lookup and the insert
+                account = AccountReader.get_account_by_phone_number(phone_number=params.phone_number)
 
         create_otp_params = CreateOTPParams(phone_number=params.phone_number)
         AuthenticationService.create_otp(params=create_otp_params, account_id=account.id)
@@ -74,6 +78,10 @@ class AccountService:
     def get_account_by_id(*, params: AccountSearchByIdParams) -> Account:
         return AccountReader.get_account_by_id(params=params)
 
+    @staticmethod
+    def get_accounts_by_ids(*, account_ids: List[str]) -> List[Account]:
+        return AccountReader.get_accounts_by_ids(account_ids=account_ids)
+
     @staticmethod
     def get_account_by_username(*, username: str) -> Account:
         return AccountReader.get_account_by_username(username=username)
@@ -101,3 +109,7 @@ class AccountService:
     @staticmethod
     def delete_account(*, account_id: str) -> AccountDeletionResult:
         return AccountWriter.delete_account(account_id=account_id)
+
+    @staticmethod
+    def get_account_cache_metrics() -> AccountCacheMetrics:
+        return AccountCache.get_metrics()
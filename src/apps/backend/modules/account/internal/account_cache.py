@@ -0,0 +1,185 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from bson.objectid import ObjectId
+
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.types import Account, AccountCacheMetrics
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+
+
+@dataclass(frozen=True)
+class AccountCacheEntry:
+    account: Account
+    expires_at: float
+    # The account's version when it was read; None for accounts written before versions existed
+    version: Optional[int]
+
+
+class AccountCache:
+    """
+    In-process LRU cache of active accounts, keyed by id with a secondary index by username. Hits are served from
+    memory. Writers in this process invalidate an account after changing it, and each invalidation bumps a generation
+    that makes fills started before it be dropped, so a lookup racing with a write cannot put the old account back.
+    Every account write also bumps the account's version, and once every revalidate_interval_seconds a lookup checks
+    the versions of all cached accounts in one query, dropping those changed or deleted by other processes. Entries
+    also expire after ttl_seconds. The metrics are logged once every metrics_log_interval_seconds.
+    """
+
+    _entries: "OrderedDict[str, AccountCacheEntry]" = OrderedDict()
+    _account_ids_by_username: Dict[str, str] = {}
+    _generation = 0
+    _lock = threading.Lock()
+    _next_revalidation_at: Optional[float] = None
+    _next_metrics_log_at: Optional[float] = None
+    _hit_count = 0
+    _miss_count = 0
+    _stale_count = 0
+    _eviction_count = 0
+    _invalidation_count = 0
+
+    @classmethod
+    def get_generation(cls) -> int:
+        with cls._lock:
+            return cls._generation
+
+    @classmethod
+    def get_by_id(cls, account_id: str) -> Optional[Account]:
+        cls._run_periodic_tasks()
+        with cls._lock:
+            return cls._get_entry_account(account_id)
+
+    @classmethod
+    def get_by_username(cls, username: str) -> Optional[Account]:
+        cls._run_periodic_tasks()
+        with cls._lock:
+            return cls._get_entry_account(cls._account_ids_by_username.get(username, ""))
+
+    @classmethod
+    def put(cls, account: Account, version: Optional[int], generation: int) -> None:
+        """
+        Caches an account read from the database; generation is the value of get_generation() taken before that read.
+        """
+        ttl_seconds = ConfigService[int].get_value(key="accounts.cache.ttl_seconds", default=10)
+        max_size = ConfigService[int].get_value(key="accounts.cache.max_size", default=10000)
+        if ttl_seconds <= 0 or max_size <= 0:
+            return
+
+        with cls._lock:
+            if generation != cls._generation:
+                return
+
+            cls._remove_entry(account.id)
+            cls._entries[account.id] = AccountCacheEntry(
+                account=account, expires_at=time.monotonic() + ttl_seconds, version=version
+            )
+            if account.username:
+                cls._account_ids_by_username[account.username] = account.id
+            while len(cls._entries) > max_size:
+                cls._remove_entry(next(iter(cls._entries)))
+                cls._eviction_count += 1
+
+    @classmethod
+    def invalidate(cls, account_id: str) -> None:
+        with cls._lock:
+            cls._generation += 1
+            cls._invalidation_count += 1
+            cls._remove_entry(account_id)
+
+    @classmethod
+    def revalidate(cls) -> None:
+        """
+        Drops the cached accounts whose version no longer matches the database, or that are no longer active there.
+        """
+        with cls._lock:
+            cached_entries = list(cls._entries.values())
+        if not cached_entries:
+            return
+
+        current_versions = {
+            str(account_bson["_id"]): account_bson.get("version")
+            for account_bson in AccountRepository.collection().find(
+                {"_id": {"$in": [ObjectId(entry.account.id) for entry in cached_entries]}, "active": True},
+                {"_id": 1, "version": 1},
+            )
+        }
+        stale_entries: List[AccountCacheEntry] = [
+            entry
+            for entry in cached_entries
+            if entry.account.id not in current_versions or current_versions[entry.account.id] != entry.version
+        ]
+
+        with cls._lock:
+            for entry in stale_entries:
+                if cls._entries.get(entry.account.id) is entry:
+                    cls._remove_entry(entry.account.id)
+                    cls._stale_count += 1
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._generation += 1
+            cls._entries.clear()
+            cls._account_ids_by_username.clear()
+            cls._next_revalidation_at = None
+
+    @classmethod
+    def get_metrics(cls) -> AccountCacheMetrics:
+        with cls._lock:
+            lookup_count = cls._hit_count + cls._miss_count
+            return AccountCacheMetrics(
+                size=len(cls._entries),
+                hit_count=cls._hit_count,
+                miss_count=cls._miss_count,
+                hit_rate=cls._hit_count / lookup_count if lookup_count else 0.0,
+                stale_count=cls._stale_count,
+                eviction_count=cls._eviction_count,
+                invalidation_count=cls._invalidation_count,
+            )
+
+    @classmethod
+    def _run_periodic_tasks(cls) -> None:
+        revalidate_interval_seconds = ConfigService[int].get_value(
+            key="accounts.cache.revalidate_interval_seconds", default=2
+        )
+        metrics_log_interval_seconds = ConfigService[int].get_value(
+            key="accounts.cache.metrics_log_interval_seconds", default=60
+        )
+        now = time.monotonic()
+
+        # The first lookup to find a task due claims it, so each runs once per interval in every process
+        with cls._lock:
+            is_revalidation_due = cls._next_revalidation_at is not None and cls._next_revalidation_at <= now
+            if cls._next_revalidation_at is None or is_revalidation_due:
+                cls._next_revalidation_at = now + revalidate_interval_seconds
+            is_metrics_log_due = cls._next_metrics_log_at is not None and cls._next_metrics_log_at <= now
+            if cls._next_metrics_log_at is None or is_metrics_log_due:
+                cls._next_metrics_log_at = now + metrics_log_interval_seconds
+
+        if is_revalidation_due:
+            cls.revalidate()
+        if is_metrics_log_due:
+            Logger.info(message=f"Account cache metrics: {asdict(cls.get_metrics())}")
+
+    @classmethod
+    def _get_entry_account(cls, account_id: str) -> Optional[Account]:
+        entry = cls._entries.get(account_id)
+        if entry is None or entry.expires_at <= time.monotonic():
+            if entry is not None:
+                cls._remove_entry(account_id)
+            cls._miss_count += 1
+            return None
+
+        cls._entries.move_to_end(account_id)
+        cls._hit_count += 1
+        return entry.account
+
+    @classmethod
+    def _remove_entry(cls, account_id: str) -> None:
+        entry = cls._entries.pop(account_id, None)
+        if entry is not None and cls._account_ids_by_username.get(entry.account.username) == account_id:
+            del cls._account_ids_by_username[entry.account.username]
@@ -0,0 +1,152 @@
+import codecs
+import json
+from typing import IO, Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from pymongo.errors import BulkWriteError
+
+from modules.account.errors import AccountBadRequestError
+from modules.account.internal.store.account_model import AccountModel
+from modules.account.internal.store.account_repository import AccountRepository
+from modules.account.types import AccountProvisioningResult, AccountProvisioningRowError, ProvisionAccountsParams
+from modules.application.password_hasher import PasswordHasher
+
+# Failures past this many are counted but not listed, so the result of a bad 100k-row file stays small
+MAX_ACCOUNT_PROVISIONING_ERRORS = 1000
+DUPLICATE_KEY_ERROR_CODE = 11000
+
+
+class AccountProvisioningWriter:
+    @staticmethod
+    def provision_accounts(*, params: ProvisionAccountsParams) -> AccountProvisioningResult:
+        """
+        Reads one account per NDJSON line and creates valid rows in batches: the batch's passwords are hashed
+        across the password hasher pool, then its accounts are written with one insert_many. Memory is bounded by
+        the batch size, and a failed row does not stop the others.
+        """
+        processed_rows = 0
+        created_count = 0
+        failed_count = 0
+        errors: List[AccountProvisioningRowError] = []
+        pending_rows: List[Tuple[int, Dict[str, Any]]] = []
+
+        def add_errors(row_errors: List[AccountProvisioningRowError]) -> None:
+            nonlocal failed_count
+            failed_count += len(row_errors)
+            errors.extend(row_errors[: max(0, MAX_ACCOUNT_PROVISIONING_ERRORS - len(errors))])
+
+        for row_number, row, parse_error in AccountProvisioningWriter._read_rows(params.stream):
+            processed_rows += 1
+            row_error = parse_error or AccountProvisioningWriter._get_row_error(row)
+            if row_error:
+                username = (
+                    row.get("username") if isinstance(row, dict) and isinstance(row.get("username"), str) else None
+                )
+                add_errors([AccountProvisioningRowError(row=row_number, message=row_error, username=username)])
+                continue
+
+            pending_rows.append((row_number, row))
+            if len(pending_rows) >= params.batch_size:
+                batch_created_count, batch_errors = AccountProvisioningWriter._create_accounts_batch(pending_rows)
+                created_count += batch_created_count
+                add_errors(batch_errors)
+                pending_rows = []
+
+        if pending_rows:
+            batch_created_count, batch_errors = AccountProvisioningWriter._create_accounts_batch(pending_rows)
+            created_count += batch_created_count
+            add_errors(batch_errors)
+
+        return AccountProvisioningResult(
+            processed_rows=processed_rows, created_count=created_count, failed_count=failed_count, errors=errors
+        )
+
+    @staticmethod
+    def _create_accounts_batch(rows: List[Tuple[int, Dict[str, Any]]]) -> Tuple[int, List[AccountProvisioningRowError]]:
+        # Taken usernames are dropped before hashing, which costs far more than this one query. The unique index
+        # still rejects any created concurrently
+        taken_usernames: Set[str] = {
+            account_bson["username"]
+            for account_bson in AccountRepository.collection().find(
+                {"username": {"$in": [row["username"] for _, row in rows]}, "active": True}, {"username": 1}
+            )
+        }
+        batch_errors: List[AccountProvisioningRowError] = []
+        new_rows: List[Tuple[int, Dict[str, Any]]] = []
+        for row_number, row in rows:
+            if row["username"] in taken_usernames:
+                batch_errors.append(AccountProvisioningWriter._build_duplicate_username_error(row_number, row))
+                continue
+            taken_usernames.add(row["username"])
+            new_rows.append((row_number, row))
+
+        if not new_rows:
+            return 0, batch_errors
+
+        hashed_passwords = PasswordHasher.hash_passwords(passwords=[row["password"] for _, row in new_rows])
+        accounts_bson = [
+            AccountModel(
+                first_name=row.get("first_name", ""),
+                hashed_password=hashed_password,
+                id=None,
+                last_name=row.get("last_name", ""),
+                phone_number=None,
+                username=row["username"],
+            ).to_bson()
+            for (_, row), hashed_password in zip(new_rows, hashed_passwords)
+        ]
+
+        insert_failed_count = 0
+        try:
+            AccountRepository.collection().insert_many(accounts_bson, ordered=False)
+        except BulkWriteError as e:
+            for write_error in e.details.get("writeErrors", []):
+                insert_failed_count += 1
+                row_number, row = new_rows[write_error["index"]]
+                if write_error.get("code") == DUPLICATE_KEY_ERROR_CODE:
+                    batch_errors.append(AccountProvisioningWriter._build_duplicate_username_error(row_number, row))
+                else:
+                    batch_errors.append(
+                        AccountProvisioningRowError(
+                            row=row_number, message=write_error.get("errmsg", "Write failed"), username=row["username"]
+                        )
+                    )
+
+        return len(accounts_bson) - insert_failed_count, sorted(batch_errors, key=lambda row_error: row_error.row)
+
+    @staticmethod
+    def _build_duplicate_username_error(row_number: int, row: Dict[str, Any]) -> AccountProvisioningRowError:
+        return AccountProvisioningRowError(
+            row=row_number,
+            message=f"An account with the username {row['username']} already exists",
+            username=row["username"],
+        )
+
+    @staticmethod
+    def _get_row_error(row: Any) -> Optional[str]:
+        if not isinstance(row, dict):
+            return "Row must be a JSON object"
+        for field in ("username", "password"):
+            if not isinstance(row.get(field), str) or not row[field].strip():
+                return f"{field} is required"
+        for field in ("first_name", "last_name"):
+            if field in row and not isinstance(row[field], str):
+                return f"{field} must be a string"
+        return None
+
+    @staticmethod
+    def _read_rows(stream: IO[bytes]) -> Iterator[Tuple[int, Any, Optional[str]]]:
+        """
+        Yields (line number, parsed row, parse error) for every non-blank line.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        for row_number, line_bytes in enumerate(iter(stream.readline, b""), start=1):
+            try:
+                line = decoder.decode(line_bytes)
+            except UnicodeDecodeError:
+                raise AccountBadRequestError(f"Line {row_number} is not valid UTF-8, provisioning stopped there")
+            if not line.strip():
+                continue
+            try:
+                yield row_number, json.loads(line), None
+            except json.JSONDecodeError:
+                yield row_number, None, "Row is not valid JSON"
@@ -1,39 +1,38 @@
 from dataclasses import asdict
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from bson.objectid import ObjectId
 
 from modules.account.errors import (
     AccountInvalidPasswordError,
     AccountWithIdNotFoundError,
-    AccountWithPhoneNumberExistsError,
     AccountWithPhoneNumberNotFoundError,
-    AccountWithUserNameExistsError,
     AccountWithUsernameNotFoundError,
 )
+from modules.account.internal.account_cache import AccountCache
 from modules.account.internal.account_util import AccountUtil
 from modules.account.internal.store.account_repository import AccountRepository
-from modules.account.types import (
-    Account,
-    AccountSearchByIdParams,
-    AccountSearchParams,
-    CreateAccountByUsernameAndPasswordParams,
-    PhoneNumber,
-)
+from modules.account.types import Account, AccountSearchByIdParams, AccountSearchParams, PhoneNumber
 
 
 class AccountReader:
     @staticmethod
     def get_account_by_username(*, username: str) -> Account:
-        account_bson = AccountRepository.collection().find_one({"username": username, "active": True})
-        if account_bson is None:
-            raise AccountWithUsernameNotFoundError(username=username)
-
-        return AccountUtil.convert_account_bson_to_account(account_bson)
+        cached_account = AccountCache.get_by_username(username)
+        if cached_account is not None:
+            return cached_account
+
+        cache_generation = AccountCache.get_generation()
+        account_bson = AccountReader._find_account_bson_by_username(username=username)
+        account = AccountUtil.convert_account_bson_to_account(account_bson)
+        AccountCache.put(account, account_bson.get("version"), cache_generation)
+        return account
 
     @staticmethod
     def get_account_by_username_and_password(*, params: AccountSearchParams) -> Account:
-        account = AccountReader.get_account_by_username(username=params.username)
+        # Always read from the database, so a password is checked against the hash stored right now
+        account_bson = AccountReader._find_account_bson_by_username(username=params.username)
+        account = AccountUtil.convert_account_bson_to_account(account_bson)
 
         if not AccountUtil.compare_password(password=params.password, hashed_password=account.hashed_password):
             raise AccountInvalidPasswordError()
@@ -41,18 +40,29 @@ class AccountReader:
 
     @staticmethod
     def get_account_by_id(*, params: AccountSearchByIdParams) -> Account:
+        cached_account = AccountCache.get_by_id(params.id)
+        if cached_account is not None:
+            return cached_account
+
+        cache_generation = AccountCache.get_generation()
         account_bson = AccountRepository.collection().find_one({"_id": ObjectId(params.id), "active": True})
         if account_bson is None:
             raise AccountWithIdNotFoundError(id=params.id)
 
-        return AccountUtil.convert_account_bson_to_account(account_bson)
+        account = AccountUtil.convert_account_bson_to_account(account_bson)
+        AccountCache.put(account, account_bson.get("version"), cache_generation)
+        return account
 
     @staticmethod
-    def check_username_not_exist(*, params: CreateAccountByUsernameAndPasswordParams) -> None:
-        account_bson = AccountRepository.collection().find_one({"active": True, "username": params.username})
+    def get_accounts_by_ids(*, account_ids: List[str]) -> List[Account]:
+        object_ids = [ObjectId(account_id) for account_id in account_ids if ObjectId.is_valid(account_id)]
+        if not object_ids:
+            return []
 
-        if account_bson:
-            raise AccountWithUserNameExistsError(username=params.username)
+        return [
+            AccountUtil.convert_account_bson_to_account(account_bson)
+            for account_bson in AccountRepository.collection().find({"_id": {"$in": object_ids}, "active": True})
+        ]
 
     @staticmethod
     def get_account_by_phone_number_optional(*, phone_number: PhoneNumber) -> Optional[Account]:
@@ -72,9 +82,10 @@ class AccountReader:
         return account
 
     @staticmethod
-    def check_phone_number_not_exist(*, phone_number: PhoneNumber) -> None:
-        phone_number_dict = asdict(phone_number)
-        account_bson = AccountRepository.collection().find_one({"active": True, "phone_number": phone_number_dict})
-
-        if account_bson:
-            raise AccountWithPhoneNumberExistsError(phone_number=phone_number)
+    def _find_account_bson_by_username(*, username: str) -> Dict[str, Any]:
+        account_bson: Optional[Dict[str, Any]] = AccountRepository.collection().find_one(
+            {"username": username, "active": True}
+        )
+        if account_bson is None:
+            raise AccountWithUsernameNotFoundError(username=username)
+        return account_bson
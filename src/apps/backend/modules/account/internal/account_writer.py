@@ -4,9 +4,14 @@ from datetime import datetime
 from bson.objectid import ObjectId
 from phonenumbers import is_valid_number, parse
 from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
-from modules.account.errors import AccountWithIdNotFoundError
-from modules.account.internal.account_reader import AccountReader
+from modules.account.errors import (
+    AccountWithIdNotFoundError,
+    AccountWithPhoneNumberExistsError,
+    AccountWithUserNameExistsError,
+)
+from modules.account.internal.account_cache import AccountCache
 from modules.account.internal.account_util import AccountUtil
 from modules.account.internal.store.account_model import AccountModel
 from modules.account.internal.store.account_repository import AccountRepository
@@ -27,7 +32,6 @@ class AccountWriter:
         params_dict = asdict(params)
         params_dict["hashed_password"] = AccountUtil.hash_password(password=params.password)
         del params_dict["password"]
-        AccountReader.check_username_not_exist(params=params)
         account_bson = AccountModel(
             first_name=params.first_name,
             hashed_password=params_dict["hashed_password"],
@@ -36,9 +40,13 @@ class AccountWriter:
             phone_number=None,
             username=params.username,
         ).to_bson()
-        query = AccountRepository.collection().insert_one(account_bson)
-        account_bson = AccountRepository.collection().find_one({"_id": query.inserted_id})
+        # The unique index on active usernames rejects duplicates, including concurrent signups for the same one
+        try:
+            AccountRepository.collection().insert_one(account_bson)
+        except DuplicateKeyError:
+            raise AccountWithUserNameExistsError(username=params.username)
 
+        # insert_one sets _id on the document, which is then exactly what was stored
         return AccountUtil.convert_account_bson_to_account(account_bson)
 
     @staticmethod
@@ -50,12 +58,13 @@ class AccountWriter:
         if not is_valid_phone_number:
             raise OTPRequestFailedError()
 
-        AccountReader.check_phone_number_not_exist(phone_number=params.phone_number)
         account_bson = AccountModel(
             first_name="", hashed_password="", id=None, last_name="", phone_number=phone_number, username=""
         ).to_bson()
-        query = AccountRepository.collection().insert_one(account_bson)
-        account_bson = AccountRepository.collection().find_one({"_id": query.inserted_id})
+        try:
+            AccountRepository.collection().insert_one(account_bson)
+        except DuplicateKeyError:
+            raise AccountWithPhoneNumberExistsError(phone_number=params.phone_number)
 
         return AccountUtil.convert_account_bson_to_account(account_bson)
 
@@ -64,11 +73,12 @@ class AccountWriter:
         hashed_password = AccountUtil.hash_password(password=password)
         updated_account = AccountRepository.collection().find_one_and_update(
             {"_id": ObjectId(account_id)},
-            {"$set": {"hashed_password": hashed_password}},
+            {"$set": {"hashed_password": hashed_password, "updated_at": datetime.now()}, "$inc": {"version": 1}},
             return_document=ReturnDocument.AFTER,
         )
         if updated_account is None:
             raise AccountWithIdNotFoundError(id=account_id)
+        AccountCache.invalidate(account_id)
 
         return AccountUtil.convert_account_bson_to_account(updated_account)
 
@@ -83,10 +93,13 @@ class AccountWriter:
             update_fields["last_name"] = params.last_name
 
         updated_account = AccountRepository.collection().find_one_and_update(
-            {"_id": ObjectId(account_id)}, {"$set": update_fields}, return_document=ReturnDocument.AFTER
+            {"_id": ObjectId(account_id)},
+            {"$set": {**update_fields, "updated_at": datetime.now()}, "$inc": {"version": 1}},
+            return_document=ReturnDocument.AFTER,
         )
         if updated_account is None:
             raise AccountWithIdNotFoundError(id=account_id)
+        AccountCache.invalidate(account_id)
 
         return AccountUtil.convert_account_bson_to_account(updated_account)
 
@@ -95,11 +108,12 @@ class AccountWriter:
         deletion_time = datetime.now()
         updated_account = AccountRepository.collection().find_one_and_update(
             {"_id": ObjectId(account_id), "active": True},
-            {"$set": {"active": False, "updated_at": deletion_time}},
+            {"$set": {"active": False, "updated_at": deletion_time}, "$inc": {"version": 1}},
             return_document=ReturnDocument.AFTER,
         )
 
         if updated_account is None:
             raise AccountWithIdNotFoundError(id=account_id)
+        AccountCache.invalidate(account_id)
 
         return AccountDeletionResult(account_id=account_id, deleted_at=deletion_time, success=True)
@@ -21,6 +21,7 @@ class AccountModel(BaseModel):
     active: bool = True
     created_at: Optional[datetime] = datetime.now()
     updated_at: Optional[datetime] = datetime.now()
+    version: int = 0
 
     @classmethod
     def from_bson(cls, bson_data: dict) -> "AccountModel":
@@ -36,6 +37,7 @@ class AccountModel(BaseModel):
             username=bson_data.get("username", ""),
             created_at=bson_data.get("created_at"),
             updated_at=bson_data.get("updated_at"),
+            version=bson_data.get("version", 0),
         )
 
     @staticmethod
@@ -22,6 +22,7 @@ ACCOUNT_VALIDATION_SCHEMA = {
             "username": {"bsonType": "string", "description": "must be a string"},
             "created_at": {"bsonType": "date"},
             "updated_at": {"bsonType": "date"},
+            "version": {"bsonType": ["int", "long"]},
         },
         "anyOf": [{"required": ["username"]}, {"required": ["phone_number"]}],
     }
@@ -37,6 +38,28 @@ class AccountRepository(ApplicationRepository):
         collection.create_index([("active", 1), ("username", 1)], name="active_username_index")
         collection.create_index([("active", 1), ("phone_number", 1)], name="active_phone_number_index")
 
+        # Signup relies on these to reject a second active account with the same username or phone number in the
+        # insert itself. Phone number accounts store an empty username and username accounts a null phone number,
+        # so the partial filters leave those out instead of treating them as duplicates. Signup has no other check, so
+        # a failed build is raised rather than logged: the collection is then not handed out and the build is retried
+        # on the next use, instead of duplicates being accepted silently.
+        try:
+            collection.create_index(
+                "username",
+                name="unique_active_username_index",
+                unique=True,
+                partialFilterExpression={"active": True, "username": {"$gt": ""}},
+            )
+            collection.create_index(
+                "phone_number",
+                name="unique_active_phone_number_index",
+                unique=True,
+                partialFilterExpression={"active": True, "phone_number": {"$type": "object"}},
+            )
+        except OperationFailure as e:
+            Logger.error(message=f"OperationFailure occurred for collection accounts: {e.details}")
+            raise
+
         add_validation_command = {
             "collMod": cls.collection_name,
             "validator": ACCOUNT_VALIDATION_SCHEMA,
@@ -0,0 +1,23 @@
+from dataclasses import asdict
+
+from flask import jsonify, request
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.account.account_service import AccountService
+from modules.account.types import ProvisionAccountsParams
+from modules.authentication.rest_api.admin_auth_middleware import admin_auth_middleware
+from modules.config.config_service import ConfigService
+
+
+class AccountProvisioningView(MethodView):
+    @admin_auth_middleware
+    def post(self) -> ResponseReturnValue:
+        # The body is read one line at a time as it arrives; files too large for one request go through the
+        # provision_accounts script instead
+        provisioning_params = ProvisionAccountsParams(
+            stream=request.stream,
+            batch_size=ConfigService[int].get_value(key="accounts.provisioning.batch_size", default=500),
+        )
+        provisioning_result = AccountService.provision_accounts(params=provisioning_params)
+        return jsonify(asdict(provisioning_result)), 200
@@ -1,5 +1,6 @@
 from flask import Blueprint
 
+from modules.account.rest_api.account_provisioning_view import AccountProvisioningView
 from modules.account.rest_api.account_view import AccountView
 
 
@@ -9,6 +10,9 @@ class AccountRouter:
     @staticmethod
     def create_route(*, blueprint: Blueprint) -> Blueprint:
         blueprint.add_url_rule("/accounts", view_func=AccountView.as_view("account_view"))
+        blueprint.add_url_rule(
+            "/accounts:provision", view_func=AccountProvisioningView.as_view("account_provisioning_view")
+        )
         blueprint.add_url_rule(
             AccountRouter.ACCOUNT_BY_ID_URL, view_func=AccountView.as_view("account_view_by_id"), methods=["GET"]
         )
@@ -16,7 +16,6 @@ from modules.account.types import (
     UpdateAccountProfileParams,
 )
 from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
-from modules.notification.errors import AccountNotificationPreferencesNotFoundError
 from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
 
 
@@ -44,13 +43,10 @@ class AccountView(MethodView):
         include_notification_preferences = request.args.get("include_notification_preferences", "").lower() == "true"
 
         if include_notification_preferences:
-            try:
-                notification_preferences = AccountService.get_account_notification_preferences_by_account_id(
-                    account_id=account.id
-                )
-                account_dict["notification_preferences"] = asdict(notification_preferences)
-            except AccountNotificationPreferencesNotFoundError:
-                pass
+            notification_preferences = AccountService.get_account_notification_preferences_by_account_id(
+                account_id=account.id
+            )
+            account_dict["notification_preferences"] = asdict(notification_preferences)
 
         return jsonify(account_dict), 200
 
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Union
+from typing import IO, List, Optional, Union
 
 
 @dataclass(frozen=True)
@@ -55,6 +55,18 @@ class Account:
     username: str
 
 
+@dataclass(frozen=True)
+class AccountCacheMetrics:
+    size: int
+    hit_count: int
+    miss_count: int
+    hit_rate: float
+    # Cached entries dropped because the periodic version check found them changed by another process
+    stale_count: int
+    eviction_count: int
+    invalidation_count: int
+
+
 @dataclass(frozen=True)
 class ResetPasswordParams:
     account_id: str
@@ -69,6 +81,27 @@ class AccountDeletionResult:
     success: bool
 
 
+@dataclass(frozen=True)
+class ProvisionAccountsParams:
+    stream: IO[bytes]
+    batch_size: int
+
+
+@dataclass(frozen=True)
+class AccountProvisioningRowError:
+    row: int
+    message: str
+    username: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class AccountProvisioningResult:
+    processed_rows: int
+    created_count: int
+    failed_count: int
+    errors: List[AccountProvisioningRowError]
+
+
 @dataclass(frozen=True)
 class AccountErrorCode:
     INVALID_CREDENTIALS: str = "ACCOUNT_ERR_03"
@@ -1,7 +1,8 @@
 from typing import Any, Tuple, Type
 
 from modules.application.internal.worker_manager import WorkerManager
-from modules.application.types import BaseWorker, Worker
+from modules.application.password_hasher import PasswordHasher
+from modules.application.types import BaseWorker, PasswordHasherMetrics, Worker
 
 
 class ApplicationService:
@@ -28,3 +29,7 @@ class ApplicationService:
     @staticmethod
     def terminate_worker(*, worker_id: str) -> None:
         return WorkerManager.terminate_worker(worker_id=worker_id)
+
+    @staticmethod
+    def get_password_hasher_metrics() -> PasswordHasherMetrics:
+        return PasswordHasher.get_metrics()
@@ -1,9 +1,13 @@
+import base64
+import binascii
 from dataclasses import asdict, dataclass
 from typing import Any, Optional, Tuple
 
+from bson import json_util
+from bson.errors import BSONError
 from pymongo.cursor import Cursor
 
-from modules.application.common.types import PaginationParams, SortParams
+from modules.application.common.types import PaginationParams, SortDirection, SortParams
 
 
 @dataclass
@@ -18,14 +22,17 @@ class BaseModel:
 
     @staticmethod
     def calculate_pagination_values(
-        pagination_params: PaginationParams, total_count: int
-    ) -> Tuple[PaginationParams, int, int]:
+        pagination_params: PaginationParams, total_count: Optional[int]
+    ) -> Tuple[PaginationParams, int, Optional[int]]:
         page = pagination_params.page
         size = pagination_params.size
         offset = pagination_params.offset
 
         skip = (page - 1) * size + offset
 
+        if total_count is None:
+            return pagination_params, skip, None
+
         total_pages = (total_count + size - 1) // size if size > 0 else 0
 
         return pagination_params, skip, total_pages
@@ -40,3 +47,26 @@ class BaseModel:
                 ]
             )
         return cursor
+
+    @staticmethod
+    def encode_cursor(sort_params: SortParams, document: dict[str, Any]) -> str:
+        payload = json_util.dumps(
+            {"s": sort_params.sort_by, "v": document.get(sort_params.sort_by), "i": document["_id"]}
+        )
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def build_keyset_filter(sort_params: SortParams, cursor: str) -> dict[str, Any]:
+        try:
+            payload = json_util.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+            sort_by, last_value, last_id = payload["s"], payload["v"], payload["i"]
+        except (binascii.Error, BSONError, KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid cursor: {cursor}") from e
+
+        if sort_by != sort_params.sort_by:
+            raise ValueError(f"Cursor was issued for sort field {sort_by}, not {sort_params.sort_by}")
+
+        # The range on the sort field bounds the index scan, the $or only breaks ties on _id
+        if sort_params.sort_direction == SortDirection.DESC:
+            return {sort_by: {"$lte": last_value}, "$or": [{sort_by: {"$lt": last_value}}, {"_id": {"$lt": last_id}}]}
+        return {sort_by: {"$gte": last_value}, "$or": [{sort_by: {"$gt": last_value}}, {"_id": {"$gt": last_id}}]}
@@ -99,3 +99,17 @@ class WorkerAlreadyTerminatedError(AppError):
             http_status_code=400,
             message=f"Worker with id: {worker_id} has already been terminated. Verify the worker ID and try again.",
         )
+
+
+@dataclass(frozen=True)
+class PasswordHasherErrorCode:
+    UNAVAILABLE: str = "PASSWORD_HASHER_ERR_01"
+
+
+class PasswordHasherUnavailableError(AppError):
+    def __init__(self) -> None:
+        super().__init__(
+            code=PasswordHasherErrorCode.UNAVAILABLE,
+            http_status_code=503,
+            message="The server is busy verifying other passwords. Please try again shortly.",
+        )
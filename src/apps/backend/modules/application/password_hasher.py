@@ -0,0 +1,163 @@
+import atexit
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
+
+import bcrypt
+
+from modules.application.errors import PasswordHasherUnavailableError
+from modules.application.types import PasswordHasherMetrics
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+
+T = TypeVar("T")
+
+BCRYPT_ROUNDS = 10
+
+
+def _hash_secret(secret: str) -> Tuple[str, float, float]:
+    # Runs in a pool process; wall clock times are comparable with the submitting process, monotonic ones may not be
+    started_at = time.time()
+    hashed_secret = bcrypt.hashpw(secret.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
+    return hashed_secret, started_at, time.time() - started_at
+
+
+def _check_secret(secret: str, hashed_secret: str) -> Tuple[bool, float, float]:
+    started_at = time.time()
+    is_match = bcrypt.checkpw(secret.encode("utf-8"), hashed_secret.encode("utf-8"))
+    return is_match, started_at, time.time() - started_at
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a pool of separate processes, so hashing bursts do not hold the GIL of the request threads that
+    serve every other endpoint. Work beyond the configured queue depth is refused at once with a 503 instead of
+    waiting behind the backlog. Limits and metrics are per server process.
+    """
+
+    _executor: Optional[ProcessPoolExecutor] = None
+    _pool_size: Optional[int] = None
+    _lock = threading.Lock()
+    _in_flight_count = 0
+    _completed_count = 0
+    _rejected_count = 0
+    _queue_wait_seconds_total = 0.0
+    _queue_wait_seconds_max = 0.0
+    _hash_seconds_total = 0.0
+    _hash_seconds_max = 0.0
+
+    @classmethod
+    def hash_password(cls, *, password: str) -> str:
+        hashed_password: str = cls._run(_hash_secret, password)
+        return hashed_password
+
+    @classmethod
+    def hash_passwords(cls, *, passwords: List[str]) -> List[str]:
+        """
+        Hashes a batch across the pool, in order. At most pool_size of its hashes are in flight at a time, so a bulk
+        caller keeps every pool process busy without filling the queue that interactive requests are admitted to.
+        """
+        with ThreadPoolExecutor(max_workers=cls._get_pool_size()) as submitter:
+            return list(submitter.map(lambda password: cls.hash_password(password=password), passwords))
+
+    @classmethod
+    def compare_password(cls, *, password: str, hashed_password: str) -> bool:
+        is_match: bool = cls._run(_check_secret, password, hashed_password)
+        return is_match
+
+    @classmethod
+    def set_pool_size(cls, *, pool_size: int) -> None:
+        """
+        Overrides password_hasher.pool_size for this process, e.g. for a script that owns the machine. Only takes
+        effect before the first hash, when the pool is started.
+        """
+        cls._pool_size = pool_size
+
+    @classmethod
+    def get_metrics(cls) -> PasswordHasherMetrics:
+        with cls._lock:
+            return PasswordHasherMetrics(
+                pool_size=cls._get_pool_size(),
+                max_queue_depth=cls._get_max_queue_depth(),
+                in_flight_count=cls._in_flight_count,
+                completed_count=cls._completed_count,
+                rejected_count=cls._rejected_count,
+                queue_wait_seconds_total=cls._queue_wait_seconds_total,
+                queue_wait_seconds_max=cls._queue_wait_seconds_max,
+                hash_seconds_total=cls._hash_seconds_total,
+                hash_seconds_max=cls._hash_seconds_max,
+            )
+
+    @classmethod
+    def _run(cls, fn: Callable[..., Tuple[T, float, float]], *args: Any) -> T:
+        pool_size = cls._get_pool_size()
+        with cls._lock:
+            # Counting running work too keeps the limit exact without reaching into the executor's internal queue
+            if cls._in_flight_count >= pool_size + cls._get_max_queue_depth():
+                cls._rejected_count += 1
+                raise PasswordHasherUnavailableError()
+            cls._in_flight_count += 1
+            executor = cls._get_executor(pool_size)
+
+        submitted_at = time.time()
+        releases_slot = True
+        try:
+            future = executor.submit(fn, *args)
+            result, started_at, hash_seconds = future.result(timeout=cls._get_timeout_seconds())
+        except FutureTimeoutError:
+            # Queued work is dropped; work already running cannot be interrupted, so it keeps its slot until it ends
+            # and the queue depth still counts it
+            if not future.cancel():
+                releases_slot = False
+                future.add_done_callback(cls._release_slot)
+            raise PasswordHasherUnavailableError()
+        except BrokenProcessPool:
+            # A pool process died, which breaks the whole executor; the next call starts a fresh one
+            Logger.error(message="Password hasher pool broke, restarting it")
+            with cls._lock:
+                if cls._executor is executor:
+                    cls._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise PasswordHasherUnavailableError()
+        finally:
+            if releases_slot:
+                cls._release_slot()
+
+        queue_wait_seconds = max(0.0, started_at - submitted_at)
+        with cls._lock:
+            cls._completed_count += 1
+            cls._queue_wait_seconds_total += queue_wait_seconds
+            cls._queue_wait_seconds_max = max(cls._queue_wait_seconds_max, queue_wait_seconds)
+            cls._hash_seconds_total += hash_seconds
+            cls._hash_seconds_max = max(cls._hash_seconds_max, hash_seconds)
+        return result
+
+    @classmethod
+    def _release_slot(cls, _: Optional["Future[Any]"] = None) -> None:
+        with cls._lock:
+            cls._in_flight_count -= 1
+
+    @classmethod
+    def _get_executor(cls, pool_size: int) -> ProcessPoolExecutor:
+        # Created on first use, so each server process gets its own pool after any fork. Spawned rather than forked
+        # processes do not inherit locks held by other request threads at the time of the fork
+        if cls._executor is None:
+            cls._executor = ProcessPoolExecutor(max_workers=pool_size, mp_context=multiprocessing.get_context("spawn"))
+            atexit.register(cls._executor.shutdown, wait=False, cancel_futures=True)
+        return cls._executor
+
+    @classmethod
+    def _get_pool_size(cls) -> int:
+        return cls._pool_size or ConfigService[int].get_value(key="password_hasher.pool_size", default=2)
+
+    @staticmethod
+    def _get_max_queue_depth() -> int:
+        return ConfigService[int].get_value(key="password_hasher.max_queue_depth", default=32)
+
+    @staticmethod
+    def _get_timeout_seconds() -> int:
+        return ConfigService[int].get_value(key="password_hasher.timeout_seconds", default=30)
@@ -1,7 +1,9 @@
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections import Counter
+from typing import Optional, Tuple
 
-from pymongo import MongoClient
+from pymongo import MongoClient, monitoring
 from pymongo.collection import Collection
 from pymongo.server_api import ServerApi
 
@@ -9,8 +11,47 @@ from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 
 
+class ApplicationRepositoryCommandCounter(monitoring.CommandListener):
+    """Counts database commands sent by the client so tests can assert on round trips per operation."""
+
+    _IGNORED_COMMANDS = {"buildinfo", "endsessions", "hello", "ismaster", "ping", "saslcontinue", "saslstart"}
+
+    def __init__(self) -> None:
+        self._counts: Counter[Tuple[str, str]] = Counter()
+        self._lock = threading.Lock()
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        command_name = event.command_name.lower()
+        if command_name in self._IGNORED_COMMANDS:
+            return
+
+        collection_name = event.command.get(event.command_name)
+        with self._lock:
+            self._counts[(command_name, collection_name if isinstance(collection_name, str) else "")] += 1
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pass
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        pass
+
+    def count(self, *, collection_name: Optional[str] = None, command_name: Optional[str] = None) -> int:
+        with self._lock:
+            return sum(
+                count
+                for (counted_command_name, counted_collection_name), count in self._counts.items()
+                if (collection_name is None or counted_collection_name == collection_name)
+                and (command_name is None or counted_command_name == command_name.lower())
+            )
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
 class ApplicationRepositoryClient:
     _client: Optional[MongoClient] = None
+    command_counter = ApplicationRepositoryCommandCounter()
 
     @classmethod
     def get_client(cls) -> MongoClient:
@@ -28,8 +69,10 @@ class ApplicationRepositoryClient:
     @staticmethod
     def _create_client() -> MongoClient:
         connection_uri = ConfigService[str].get_value(key="mongodb.uri")
+        command_counting = ConfigService[bool].get_value(key="mongodb.command_counting", default=False)
+        event_listeners = [ApplicationRepositoryClient.command_counter] if command_counting else []
         Logger.info(message=f"connecting to database - {connection_uri}")
-        client = MongoClient(connection_uri, server_api=ServerApi("1"))
+        client = MongoClient(connection_uri, server_api=ServerApi("1"), event_listeners=event_listeners)
         Logger.info(message=f"connected to database - {connection_uri}")
 
         return client
@@ -57,3 +57,17 @@ class Worker:
     close_time: Optional[datetime]
     task_queue: str
     worker_type: str
+
+
+@dataclass(frozen=True)
+class PasswordHasherMetrics:
+    pool_size: int
+    max_queue_depth: int
+    in_flight_count: int
+    completed_count: int
+    rejected_count: int
+    # Time between submitting a hash and a pool process starting it, and time spent in bcrypt itself
+    queue_wait_seconds_total: float
+    queue_wait_seconds_max: float
+    hash_seconds_total: float
+    hash_seconds_max: float
@@ -3,8 +3,7 @@ import os
 from datetime import datetime, timedelta
 from typing import Any
 
-import bcrypt
-
+from modules.application.password_hasher import PasswordHasher
 from modules.authentication.internals.password_reset_token.store.password_reset_token_model import (
     PasswordResetTokenModel,
 )
@@ -16,11 +15,11 @@ class PasswordResetTokenUtil:
 
     @staticmethod
     def hash_password(password: str) -> str:
-        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode()
+        return PasswordHasher.hash_password(password=password)
 
     @staticmethod
     def compare_password(*, password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+        return PasswordHasher.compare_password(password=password, hashed_password=hashed_password)
 
     @staticmethod
     def generate_password_reset_token() -> str:
@@ -28,7 +27,7 @@ class PasswordResetTokenUtil:
 
     @staticmethod
     def hash_password_reset_token(reset_token: str) -> str:
-        return bcrypt.hashpw(reset_token.encode("utf-8"), bcrypt.gensalt(rounds=10)).decode()
+        return PasswordHasher.hash_password(password=reset_token)
 
     @staticmethod
     def get_token_expires_at() -> datetime:
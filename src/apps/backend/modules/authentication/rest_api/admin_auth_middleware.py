@@ -0,0 +1,27 @@
+import hmac
+from functools import wraps
+from typing import Any, Callable
+
+from flask import request
+
+from modules.authentication.errors import AuthorizationHeaderNotFoundError, UnauthorizedAccessError
+from modules.config.config_service import ConfigService
+
+ADMIN_API_KEY_HEADER = "X-Admin-Api-Key"
+
+
+def admin_auth_middleware(next_func: Callable) -> Callable:
+    @wraps(next_func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        api_key = request.headers.get(ADMIN_API_KEY_HEADER)
+        if not api_key:
+            raise AuthorizationHeaderNotFoundError(f"{ADMIN_API_KEY_HEADER} header is missing.")
+
+        # With no key configured every request is refused
+        configured_api_key = ConfigService[str].get_value(key="admin.api_key", default="")
+        if not configured_api_key or not hmac.compare_digest(api_key.encode(), configured_api_key.encode()):
+            raise UnauthorizedAccessError("Unauthorized access.")
+
+        return next_func(*args, **kwargs)
+
+    return wrapper
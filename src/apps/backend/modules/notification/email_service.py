@@ -1,7 +1,8 @@
 from modules.logger.logger import Logger
+from modules.notification.internals.sendgrid_email_params import EmailParams
 from modules.notification.internals.sendgrid_service import SendGridService
 from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
-from modules.notification.types import SendEmailParams
+from modules.notification.types import SendEmailParams, SendEmailsForAccountsParams, SendEmailsResult
 
 
 class EmailService:
@@ -20,3 +21,25 @@ class EmailService:
                 return
 
         return SendGridService.send_email(params)
+
+    @staticmethod
+    def send_emails_for_accounts(*, params: SendEmailsForAccountsParams) -> SendEmailsResult:
+        # A recipient without a deliverable address, e.g. a phone-only account, must not fail the whole batch
+        emails = [email for email in params.emails if EmailParams.is_email_valid(email.params.recipient.email)]
+        if not params.bypass_preferences:
+            preferences_by_account_id = (
+                AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_ids(
+                    list({email.account_id for email in emails})
+                )
+            )
+            emails = [email for email in emails if preferences_by_account_id[email.account_id].email_enabled]
+
+        failed_params = SendGridService.send_emails([email.params for email in emails]) if emails else []
+        failed_param_ids = {id(params_item) for params_item in failed_params}
+        failed_emails = [email for email in emails if id(email.params) in failed_param_ids]
+
+        return SendEmailsResult(
+            sent_count=len(emails) - len(failed_emails),
+            skipped_count=len(params.emails) - len(emails),
+            failed_emails=failed_emails,
+        )
@@ -16,15 +16,6 @@ class ValidationError(AppError):
         self.http_code = 400
 
 
-class AccountNotificationPreferencesNotFoundError(AppError):
-    def __init__(self, account_id: str) -> None:
-        super().__init__(
-            code=NotificationErrorCode.PREFERENCES_NOT_FOUND,
-            http_status_code=404,
-            message=f"Notification preferences not found for account: {account_id}. Please create preferences first.",
-        )
-
-
 class ServiceError(AppError):
     def __init__(self, err: Exception) -> None:
         super().__init__(message=err.args[2], code=NotificationErrorCode.SERVICE_ERROR)
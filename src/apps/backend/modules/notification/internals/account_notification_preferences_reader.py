@@ -1,8 +1,9 @@
+from typing import Dict, List
+
 from modules.notification.internals.store.account_notification_preferences_repository import (
     AccountNotificationPreferencesRepository,
 )
 from modules.notification.internals.account_notification_preferences_util import AccountNotificationPreferenceUtil
-from modules.notification.errors import AccountNotificationPreferencesNotFoundError
 from modules.notification.types import AccountNotificationPreferences
 
 
@@ -13,9 +14,29 @@ class AccountNotificationPreferenceReader:
             {"account_id": account_id, "active": True}
         )
 
+        # Preferences are only stored once changed, so an account without any has the defaults
         if notification_preferences is None:
-            raise AccountNotificationPreferencesNotFoundError(account_id=account_id)
+            return AccountNotificationPreferences(account_id=account_id)
 
         return AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
             notification_preferences
         )
+
+    @staticmethod
+    def get_account_notification_preferences_by_account_ids(
+        account_ids: List[str],
+    ) -> Dict[str, AccountNotificationPreferences]:
+        """
+        Reads the preferences of many accounts in one query. Accounts without stored preferences get the defaults.
+        """
+        preferences_by_account_id = {
+            account_id: AccountNotificationPreferences(account_id=account_id) for account_id in account_ids
+        }
+        for notification_preferences in AccountNotificationPreferencesRepository.collection().find(
+            {"account_id": {"$in": account_ids}, "active": True}
+        ):
+            preferences = AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
+                notification_preferences
+            )
+            preferences_by_account_id[preferences.account_id] = preferences
+        return preferences_by_account_id
@@ -1,16 +1,14 @@
+from dataclasses import fields
 from datetime import datetime
 from typing import Any
+
 from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
-from modules.notification.internals.store.account_notification_preferences_model import (
-    AccountNotificationPreferencesModel,
-)
 from modules.notification.internals.store.account_notification_preferences_repository import (
     AccountNotificationPreferencesRepository,
 )
-from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
 from modules.notification.internals.account_notification_preferences_util import AccountNotificationPreferenceUtil
-from modules.notification.errors import AccountNotificationPreferencesNotFoundError
 from modules.notification.types import (
     CreateOrUpdateAccountNotificationPreferencesParams,
     AccountNotificationPreferences,
@@ -19,53 +17,37 @@ from modules.notification.types import (
 
 class AccountNotificationPreferenceWriter:
     @staticmethod
-    def _create_account_notification_preferences(
-        account_id: str, preferences: CreateOrUpdateAccountNotificationPreferencesParams
-    ) -> AccountNotificationPreferences:
-        preferences_model = AccountNotificationPreferencesModel(
-            account_id=account_id,
-            id=None,
-            email_enabled=preferences.email_enabled if preferences.email_enabled is not None else True,
-            push_enabled=preferences.push_enabled if preferences.push_enabled is not None else True,
-            sms_enabled=preferences.sms_enabled if preferences.sms_enabled is not None else True,
-        ).to_bson()
-
-        query = AccountNotificationPreferencesRepository.collection().insert_one(preferences_model)
-        created_preferences = AccountNotificationPreferencesRepository.collection().find_one({"_id": query.inserted_id})
-
-        return AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
-            created_preferences
-        )
-
-    @staticmethod
-    def _update_account_notification_preferences(
+    def create_or_update_account_notification_preferences(
         account_id: str, preferences: CreateOrUpdateAccountNotificationPreferencesParams
     ) -> AccountNotificationPreferences:
-        update_data: dict[str, Any] = {"updated_at": datetime.now()}
+        """
+        Stores the given preferences in one upsert. Accounts have no stored preferences until they first change
+        one, so a new document takes the defaults for every preference not given.
+        """
+        now = datetime.now()
+        update_data: dict[str, Any] = {"updated_at": now}
+        insert_data: dict[str, Any] = {"created_at": now}
+        for preference_field in fields(preferences):
+            value = getattr(preferences, preference_field.name)
+            if value is not None:
+                update_data[preference_field.name] = value
+            else:
+                insert_data[preference_field.name] = True
+
+        def upsert_preferences() -> Any:
+            return AccountNotificationPreferencesRepository.collection().find_one_and_update(
+                {"account_id": account_id, "active": True},
+                {"$set": update_data, "$setOnInsert": insert_data},
+                upsert=True,
+                return_document=ReturnDocument.AFTER,
+            )
 
-        if preferences.email_enabled is not None:
-            update_data["email_enabled"] = preferences.email_enabled
-
-        if preferences.push_enabled is not None:
-            update_data["push_enabled"] = preferences.push_enabled
-
-        if preferences.sms_enabled is not None:
-            update_data["sms_enabled"] = preferences.sms_enabled
-
-        updated_preferences = AccountNotificationPreferencesRepository.collection().find_one_and_update(
-            {"account_id": account_id, "active": True}, {"$set": update_data}, return_document=ReturnDocument.AFTER
-        )
+        try:
+            updated_preferences = upsert_preferences()
+        except DuplicateKeyError:
+            # A concurrent first write inserted the document between this one's match and insert; it now matches
+            updated_preferences = upsert_preferences()
 
         return AccountNotificationPreferenceUtil.convert_account_notification_preferences_bson_to_account_notification_preferences(
             updated_preferences
         )
-
-    @staticmethod
-    def create_or_update_account_notification_preferences(
-        account_id: str, preferences: CreateOrUpdateAccountNotificationPreferencesParams
-    ) -> AccountNotificationPreferences:
-        try:
-            AccountNotificationPreferenceReader.get_account_notification_preferences_by_account_id(account_id)
-            return AccountNotificationPreferenceWriter._update_account_notification_preferences(account_id, preferences)
-        except AccountNotificationPreferencesNotFoundError:
-            return AccountNotificationPreferenceWriter._create_account_notification_preferences(account_id, preferences)
@@ -1,13 +1,18 @@
-from typing import Optional
+from itertools import groupby
+from typing import List, Optional
 
 import sendgrid
-from sendgrid.helpers.mail import From, Mail, TemplateId, To
+from sendgrid.helpers.mail import From, Mail, Personalization, TemplateId, To
 
 from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
 from modules.notification.errors import ServiceError
 from modules.notification.internals.sendgrid_email_params import EmailParams
 from modules.notification.types import SendEmailParams
 
+# SendGrid accepts at most this many personalizations in one mail send request
+MAX_PERSONALIZATIONS_PER_REQUEST = 1000
+
 
 class SendGridService:
     __client: Optional[sendgrid.SendGridAPIClient] = None
@@ -27,6 +32,42 @@ class SendGridService:
         except sendgrid.SendGridException as err:
             raise ServiceError(err)
 
+    @staticmethod
+    def send_emails(params: List[SendEmailParams]) -> List[SendEmailParams]:
+        """
+        Sends emails sharing a sender and template as personalizations of one request, instead of a request each.
+        Returns the emails that could not be sent: a failed request is logged and its emails returned rather than
+        raised, so callers can still settle the requests that went through and retry only the rest.
+        """
+        for params_item in params:
+            EmailParams.validate(params_item)
+
+        def group_key(params_item: SendEmailParams) -> tuple[str, str, str]:
+            return params_item.sender.email, params_item.sender.name, params_item.template_id
+
+        failed_params: List[SendEmailParams] = []
+        for _, grouped_params in groupby(sorted(params, key=group_key), key=group_key):
+            group = list(grouped_params)
+            for start in range(0, len(group), MAX_PERSONALIZATIONS_PER_REQUEST):
+                chunk = group[start : start + MAX_PERSONALIZATIONS_PER_REQUEST]
+                message = Mail(from_email=From(chunk[0].sender.email, chunk[0].sender.name))
+                message.template_id = TemplateId(chunk[0].template_id)
+                for params_item in chunk:
+                    personalization = Personalization()
+                    personalization.add_to(To(params_item.recipient.email))
+                    personalization.dynamic_template_data = params_item.template_data
+                    message.add_personalization(personalization)
+
+                try:
+                    SendGridService.get_client().send(message)
+                except Exception as err:
+                    Logger.error(
+                        message=f"Sending {len(chunk)} email(s) using template {chunk[0].template_id} failed: {err}"
+                    )
+                    failed_params.extend(chunk)
+
+        return failed_params
+
     @staticmethod
     def get_client() -> sendgrid.SendGridAPIClient:
         if not SendGridService.__client:
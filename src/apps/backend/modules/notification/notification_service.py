@@ -4,6 +4,8 @@ from modules.notification.internals.account_notification_preferences_writer impo
 from modules.notification.internals.account_notification_preferences_reader import AccountNotificationPreferenceReader
 from modules.notification.types import (
     SendEmailParams,
+    SendEmailsForAccountsParams,
+    SendEmailsResult,
     SendSMSParams,
     CreateOrUpdateAccountNotificationPreferencesParams,
     AccountNotificationPreferences,
@@ -18,6 +20,10 @@ class NotificationService:
             account_id=account_id, bypass_preferences=bypass_preferences, params=params
         )
 
+    @staticmethod
+    def send_emails_for_accounts(*, params: SendEmailsForAccountsParams) -> SendEmailsResult:
+        return EmailService.send_emails_for_accounts(params=params)
+
     @staticmethod
     def send_sms_for_account(*, account_id: str, bypass_preferences: bool = False, params: SendSMSParams) -> None:
         return SMSService.send_sms_for_account(
@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 from modules.account.types import PhoneNumber
 
@@ -38,6 +38,26 @@ class SendEmailParams:
     template_data: Dict[str, Any] | None = None
 
 
+@dataclass(frozen=True)
+class AccountEmail:
+    account_id: str
+    params: SendEmailParams
+
+
+@dataclass(frozen=True)
+class SendEmailsForAccountsParams:
+    emails: List[AccountEmail]
+    bypass_preferences: bool = False
+
+
+@dataclass(frozen=True)
+class SendEmailsResult:
+    sent_count: int
+    skipped_count: int
+    # The same AccountEmail objects that were passed in, for emails whose send request failed
+    failed_emails: List[AccountEmail] = field(default_factory=list)
+
+
 @dataclass(frozen=True)
 class SendSMSParams:
     message_body: str
@@ -46,7 +66,6 @@ class SendSMSParams:
 
 @dataclass(frozen=True)
 class NotificationErrorCode:
-    PREFERENCES_NOT_FOUND = "NOTIFICATION_ERR_01"
     VALIDATION_ERROR = "NOTIFICATION_ERR_02"
     SERVICE_ERROR = "NOTIFICATION_ERR_03"
 
@@ -0,0 +1,62 @@
+from modules.application.common.types import SortDirection, SortParams
+
+# Newest tasks first, ties broken by _id so keyset cursors stay stable
+DEFAULT_TASK_SORT_PARAMS = SortParams(sort_by="created_at", sort_direction=SortDirection.DESC)
+
+# Lists filtered by a due date range default to soonest due first, so they walk an (account_id[, status], due_at, _id)
+# index in order instead of sorting the range by created_at in memory
+DUE_FILTERED_TASK_SORT_PARAMS = SortParams(sort_by="due_at", sort_direction=SortDirection.ASC)
+
+# Fields the task list can be sorted by; each has an (account_id, <field>, _id) index so sorting never happens in memory
+TASK_SORT_FIELDS = ("created_at", "updated_at", "title", "position")
+
+# Upper bound on the number of ids resolved by one multi-get request
+MAX_TASK_IDS_PER_REQUEST = 100
+
+# Delta sync walks changes oldest first so clients can apply them in order
+TASK_CHANGES_SORT_PARAMS = SortParams(sort_by="updated_at", sort_direction=SortDirection.ASC)
+
+# Search results are ordered by text relevance, ties broken by _id
+TASK_SEARCH_SORT_PARAMS = SortParams(sort_by="score", sort_direction=SortDirection.DESC)
+
+# Upper bound on the number of operations accepted by a single batch request
+MAX_TASK_BATCH_OPERATIONS = 500
+
+# Fields a client may request through sparse fieldsets, e.g. `?fields=id,title`
+TASK_FIELDS = (
+    "id",
+    "account_id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "due_at",
+    "remind_at",
+    "position",
+    "attachment_count",
+)
+
+# Documents fetched per round trip while streaming an export, and bytes buffered before each chunk is sent
+TASK_EXPORT_BATCH_SIZE = 1000
+TASK_EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Row errors kept per import; further failures are only counted so a bad file cannot grow the result without bound
+MAX_TASK_IMPORT_ERRORS = 100
+
+# Most recently updated tasks listed on the task summary
+TASK_SUMMARY_RECENT_TASKS_LIMIT = 5
+
+# Ranks longer than this, left behind by many moves into the same gap, trigger a rebalance of the account's tasks
+MAX_TASK_POSITION_LENGTH = 32
+
+# Tasks rewritten per round trip while rebalancing an account's ranks
+TASK_POSITION_REBALANCE_BATCH_SIZE = 1000
+
+# Bytes read from the request per GridFS chunk on upload, and sent per response chunk on download
+TASK_ATTACHMENT_CHUNK_SIZE = 255 * 1024
+
+# Events kept per activity bucket; an account's busy hour spills into further buckets of the same hour
+TASK_ACTIVITY_BUCKET_SIZE = 200
+
+# The single checkpoint document of the archival job; its cutoff is also the oldest point delta sync can start from
+TASK_ARCHIVAL_CHECKPOINT_ID = "task_archival"
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from modules.application.errors import AppError
 from modules.task.types import TaskErrorCode
 
@@ -12,3 +14,40 @@ class TaskNotFoundError(AppError):
 class TaskBadRequestError(AppError):
     def __init__(self, message: str) -> None:
         super().__init__(code=TaskErrorCode.BAD_REQUEST, http_status_code=400, message=message)
+
+
+class TaskImportNotFoundError(AppError):
+    def __init__(self, import_id: str) -> None:
+        super().__init__(
+            code=TaskErrorCode.IMPORT_NOT_FOUND,
+            http_status_code=404,
+            message=f"Task import with id {import_id} not found.",
+        )
+
+
+class TaskAttachmentNotFoundError(AppError):
+    def __init__(self, attachment_id: str) -> None:
+        super().__init__(
+            code=TaskErrorCode.ATTACHMENT_NOT_FOUND,
+            http_status_code=404,
+            message=f"Task attachment with id {attachment_id} not found.",
+        )
+
+
+class TaskAttachmentTooLargeError(AppError):
+    def __init__(self, max_size_bytes: int) -> None:
+        super().__init__(
+            code=TaskErrorCode.ATTACHMENT_TOO_LARGE,
+            http_status_code=413,
+            message=f"Task attachments can be at most {max_size_bytes} bytes.",
+        )
+
+
+class TaskChangesExpiredError(AppError):
+    def __init__(self, horizon: datetime) -> None:
+        super().__init__(
+            code=TaskErrorCode.CHANGES_EXPIRED,
+            http_status_code=410,
+            message=f"Task changes before {horizon.isoformat()} are no longer available. "
+            "Fetch the full task list and sync from then.",
+        )
@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, List, Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class TaskActivityBucketModel(BaseModel):
+    # Up to TASK_ACTIVITY_BUCKET_SIZE events of one account within the hour starting at `hour`, oldest first
+    account_id: str
+    hour: datetime
+    created_at: Optional[datetime] = field(default_factory=datetime.now)
+    event_count: int = 0
+    events: List[dict[str, Any]] = field(default_factory=list)
+    id: Optional[ObjectId | str] = None
+    updated_at: Optional[datetime] = field(default_factory=datetime.now)
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "TaskActivityBucketModel":
+        return cls(
+            account_id=bson_data.get("account_id", ""),
+            created_at=bson_data.get("created_at"),
+            event_count=bson_data.get("event_count", 0),
+            events=bson_data.get("events", []),
+            hour=bson_data["hour"],
+            id=bson_data.get("_id"),
+            updated_at=bson_data.get("updated_at"),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "task_activity_buckets"
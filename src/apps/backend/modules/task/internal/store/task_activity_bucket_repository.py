@@ -0,0 +1,39 @@
+from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
+
+from modules.application.repository import ApplicationRepository
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.task.internal.store.task_activity_bucket_model import TaskActivityBucketModel
+
+TASK_ACTIVITY_TTL_INDEX_NAME = "updated_at_ttl_index"
+
+
+class TaskActivityBucketRepository(ApplicationRepository):
+    collection_name = TaskActivityBucketModel.get_collection_name()
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        # Finds the open bucket of the current hour when recording, and walks buckets newest first for history
+        collection.create_index([("account_id", 1), ("hour", 1), ("_id", 1)], name="account_id_hour_index")
+
+        # A bucket expires once its latest event is older than the retention period
+        retention_days = ConfigService[int].get_value(key="tasks.activity.retention_days", default=90)
+        expire_after_seconds = retention_days * 24 * 3600
+        try:
+            collection.create_index(
+                "updated_at", name=TASK_ACTIVITY_TTL_INDEX_NAME, expireAfterSeconds=expire_after_seconds
+            )
+        except OperationFailure as e:
+            # The index exists with another retention period; collMod changes it without rebuilding the index
+            if e.code == 85:
+                collection.database.command(
+                    {
+                        "collMod": cls.collection_name,
+                        "index": {"name": TASK_ACTIVITY_TTL_INDEX_NAME, "expireAfterSeconds": expire_after_seconds},
+                    }
+                )
+                Logger.info(message=f"Task activity retention changed to {retention_days} day(s)")
+            else:
+                Logger.error(message=f"OperationFailure occurred for collection task_activity_buckets: {e.details}")
+        return True
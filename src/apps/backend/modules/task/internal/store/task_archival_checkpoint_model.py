@@ -0,0 +1,39 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class TaskArchivalCheckpointModel(BaseModel):
+    """
+    Progress of the current archival run. A run that is interrupted keeps its cutoff and position,
+    so the next run resumes from them instead of scanning from the start.
+    """
+
+    cutoff: datetime
+    archived_count: int = 0
+    completed_at: Optional[datetime] = None
+    id: Optional[ObjectId | str] = None
+    last_task_id: Optional[ObjectId] = None
+    last_updated_at: Optional[datetime] = None
+    started_at: Optional[datetime] = field(default_factory=datetime.now)
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "TaskArchivalCheckpointModel":
+        return cls(
+            archived_count=bson_data.get("archived_count", 0),
+            completed_at=bson_data.get("completed_at"),
+            cutoff=bson_data["cutoff"],
+            id=bson_data.get("_id"),
+            last_task_id=bson_data.get("last_task_id"),
+            last_updated_at=bson_data.get("last_updated_at"),
+            started_at=bson_data.get("started_at"),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "task_archival_checkpoints"
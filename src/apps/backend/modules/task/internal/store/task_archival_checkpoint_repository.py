@@ -0,0 +1,6 @@
+from modules.application.repository import ApplicationRepository
+from modules.task.internal.store.task_archival_checkpoint_model import TaskArchivalCheckpointModel
+
+
+class TaskArchivalCheckpointRepository(ApplicationRepository):
+    collection_name = TaskArchivalCheckpointModel.get_collection_name()
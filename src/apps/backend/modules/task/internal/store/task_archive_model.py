@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from modules.task.internal.store.task_model import TaskModel
+
+
+@dataclass
+class TaskArchiveModel(TaskModel):
+    archived_at: Optional[datetime] = field(default_factory=datetime.now)
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "TaskArchiveModel":
+        return cls(
+            account_id=bson_data.get("account_id", ""),
+            active=bson_data.get("active", False),
+            archived_at=bson_data.get("archived_at"),
+            created_at=bson_data.get("created_at"),
+            description=bson_data.get("description", ""),
+            due_at=bson_data.get("due_at"),
+            id=bson_data.get("_id"),
+            position=bson_data.get("position", ""),
+            priority=bson_data.get("priority", "medium"),
+            status=bson_data.get("status", "open"),
+            title=bson_data.get("title", ""),
+            updated_at=bson_data.get("updated_at"),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "tasks_archive"
@@ -0,0 +1,13 @@
+from pymongo.collection import Collection
+
+from modules.application.repository import ApplicationRepository
+from modules.task.internal.store.task_archive_model import TaskArchiveModel
+
+
+class TaskArchiveRepository(ApplicationRepository):
+    collection_name = TaskArchiveModel.get_collection_name()
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        collection.create_index([("account_id", 1), ("_id", 1)], name="account_id_index")
+        return True
@@ -0,0 +1,36 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class TaskAttachmentModel(BaseModel):
+    account_id: str
+    content_type: str
+    file_id: ObjectId
+    filename: str
+    size: int
+    task_id: str
+    created_at: Optional[datetime] = field(default_factory=datetime.now)
+    id: Optional[ObjectId | str] = None
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "TaskAttachmentModel":
+        return cls(
+            account_id=bson_data.get("account_id", ""),
+            content_type=bson_data.get("content_type", "application/octet-stream"),
+            created_at=bson_data.get("created_at"),
+            file_id=bson_data["file_id"],
+            filename=bson_data.get("filename", ""),
+            id=bson_data.get("_id"),
+            size=bson_data.get("size", 0),
+            task_id=bson_data.get("task_id", ""),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "task_attachments"
@@ -0,0 +1,22 @@
+from gridfs import GridFSBucket
+from pymongo.collection import Collection
+
+from modules.application.repository import ApplicationRepository
+from modules.task.internal.store.task_attachment_model import TaskAttachmentModel
+
+
+class TaskAttachmentRepository(ApplicationRepository):
+    collection_name = TaskAttachmentModel.get_collection_name()
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        # Lists one task's attachments in upload order, and its prefix lets cleanup walk an account's attachments
+        collection.create_index(
+            [("account_id", 1), ("task_id", 1), ("created_at", 1)], name="account_id_task_id_created_at_index"
+        )
+        return True
+
+    @classmethod
+    def file_bucket(cls) -> GridFSBucket:
+        # File contents, split into chunks by GridFS; the documents of this repository hold their metadata
+        return GridFSBucket(cls.collection().database, bucket_name="task_attachment_files")
@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class TaskCounterModel(BaseModel):
+    account_id: str
+    active_task_count: int = 0
+    id: Optional[ObjectId | str] = None
+    created_at: Optional[datetime] = field(default_factory=datetime.now)
+    # Cached task summary, tagged with the version it was computed at and dropped by every task write
+    summary: Optional[Dict[str, Any]] = None
+    updated_at: Optional[datetime] = field(default_factory=datetime.now)
+    version: int = 0
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "TaskCounterModel":
+        return cls(
+            account_id=bson_data.get("account_id", ""),
+            active_task_count=bson_data.get("active_task_count", 0),
+            created_at=bson_data.get("created_at"),
+            id=bson_data.get("_id"),
+            summary=bson_data.get("summary"),
+            updated_at=bson_data.get("updated_at"),
+            version=bson_data.get("version", 0),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "task_counters"
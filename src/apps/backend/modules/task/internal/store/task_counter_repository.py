@@ -0,0 +1,45 @@
+from pymongo.collection import Collection
+from pymongo.errors import OperationFailure
+
+from modules.application.repository import ApplicationRepository
+from modules.logger.logger import Logger
+from modules.task.internal.store.task_counter_model import TaskCounterModel
+
+TASK_COUNTER_VALIDATION_SCHEMA = {
+    "$jsonSchema": {
+        "bsonType": "object",
+        "required": ["account_id", "active_task_count"],
+        "properties": {
+            "account_id": {"bsonType": "string"},
+            "active_task_count": {"bsonType": ["int", "long"]},
+            "created_at": {"bsonType": "date"},
+            "updated_at": {"bsonType": "date"},
+            "repaired_at": {"bsonType": "date"},
+            "version": {"bsonType": ["int", "long"]},
+            "summary": {"bsonType": "object"},
+        },
+    }
+}
+
+
+class TaskCounterRepository(ApplicationRepository):
+    collection_name = TaskCounterModel.get_collection_name()
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        collection.create_index("account_id", unique=True, name="account_id_unique")
+
+        add_validation_command = {
+            "collMod": cls.collection_name,
+            "validator": TASK_COUNTER_VALIDATION_SCHEMA,
+            "validationLevel": "strict",
+        }
+
+        try:
+            collection.database.command(add_validation_command)
+        except OperationFailure as e:
+            if e.code == 26:
+                collection.database.create_collection(cls.collection_name, validator=TASK_COUNTER_VALIDATION_SCHEMA)
+            else:
+                Logger.error(message=f"OperationFailure occurred for collection task_counters: {e.details}")
+        return True
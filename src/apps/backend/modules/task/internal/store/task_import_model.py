@@ -0,0 +1,48 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, List, Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class TaskImportModel(BaseModel):
+    account_id: str
+    file_format: str
+    status: str
+    completed_at: Optional[datetime] = None
+    created_at: Optional[datetime] = field(default_factory=datetime.now)
+    errors: List[dict[str, Any]] = field(default_factory=list)
+    failed_count: int = 0
+    failure_reason: Optional[str] = None
+    file_id: Optional[ObjectId] = None
+    id: Optional[ObjectId | str] = None
+    imported_count: int = 0
+    processed_rows: int = 0
+    updated_at: Optional[datetime] = field(default_factory=datetime.now)
+    worker_id: Optional[str] = None
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "TaskImportModel":
+        return cls(
+            account_id=bson_data.get("account_id", ""),
+            completed_at=bson_data.get("completed_at"),
+            created_at=bson_data.get("created_at"),
+            errors=bson_data.get("errors", []),
+            failed_count=bson_data.get("failed_count", 0),
+            failure_reason=bson_data.get("failure_reason"),
+            file_format=bson_data.get("file_format", ""),
+            file_id=bson_data.get("file_id"),
+            id=bson_data.get("_id"),
+            imported_count=bson_data.get("imported_count", 0),
+            processed_rows=bson_data.get("processed_rows", 0),
+            status=bson_data.get("status", ""),
+            updated_at=bson_data.get("updated_at"),
+            worker_id=bson_data.get("worker_id"),
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "task_imports"
@@ -0,0 +1,19 @@
+from gridfs import GridFSBucket
+from pymongo.collection import Collection
+
+from modules.application.repository import ApplicationRepository
+from modules.task.internal.store.task_import_model import TaskImportModel
+
+
+class TaskImportRepository(ApplicationRepository):
+    collection_name = TaskImportModel.get_collection_name()
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        collection.create_index([("account_id", 1), ("_id", 1)], name="account_id_index")
+        return True
+
+    @classmethod
+    def file_bucket(cls) -> GridFSBucket:
+        # Uploads too large to import within the request are staged here until the import worker reads them
+        return GridFSBucket(cls.collection().database, bucket_name=cls.collection_name)
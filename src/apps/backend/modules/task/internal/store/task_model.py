@@ -1,10 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
 from bson import ObjectId
 
 from modules.application.base_model import BaseModel
+from modules.task.internal.task_position_util import TaskPositionUtil
 
 
 @dataclass
@@ -13,18 +14,30 @@ class TaskModel(BaseModel):
     description: str
     title: str
     active: bool = True
-    created_at: Optional[datetime] = datetime.now()
+    attachment_count: int = 0
+    created_at: Optional[datetime] = field(default_factory=datetime.now)
+    due_at: Optional[datetime] = None
     id: Optional[ObjectId | str] = None
-    updated_at: Optional[datetime] = datetime.now()
+    position: str = field(default_factory=lambda: TaskPositionUtil.get_position_for_time(datetime.now()))
+    priority: str = "medium"
+    remind_at: Optional[datetime] = None
+    status: str = "open"
+    updated_at: Optional[datetime] = field(default_factory=datetime.now)
 
     @classmethod
     def from_bson(cls, bson_data: dict) -> "TaskModel":
         return cls(
             account_id=bson_data.get("account_id", ""),
             active=bson_data.get("active", True),
+            attachment_count=bson_data.get("attachment_count", 0),
             created_at=bson_data.get("created_at"),
             description=bson_data.get("description", ""),
+            due_at=bson_data.get("due_at"),
             id=bson_data.get("_id"),
+            position=bson_data.get("position", ""),
+            priority=bson_data.get("priority", "medium"),
+            remind_at=bson_data.get("remind_at"),
+            status=bson_data.get("status", "open"),
             title=bson_data.get("title", ""),
             updated_at=bson_data.get("updated_at"),
         )
@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from bson import ObjectId
+
+from modules.application.base_model import BaseModel
+
+
+@dataclass
+class TaskReminderModel(BaseModel):
+    # A reminder shares its task's _id, so each task has at most one pending reminder
+    account_id: str
+    remind_at: datetime
+    claim_token: Optional[str] = None
+    created_at: Optional[datetime] = field(default_factory=datetime.now)
+    id: Optional[ObjectId | str] = None
+
+    @classmethod
+    def from_bson(cls, bson_data: dict) -> "TaskReminderModel":
+        return cls(
+            account_id=bson_data.get("account_id", ""),
+            claim_token=bson_data.get("claim_token"),
+            created_at=bson_data.get("created_at"),
+            id=bson_data.get("_id"),
+            remind_at=bson_data["remind_at"],
+        )
+
+    @staticmethod
+    def get_collection_name() -> str:
+        return "task_reminders"
@@ -0,0 +1,14 @@
+from pymongo.collection import Collection
+
+from modules.application.repository import ApplicationRepository
+from modules.task.internal.store.task_reminder_model import TaskReminderModel
+
+
+class TaskReminderRepository(ApplicationRepository):
+    collection_name = TaskReminderModel.get_collection_name()
+
+    @classmethod
+    def on_init_collection(cls, collection: Collection) -> bool:
+        # Only pending reminders live here, so the due ones are always a short range at the head of this index
+        collection.create_index([("remind_at", 1), ("_id", 1)], name="remind_at_index")
+        return True
@@ -13,7 +13,13 @@ TASK_VALIDATION_SCHEMA = {
             "account_id": {"bsonType": "string"},
             "description": {"bsonType": "string"},
             "title": {"bsonType": "string"},
+            "status": {"enum": ["open", "done"]},
+            "position": {"bsonType": "string"},
+            "priority": {"enum": ["low", "medium", "high"]},
+            "due_at": {"bsonType": ["date", "null"]},
+            "remind_at": {"bsonType": ["date", "null"]},
             "active": {"bsonType": "bool"},
+            "attachment_count": {"bsonType": "int"},
             "created_at": {"bsonType": "date"},
             "updated_at": {"bsonType": "date"},
         },
@@ -29,6 +35,58 @@ class TaskRepository(ApplicationRepository):
         collection.create_index(
             [("active", 1), ("account_id", 1)], name="active_account_id_index", partialFilterExpression={"active": True}
         )
+        collection.create_index(
+            [("account_id", 1), ("created_at", 1), ("_id", 1)],
+            name="active_account_id_created_at_index",
+            partialFilterExpression={"active": True},
+        )
+        collection.create_index(
+            [("account_id", 1), ("title", 1), ("_id", 1)],
+            name="active_account_id_title_index",
+            partialFilterExpression={"active": True},
+        )
+        collection.create_index(
+            [("account_id", 1), ("position", 1), ("_id", 1)],
+            name="active_account_id_position_index",
+            partialFilterExpression={"active": True},
+        )
+        # Filtered lists: equality on status or priority followed by the default created_at order, and due date
+        # ranges with or without a status, which are listed in due_at order (DUE_FILTERED_TASK_SORT_PARAMS) so the
+        # range scan already returns them sorted. Legacy tasks get status and priority from
+        # scripts/backfill_task_fields.py, since a document without them cannot match these filters
+        collection.create_index(
+            [("account_id", 1), ("status", 1), ("created_at", 1), ("_id", 1)],
+            name="active_account_id_status_created_at_index",
+            partialFilterExpression={"active": True},
+        )
+        collection.create_index(
+            [("account_id", 1), ("priority", 1), ("created_at", 1), ("_id", 1)],
+            name="active_account_id_priority_created_at_index",
+            partialFilterExpression={"active": True},
+        )
+        collection.create_index(
+            [("account_id", 1), ("status", 1), ("due_at", 1), ("_id", 1)],
+            name="active_account_id_status_due_at_index",
+            partialFilterExpression={"active": True},
+        )
+        collection.create_index(
+            [("account_id", 1), ("due_at", 1), ("_id", 1)],
+            name="active_account_id_due_at_index",
+            partialFilterExpression={"active": True},
+        )
+        # Not partial, delta sync has to see soft-deleted tasks to report them as tombstones. It also backs the
+        # updated_at sort of the task list, so no partial twin with the same keys is needed
+        collection.create_index([("account_id", 1), ("updated_at", 1), ("_id", 1)], name="account_id_updated_at_index")
+        collection.create_index(
+            [("updated_at", 1), ("_id", 1)], name="inactive_updated_at_index", partialFilterExpression={"active": False}
+        )
+        # The account_id prefix keeps each search inside one account's slice of the text index
+        collection.create_index(
+            [("account_id", 1), ("title", "text"), ("description", "text")],
+            name="active_account_id_text_index",
+            partialFilterExpression={"active": True},
+            weights={"title": 3, "description": 1},
+        )
 
         add_validation_command = {
             "collMod": cls.collection_name,
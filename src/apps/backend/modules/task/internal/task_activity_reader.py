@@ -0,0 +1,80 @@
+import base64
+import binascii
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import json_util
+from bson.errors import BSONError
+
+from modules.application.common.types import CursorPaginationResult
+from modules.task.errors import TaskBadRequestError
+from modules.task.internal.store.task_activity_bucket_repository import TaskActivityBucketRepository
+from modules.task.types import GetTaskActivityParams, TaskActivityAction, TaskActivityEvent
+
+
+class TaskActivityReader:
+    @staticmethod
+    def get_task_activity(*, params: GetTaskActivityParams) -> CursorPaginationResult[TaskActivityEvent]:
+        """
+        Lists the account's events newest first, walking buckets in (hour, _id) order from the cursor. The cursor
+        also records how many of its bucket's events are still to be read; counted from the oldest event, it stays
+        valid while new events are appended to that bucket.
+        """
+        size = params.cursor_pagination_params.size
+        filter_query: Dict[str, Any] = {"account_id": params.account_id}
+        cursor_bucket_id, cursor_event_count = None, 0
+        if params.cursor_pagination_params.cursor:
+            cursor_hour, cursor_bucket_id, cursor_event_count = TaskActivityReader._decode_cursor(
+                params.cursor_pagination_params.cursor
+            )
+            filter_query.update(
+                {
+                    "hour": {"$lte": cursor_hour},
+                    "$or": [{"hour": {"$lt": cursor_hour}}, {"_id": {"$lte": cursor_bucket_id}}],
+                }
+            )
+
+        events_bson: List[Dict[str, Any]] = []
+        next_cursor: Optional[str] = None
+        with TaskActivityBucketRepository.collection().find(filter_query).sort([("hour", -1), ("_id", -1)]) as buckets:
+            for bucket_bson in buckets:
+                bucket_events = bucket_bson.get("events", [])
+                unread_count = cursor_event_count if bucket_bson["_id"] == cursor_bucket_id else len(bucket_events)
+                if unread_count == 0:
+                    continue
+                if len(events_bson) == size:
+                    next_cursor = TaskActivityReader._encode_cursor(bucket_bson, unread_count)
+                    break
+
+                read_count = min(unread_count, size - len(events_bson))
+                events_bson.extend(reversed(bucket_events[unread_count - read_count : unread_count]))
+                if read_count < unread_count:
+                    next_cursor = TaskActivityReader._encode_cursor(bucket_bson, unread_count - read_count)
+                    break
+
+        return CursorPaginationResult(
+            items=[TaskActivityReader._convert_event_bson_to_event(event_bson) for event_bson in events_bson],
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def _convert_event_bson_to_event(event_bson: Dict[str, Any]) -> TaskActivityEvent:
+        return TaskActivityEvent(
+            action=TaskActivityAction(event_bson["action"]),
+            occurred_at=event_bson["occurred_at"].isoformat(),
+            task_id=event_bson.get("task_id"),
+            fields=event_bson.get("fields", []),
+            task_count=event_bson.get("task_count", 1),
+        )
+
+    @staticmethod
+    def _encode_cursor(bucket_bson: Dict[str, Any], unread_count: int) -> str:
+        payload = json_util.dumps({"h": bucket_bson["hour"], "i": bucket_bson["_id"], "n": unread_count})
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[Any, Any, int]:
+        try:
+            payload = json_util.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+            return payload["h"], payload["i"], int(payload["n"])
+        except (binascii.Error, BSONError, KeyError, TypeError, ValueError):
+            raise TaskBadRequestError("Cursor is invalid or was not issued by the task activity history")
@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from modules.task.constants import TASK_ACTIVITY_BUCKET_SIZE
+from modules.task.internal.store.task_activity_bucket_repository import TaskActivityBucketRepository
+from modules.task.types import TaskActivityAction
+
+
+class TaskActivityWriter:
+    @staticmethod
+    def build_task_event(
+        *,
+        action: TaskActivityAction,
+        occurred_at: datetime,
+        task_id: Optional[Any] = None,
+        fields: Optional[List[str]] = None,
+        task_count: int = 1,
+    ) -> Dict[str, Any]:
+        return {
+            "action": str(action),
+            "occurred_at": occurred_at,
+            "task_id": str(task_id) if task_id is not None else None,
+            "fields": sorted(fields or []),
+            "task_count": task_count,
+        }
+
+    @staticmethod
+    def record_task_events(*, account_id: str, events: List[Dict[str, Any]]) -> None:
+        """
+        Appends the events to the account's open bucket for the current hour in one upsert. When every bucket of
+        the hour is full the filter matches nothing and the upsert starts a new one, so history reads a few large
+        documents rather than one per event.
+        """
+        if not events:
+            return
+
+        now = datetime.now()
+        TaskActivityBucketRepository.collection().update_one(
+            {
+                "account_id": account_id,
+                "hour": now.replace(minute=0, second=0, microsecond=0),
+                "event_count": {"$lt": TASK_ACTIVITY_BUCKET_SIZE},
+            },
+            {
+                "$push": {"events": {"$each": events}},
+                "$inc": {"event_count": len(events)},
+                "$set": {"updated_at": now},
+                "$setOnInsert": {"created_at": now},
+            },
+            upsert=True,
+        )
@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+from bson.objectid import ObjectId
+from pymongo import ReplaceOne
+
+from modules.task.constants import TASK_ARCHIVAL_CHECKPOINT_ID
+from modules.task.errors import TaskNotFoundError
+from modules.task.internal.store.task_archival_checkpoint_model import TaskArchivalCheckpointModel
+from modules.task.internal.store.task_archival_checkpoint_repository import TaskArchivalCheckpointRepository
+from modules.task.internal.store.task_archive_model import TaskArchiveModel
+from modules.task.internal.store.task_archive_repository import TaskArchiveRepository
+from modules.task.internal.store.task_model import TaskModel
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_activity_writer import TaskActivityWriter
+from modules.task.internal.task_counter_writer import TaskCounterWriter
+from modules.task.internal.task_position_util import TaskPositionUtil
+from modules.task.internal.task_util import TaskUtil
+from modules.task.types import (
+    ArchiveInactiveTasksParams,
+    RestoreArchivedTaskParams,
+    Task,
+    TaskActivityAction,
+    TaskArchivalBatchResult,
+)
+
+
+class TaskArchivalWriter:
+    @staticmethod
+    def archive_inactive_tasks_batch(*, params: ArchiveInactiveTasksParams) -> TaskArchivalBatchResult:
+        """
+        Moves the next batch of soft-deleted tasks older than the cutoff into the archive collection.
+        Copies are upserted before the originals are removed, so a batch interrupted halfway is safe to repeat.
+        Archived tasks no longer show up as tombstones, so delta sync refuses to start before the cutoff.
+        """
+        checkpoint = TaskArchivalWriter._get_or_start_checkpoint(min_age_days=params.min_age_days)
+
+        filter_query: Dict[str, Any] = {"active": False, "updated_at": {"$lt": checkpoint.cutoff}}
+        if checkpoint.last_updated_at is not None:
+            filter_query["updated_at"]["$gte"] = checkpoint.last_updated_at
+            filter_query["$or"] = [
+                {"updated_at": {"$gt": checkpoint.last_updated_at}},
+                {"_id": {"$gt": checkpoint.last_task_id}},
+            ]
+
+        tasks_bson = list(
+            TaskRepository.collection()
+            .find(filter_query)
+            .sort([("updated_at", 1), ("_id", 1)])
+            .limit(params.batch_size)
+        )
+        completed = len(tasks_bson) < params.batch_size
+
+        checkpoint_update: Dict[str, Any] = {}
+        if tasks_bson:
+            archived_at = datetime.now()
+            TaskArchiveRepository.collection().bulk_write(
+                [
+                    ReplaceOne({"_id": task_bson["_id"]}, {**task_bson, "archived_at": archived_at}, upsert=True)
+                    for task_bson in tasks_bson
+                ],
+                ordered=False,
+            )
+            TaskRepository.collection().delete_many(
+                {"_id": {"$in": [task_bson["_id"] for task_bson in tasks_bson]}, "active": False}
+            )
+            checkpoint_update = {
+                "$set": {"last_task_id": tasks_bson[-1]["_id"], "last_updated_at": tasks_bson[-1]["updated_at"]},
+                "$inc": {"archived_count": len(tasks_bson)},
+            }
+
+        if completed:
+            checkpoint_update.setdefault("$set", {})["completed_at"] = datetime.now()
+
+        if checkpoint_update:
+            TaskArchivalCheckpointRepository.collection().update_one(
+                {"_id": TASK_ARCHIVAL_CHECKPOINT_ID}, checkpoint_update
+            )
+
+        return TaskArchivalBatchResult(archived_count=len(tasks_bson), completed=completed)
+
+    @staticmethod
+    def restore_archived_task(*, params: RestoreArchivedTaskParams) -> Task:
+        archived_task_bson = TaskArchiveRepository.collection().find_one(
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id}
+        )
+        if archived_task_bson is None:
+            raise TaskNotFoundError(task_id=params.task_id)
+
+        # Restoring undeletes the task, so it comes back active with a fresh updated_at for delta sync. Its reminder
+        # was dropped on deletion and is not brought back
+        archived_task = TaskArchiveModel.from_bson(archived_task_bson)
+        task_bson = TaskModel(
+            account_id=archived_task.account_id,
+            created_at=archived_task.created_at,
+            description=archived_task.description,
+            due_at=archived_task.due_at,
+            id=archived_task.id,
+            position=archived_task.position or TaskPositionUtil.get_position_for_time(datetime.now()),
+            priority=archived_task.priority,
+            status=archived_task.status,
+            title=archived_task.title,
+        ).to_bson()
+        TaskRepository.collection().replace_one({"_id": task_bson["_id"]}, task_bson, upsert=True)
+        TaskArchiveRepository.collection().delete_one({"_id": task_bson["_id"]})
+        TaskCounterWriter.record_task_mutation(account_id=params.account_id, active_task_count_delta=1)
+        TaskActivityWriter.record_task_events(
+            account_id=params.account_id,
+            events=[
+                TaskActivityWriter.build_task_event(
+                    action=TaskActivityAction.RESTORED, occurred_at=task_bson["updated_at"], task_id=task_bson["_id"]
+                )
+            ],
+        )
+
+        return TaskUtil.convert_task_bson_to_task(task_bson)
+
+    @staticmethod
+    def _get_or_start_checkpoint(*, min_age_days: int) -> TaskArchivalCheckpointModel:
+        checkpoint_bson = TaskArchivalCheckpointRepository.collection().find_one({"_id": TASK_ARCHIVAL_CHECKPOINT_ID})
+        if checkpoint_bson is not None and checkpoint_bson.get("completed_at") is None:
+            return TaskArchivalCheckpointModel.from_bson(checkpoint_bson)
+
+        checkpoint = TaskArchivalCheckpointModel(
+            cutoff=datetime.now() - timedelta(days=min_age_days), id=TASK_ARCHIVAL_CHECKPOINT_ID
+        )
+        TaskArchivalCheckpointRepository.collection().replace_one(
+            {"_id": TASK_ARCHIVAL_CHECKPOINT_ID}, checkpoint.to_bson(), upsert=True
+        )
+        return checkpoint
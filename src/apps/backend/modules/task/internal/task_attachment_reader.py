@@ -0,0 +1,55 @@
+from typing import List
+
+from bson.objectid import ObjectId
+from gridfs.errors import NoFile
+
+from modules.task.errors import TaskAttachmentNotFoundError, TaskNotFoundError
+from modules.task.internal.store.task_attachment_repository import TaskAttachmentRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_util import TaskUtil
+from modules.task.types import GetTaskAttachmentParams, GetTaskAttachmentsParams, TaskAttachment, TaskAttachmentContent
+
+
+class TaskAttachmentReader:
+    @staticmethod
+    def get_task_attachments(*, params: GetTaskAttachmentsParams) -> List[TaskAttachment]:
+        TaskAttachmentReader._ensure_task_is_active(account_id=params.account_id, task_id=params.task_id)
+        return [
+            TaskUtil.convert_task_attachment_bson_to_task_attachment(task_attachment_bson)
+            for task_attachment_bson in TaskAttachmentRepository.collection()
+            .find({"account_id": params.account_id, "task_id": params.task_id})
+            .sort("created_at", 1)
+        ]
+
+    @staticmethod
+    def open_task_attachment(*, params: GetTaskAttachmentParams) -> TaskAttachmentContent:
+        if not ObjectId.is_valid(params.attachment_id):
+            raise TaskAttachmentNotFoundError(attachment_id=params.attachment_id)
+
+        # Attachments of a deleted task stay until the cleanup worker gets to them, but are no longer served
+        TaskAttachmentReader._ensure_task_is_active(account_id=params.account_id, task_id=params.task_id)
+        task_attachment_bson = TaskAttachmentRepository.collection().find_one(
+            {"_id": ObjectId(params.attachment_id), "account_id": params.account_id, "task_id": params.task_id}
+        )
+        if task_attachment_bson is None:
+            raise TaskAttachmentNotFoundError(attachment_id=params.attachment_id)
+
+        try:
+            file_stream = TaskAttachmentRepository.file_bucket().open_download_stream(task_attachment_bson["file_id"])
+        except NoFile:
+            raise TaskAttachmentNotFoundError(attachment_id=params.attachment_id)
+
+        return TaskAttachmentContent(
+            attachment=TaskUtil.convert_task_attachment_bson_to_task_attachment(task_attachment_bson),
+            stream=file_stream,
+        )
+
+    @staticmethod
+    def _ensure_task_is_active(*, account_id: str, task_id: str) -> None:
+        if not ObjectId.is_valid(task_id) or (
+            TaskRepository.collection().find_one(
+                {"_id": ObjectId(task_id), "account_id": account_id, "active": True}, {"_id": 1}
+            )
+            is None
+        ):
+            raise TaskNotFoundError(task_id=task_id)
@@ -0,0 +1,146 @@
+from datetime import datetime
+from typing import Tuple
+
+from bson.objectid import ObjectId
+from gridfs.errors import NoFile
+
+from modules.task.constants import TASK_ATTACHMENT_CHUNK_SIZE
+from modules.task.errors import TaskAttachmentNotFoundError, TaskAttachmentTooLargeError, TaskNotFoundError
+from modules.task.internal.store.task_attachment_model import TaskAttachmentModel
+from modules.task.internal.store.task_attachment_repository import TaskAttachmentRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_counter_writer import TaskCounterWriter
+from modules.task.internal.task_util import TaskUtil
+from modules.task.types import (
+    DeleteTaskAttachmentParams,
+    TaskAttachment,
+    TaskAttachmentCleanupResult,
+    UploadTaskAttachmentParams,
+)
+
+
+class TaskAttachmentWriter:
+    @staticmethod
+    def upload_task_attachment(*, params: UploadTaskAttachmentParams) -> TaskAttachment:
+        if not ObjectId.is_valid(params.task_id):
+            raise TaskNotFoundError(task_id=params.task_id)
+
+        task_filter = {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True}
+        if TaskRepository.collection().find_one(task_filter, {"_id": 1}) is None:
+            raise TaskNotFoundError(task_id=params.task_id)
+
+        file_id, size = TaskAttachmentWriter._upload_file(params=params)
+        task_attachment_bson = TaskAttachmentModel(
+            account_id=params.account_id,
+            content_type=params.content_type,
+            file_id=file_id,
+            filename=params.filename,
+            size=size,
+            task_id=params.task_id,
+        ).to_bson()
+        query = TaskAttachmentRepository.collection().insert_one(task_attachment_bson)
+        task_attachment_bson["_id"] = query.inserted_id
+
+        # Lets a delete tell whether the task has files to clean up without reading the attachments. The count is
+        # part of the task body, so updated_at and the list version move with it for ETags and delta sync
+        TaskRepository.collection().update_one(
+            task_filter, {"$inc": {"attachment_count": 1}, "$set": {"updated_at": datetime.now()}}
+        )
+        TaskCounterWriter.record_task_mutation(account_id=params.account_id)
+
+        return TaskUtil.convert_task_attachment_bson_to_task_attachment(task_attachment_bson)
+
+    @staticmethod
+    def delete_task_attachment(*, params: DeleteTaskAttachmentParams) -> None:
+        if not ObjectId.is_valid(params.attachment_id):
+            raise TaskAttachmentNotFoundError(attachment_id=params.attachment_id)
+
+        # The metadata goes first, so no reader can find an attachment whose file is already gone
+        task_attachment_bson = TaskAttachmentRepository.collection().find_one_and_delete(
+            {"_id": ObjectId(params.attachment_id), "account_id": params.account_id, "task_id": params.task_id}
+        )
+        if task_attachment_bson is None:
+            raise TaskAttachmentNotFoundError(attachment_id=params.attachment_id)
+
+        TaskAttachmentWriter._delete_file(task_attachment_bson["file_id"])
+        TaskRepository.collection().update_one(
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id},
+            {"$inc": {"attachment_count": -1}, "$set": {"updated_at": datetime.now()}},
+        )
+        TaskCounterWriter.record_task_mutation(account_id=params.account_id)
+
+    @staticmethod
+    def delete_orphaned_task_attachments(*, account_id: str) -> TaskAttachmentCleanupResult:
+        """
+        Deletes the attachments of the account's soft-deleted tasks, file and metadata. Every step can be repeated,
+        so a run cut short is completed by the next one.
+        """
+        task_ids = TaskAttachmentRepository.collection().distinct("task_id", {"account_id": account_id})
+        active_task_ids = {
+            str(task_bson["_id"])
+            for task_bson in TaskRepository.collection().find(
+                {"_id": {"$in": [ObjectId(task_id) for task_id in task_ids]}, "account_id": account_id, "active": True},
+                {"_id": 1},
+            )
+        }
+        orphaned_task_ids = [task_id for task_id in task_ids if task_id not in active_task_ids]
+        if not orphaned_task_ids:
+            return TaskAttachmentCleanupResult(account_id=account_id, deleted_count=0)
+
+        deleted_count = 0
+        for task_attachment_bson in TaskAttachmentRepository.collection().find(
+            {"account_id": account_id, "task_id": {"$in": orphaned_task_ids}}, {"file_id": 1}
+        ):
+            TaskAttachmentWriter._delete_file(task_attachment_bson["file_id"])
+            TaskAttachmentRepository.collection().delete_one({"_id": task_attachment_bson["_id"]})
+            deleted_count += 1
+
+        # A task restored from the archive later comes back without attachments
+        reset_result = TaskRepository.collection().update_many(
+            {
+                "_id": {"$in": [ObjectId(task_id) for task_id in orphaned_task_ids]},
+                "active": False,
+                "attachment_count": {"$ne": 0},
+            },
+            {"$set": {"attachment_count": 0, "updated_at": datetime.now()}},
+        )
+        if reset_result.modified_count:
+            TaskCounterWriter.record_task_mutation(account_id=account_id)
+
+        return TaskAttachmentCleanupResult(account_id=account_id, deleted_count=deleted_count)
+
+    @staticmethod
+    def _upload_file(*, params: UploadTaskAttachmentParams) -> Tuple[ObjectId, int]:
+        """
+        Copies the request body into GridFS one chunk at a time, so memory use does not grow with the file. A failed
+        or oversized upload is aborted, which removes the chunks written so far.
+        """
+        grid_in = TaskAttachmentRepository.file_bucket().open_upload_stream(
+            params.filename,
+            chunk_size_bytes=TASK_ATTACHMENT_CHUNK_SIZE,
+            metadata={"account_id": params.account_id, "task_id": params.task_id},
+        )
+        size = 0
+        try:
+            while True:
+                chunk = params.stream.read(TASK_ATTACHMENT_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > params.max_size_bytes:
+                    raise TaskAttachmentTooLargeError(max_size_bytes=params.max_size_bytes)
+                grid_in.write(chunk)
+        except BaseException:
+            grid_in.abort()
+            raise
+        grid_in.close()
+
+        return grid_in._id, size
+
+    @staticmethod
+    def _delete_file(file_id: ObjectId) -> None:
+        try:
+            TaskAttachmentRepository.file_bucket().delete(file_id)
+        except NoFile:
+            # Already removed by an earlier run that stopped before deleting the metadata
+            pass
@@ -0,0 +1,20 @@
+from modules.task.internal.store.task_counter_repository import TaskCounterRepository
+from modules.task.internal.task_counter_writer import TaskCounterWriter
+
+
+class TaskCounterReader:
+    @staticmethod
+    def get_active_task_count(*, account_id: str) -> int:
+        counter_bson = TaskCounterRepository.collection().find_one({"account_id": account_id})
+        if counter_bson is not None:
+            return int(counter_bson["active_task_count"])
+
+        # Accounts whose tasks predate the counters get theirs seeded on first read
+        return TaskCounterWriter.seed_task_counter(account_id=account_id)
+
+    @staticmethod
+    def get_task_version(*, account_id: str) -> int:
+        counter_bson = TaskCounterRepository.collection().find_one({"account_id": account_id}, {"version": 1})
+        if counter_bson is None:
+            return 0
+        return int(counter_bson.get("version", 0))
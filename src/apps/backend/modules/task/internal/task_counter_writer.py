@@ -0,0 +1,114 @@
+from datetime import datetime
+from typing import Any, List
+
+from pymongo import UpdateOne
+
+from modules.task.internal.store.task_counter_repository import TaskCounterRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.types import TaskCounterRepairResult
+
+
+class TaskCounterWriter:
+    @staticmethod
+    def record_task_mutation(*, account_id: str, active_task_count_delta: int = 0) -> None:
+        """
+        Adjusts the account's active task count and bumps its task version, which list ETags are derived from.
+        The cached task summary is dropped in the same update. Called after the task write, so an account without a
+        counter yet gets one seeded from a count that already includes this write.
+        """
+        now = datetime.now()
+        result = TaskCounterRepository.collection().update_one(
+            {"account_id": account_id},
+            {
+                "$inc": {"active_task_count": active_task_count_delta, "version": 1},
+                "$set": {"updated_at": now},
+                "$unset": {"summary": ""},
+            },
+        )
+        if result.matched_count == 0:
+            TaskCounterWriter.seed_task_counter(account_id=account_id)
+
+    @staticmethod
+    def seed_task_counter(*, account_id: str) -> int:
+        """
+        Creates the account's counter from a count of its active tasks, unless another write created it first.
+        Concurrent first writes may each count the other's task or not, the next repair run corrects any skew.
+        """
+        now = datetime.now()
+        active_task_count = int(TaskRepository.collection().count_documents({"account_id": account_id, "active": True}))
+        TaskCounterRepository.collection().update_one(
+            {"account_id": account_id},
+            {
+                "$setOnInsert": {
+                    "active_task_count": active_task_count,
+                    "created_at": now,
+                    # Marks the counter as accurate, so a repair run that started earlier does not zero it
+                    "repaired_at": now,
+                    "updated_at": now,
+                    "version": 1,
+                }
+            },
+            upsert=True,
+        )
+        return active_task_count
+
+    @staticmethod
+    def repair_task_counters(*, batch_size: int) -> TaskCounterRepairResult:
+        """
+        Recomputes every account's counter from the tasks collection, writing them back in batches.
+        Writes that land while an account is being recomputed can still skew its counter, the next run corrects it.
+        """
+        repair_started_at = datetime.now()
+        repaired_counters = 0
+        pending_updates: List[UpdateOne] = []
+
+        active_task_counts = TaskRepository.collection().aggregate(
+            [{"$match": {"active": True}}, {"$group": {"_id": "$account_id", "active_task_count": {"$sum": 1}}}],
+            allowDiskUse=True,
+            batchSize=batch_size,
+        )
+
+        for active_task_count in active_task_counts:
+            pending_updates.append(
+                UpdateOne(
+                    {"account_id": active_task_count["_id"]},
+                    {
+                        "$set": {
+                            "active_task_count": active_task_count["active_task_count"],
+                            "repaired_at": repair_started_at,
+                            "updated_at": repair_started_at,
+                        },
+                        "$inc": {"version": 1},
+                        "$setOnInsert": {"created_at": repair_started_at},
+                    },
+                    upsert=True,
+                )
+            )
+            if len(pending_updates) >= batch_size:
+                repaired_counters += TaskCounterWriter._flush_counter_updates(pending_updates)
+                pending_updates = []
+
+        repaired_counters += TaskCounterWriter._flush_counter_updates(pending_updates)
+
+        # Counters that were not touched above belong to accounts without any active task
+        stale_counters_filter: dict[str, Any] = {
+            "$or": [{"repaired_at": {"$lt": repair_started_at}}, {"repaired_at": {"$exists": False}}]
+        }
+        zeroed_counters = TaskCounterRepository.collection().update_many(
+            stale_counters_filter,
+            {
+                "$set": {"active_task_count": 0, "repaired_at": repair_started_at, "updated_at": repair_started_at},
+                "$inc": {"version": 1},
+            },
+        )
+
+        return TaskCounterRepairResult(
+            repaired_counters=repaired_counters + zeroed_counters.modified_count, started_at=repair_started_at
+        )
+
+    @staticmethod
+    def _flush_counter_updates(pending_updates: List[UpdateOne]) -> int:
+        if not pending_updates:
+            return 0
+        result = TaskCounterRepository.collection().bulk_write(pending_updates, ordered=False)
+        return int(result.modified_count + result.upserted_count)
@@ -0,0 +1,20 @@
+from bson.objectid import ObjectId
+
+from modules.task.errors import TaskImportNotFoundError
+from modules.task.internal.store.task_import_repository import TaskImportRepository
+from modules.task.internal.task_util import TaskUtil
+from modules.task.types import GetTaskImportParams, TaskImport
+
+
+class TaskImportReader:
+    @staticmethod
+    def get_task_import(*, params: GetTaskImportParams) -> TaskImport:
+        if not ObjectId.is_valid(params.import_id):
+            raise TaskImportNotFoundError(import_id=params.import_id)
+
+        task_import_bson = TaskImportRepository.collection().find_one(
+            {"_id": ObjectId(params.import_id), "account_id": params.account_id}
+        )
+        if task_import_bson is None:
+            raise TaskImportNotFoundError(import_id=params.import_id)
+        return TaskUtil.convert_task_import_bson_to_task_import(task_import_bson)
@@ -0,0 +1,277 @@
+import codecs
+import csv
+import json
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from bson.objectid import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError
+
+from modules.application.errors import AppError
+from modules.logger.logger import Logger
+from modules.task.constants import MAX_TASK_IMPORT_ERRORS
+from modules.task.errors import TaskBadRequestError, TaskImportNotFoundError
+from modules.task.internal.store.task_import_model import TaskImportModel
+from modules.task.internal.store.task_import_repository import TaskImportRepository
+from modules.task.internal.store.task_model import TaskModel
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_counter_writer import TaskCounterWriter
+from modules.task.internal.task_util import TaskUtil
+from modules.task.types import (
+    ImportTasksParams,
+    RunTaskImportParams,
+    StageTaskImportParams,
+    TaskImport,
+    TaskImportFormat,
+    TaskImportResult,
+    TaskImportRowError,
+    TaskImportStatus,
+)
+
+
+class TaskImportWriter:
+    @staticmethod
+    def import_tasks(
+        *, params: ImportTasksParams, on_progress: Optional[Callable[[TaskImportResult], None]] = None
+    ) -> TaskImportResult:
+        """
+        Reads the file one line at a time and inserts valid rows in batches, so memory is bounded by the batch size.
+        Rows that fail validation or insertion are reported individually and do not stop the import. A file that
+        becomes unreadable after some rows were inserted ends the import there, with the stop reported as a row error.
+        """
+        processed_rows = 0
+        imported_count = 0
+        failed_count = 0
+        errors: List[TaskImportRowError] = []
+        pending_row_numbers: List[int] = []
+        pending_tasks_bson: List[Dict[str, Any]] = []
+
+        def flush_pending_tasks() -> None:
+            nonlocal imported_count, failed_count
+            inserted_count, insert_errors = TaskImportWriter._insert_tasks_batch(
+                params.account_id, pending_row_numbers, pending_tasks_bson
+            )
+            imported_count += inserted_count
+            failed_count += len(insert_errors)
+            errors.extend(insert_errors[: MAX_TASK_IMPORT_ERRORS - len(errors)])
+            pending_row_numbers.clear()
+            pending_tasks_bson.clear()
+            if on_progress:
+                on_progress(
+                    TaskImportResult(
+                        processed_rows=processed_rows,
+                        imported_count=imported_count,
+                        failed_count=failed_count,
+                        errors=errors,
+                    )
+                )
+
+        try:
+            for row_number, row, parse_error in TaskImportWriter._read_rows(params.stream, params.file_format):
+                processed_rows += 1
+                row_error = parse_error or TaskUtil.get_task_import_row_error(row)
+                if row_error:
+                    failed_count += 1
+                    if len(errors) < MAX_TASK_IMPORT_ERRORS:
+                        errors.append(TaskImportRowError(row=row_number, message=row_error))
+                    continue
+
+                pending_row_numbers.append(row_number)
+                pending_tasks_bson.append(
+                    TaskModel(
+                        account_id=params.account_id, description=row["description"], title=row["title"]
+                    ).to_bson()
+                )
+                if len(pending_tasks_bson) >= params.batch_size:
+                    flush_pending_tasks()
+        except TaskBadRequestError as e:
+            # Nothing was inserted yet, so rejecting the whole file is safe to retry
+            if imported_count == 0:
+                raise
+            # Earlier batches are already committed: keep the rows read before the unreadable part and report where
+            # the import stopped, rather than failing a request whose retry would insert those rows again
+            failed_count += 1
+            if len(errors) < MAX_TASK_IMPORT_ERRORS:
+                errors.append(TaskImportRowError(row=processed_rows + 1, message=e.message))
+
+        if pending_tasks_bson:
+            flush_pending_tasks()
+
+        return TaskImportResult(
+            processed_rows=processed_rows, imported_count=imported_count, failed_count=failed_count, errors=errors
+        )
+
+    @staticmethod
+    def stage_task_import(*, params: StageTaskImportParams) -> TaskImport:
+        # GridFS reads the upload in chunks, so large files never sit in memory
+        file_id = TaskImportRepository.file_bucket().upload_from_stream(
+            f"{params.account_id}.{params.file_format}", params.stream, metadata={"account_id": params.account_id}
+        )
+        task_import_bson = TaskImportModel(
+            account_id=params.account_id,
+            file_format=params.file_format,
+            file_id=file_id,
+            status=TaskImportStatus.PENDING,
+        ).to_bson()
+        query = TaskImportRepository.collection().insert_one(task_import_bson)
+        task_import_bson["_id"] = query.inserted_id
+
+        return TaskUtil.convert_task_import_bson_to_task_import(task_import_bson)
+
+    @staticmethod
+    def set_task_import_worker(*, import_id: str, worker_id: str) -> None:
+        TaskImportRepository.collection().update_one(
+            {"_id": ObjectId(import_id)}, {"$set": {"worker_id": worker_id, "updated_at": datetime.now()}}
+        )
+
+    @staticmethod
+    def run_task_import(*, params: RunTaskImportParams) -> TaskImport:
+        # Only a pending import is claimed, so a retried worker cannot insert the same rows twice
+        task_import_bson = TaskImportRepository.collection().find_one_and_update(
+            {"_id": ObjectId(params.import_id), "status": TaskImportStatus.PENDING},
+            {"$set": {"status": TaskImportStatus.RUNNING, "updated_at": datetime.now()}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if task_import_bson is None:
+            return TaskImportWriter._fail_abandoned_task_import(
+                import_id=params.import_id, lease_seconds=params.lease_seconds
+            )
+
+        task_import = TaskUtil.convert_task_import_bson_to_task_import(task_import_bson)
+        file_id = task_import_bson["file_id"]
+        final_update: Dict[str, Any] = {"completed_at": datetime.now()}
+        try:
+            with TaskImportRepository.file_bucket().open_download_stream(file_id) as file_stream:
+                result = TaskImportWriter.import_tasks(
+                    params=ImportTasksParams(
+                        account_id=task_import.account_id,
+                        file_format=task_import.file_format,
+                        stream=file_stream,
+                        batch_size=params.batch_size,
+                    ),
+                    on_progress=lambda progress: TaskImportWriter._save_task_import_progress(
+                        params.import_id, progress
+                    ),
+                )
+            final_update.update(TaskImportWriter._get_task_import_progress_fields(result))
+            final_update["status"] = TaskImportStatus.COMPLETED
+        except AppError as e:
+            final_update.update({"failure_reason": e.message, "status": TaskImportStatus.FAILED})
+        except Exception as e:
+            # Anything else, such as a lost database connection, still ends the import so it is not left running
+            Logger.error(message=f"Task import {params.import_id} failed: {e}")
+            final_update.update({"failure_reason": "Import failed unexpectedly", "status": TaskImportStatus.FAILED})
+
+        TaskImportRepository.file_bucket().delete(file_id)
+        final_update["updated_at"] = datetime.now()
+        updated_task_import_bson = TaskImportRepository.collection().find_one_and_update(
+            {"_id": ObjectId(params.import_id)},
+            {"$set": final_update, "$unset": {"file_id": ""}},
+            return_document=ReturnDocument.AFTER,
+        )
+
+        return TaskUtil.convert_task_import_bson_to_task_import(updated_task_import_bson)
+
+    @staticmethod
+    def _fail_abandoned_task_import(*, import_id: str, lease_seconds: int) -> TaskImport:
+        """
+        Called when an import could not be claimed. One still running without progress for lease_seconds belongs to a
+        worker that died or timed out; it is marked failed and its file deleted, since rerunning it from the start
+        would insert its committed rows again.
+        """
+        now = datetime.now()
+        abandoned_task_import_bson = TaskImportRepository.collection().find_one_and_update(
+            {
+                "_id": ObjectId(import_id),
+                "status": TaskImportStatus.RUNNING,
+                "updated_at": {"$lt": now - timedelta(seconds=lease_seconds)},
+            },
+            {
+                "$set": {
+                    "completed_at": now,
+                    "failure_reason": "Import was interrupted, rows processed before the interruption were kept",
+                    "status": TaskImportStatus.FAILED,
+                    "updated_at": now,
+                },
+                "$unset": {"file_id": ""},
+            },
+            return_document=ReturnDocument.BEFORE,
+        )
+        if abandoned_task_import_bson is not None and abandoned_task_import_bson.get("file_id") is not None:
+            TaskImportRepository.file_bucket().delete(abandoned_task_import_bson["file_id"])
+
+        current_task_import_bson = TaskImportRepository.collection().find_one({"_id": ObjectId(import_id)})
+        if current_task_import_bson is None:
+            raise TaskImportNotFoundError(import_id=import_id)
+        return TaskUtil.convert_task_import_bson_to_task_import(current_task_import_bson)
+
+    @staticmethod
+    def _save_task_import_progress(import_id: str, progress: TaskImportResult) -> None:
+        TaskImportRepository.collection().update_one(
+            {"_id": ObjectId(import_id)},
+            {"$set": {**TaskImportWriter._get_task_import_progress_fields(progress), "updated_at": datetime.now()}},
+        )
+
+    @staticmethod
+    def _get_task_import_progress_fields(progress: TaskImportResult) -> Dict[str, Any]:
+        return {
+            "errors": [asdict(error) for error in progress.errors],
+            "failed_count": progress.failed_count,
+            "imported_count": progress.imported_count,
+            "processed_rows": progress.processed_rows,
+        }
+
+    @staticmethod
+    def _insert_tasks_batch(
+        account_id: str, row_numbers: List[int], tasks_bson: List[Dict[str, Any]]
+    ) -> Tuple[int, List[TaskImportRowError]]:
+        insert_errors: List[TaskImportRowError] = []
+        try:
+            inserted_count = len(TaskRepository.collection().insert_many(tasks_bson, ordered=False).inserted_ids)
+        except BulkWriteError as e:
+            inserted_count = int(e.details.get("nInserted", 0))
+            insert_errors = [
+                TaskImportRowError(
+                    row=row_numbers[write_error["index"]], message=write_error.get("errmsg", "Write failed")
+                )
+                for write_error in e.details.get("writeErrors", [])
+            ]
+
+        if inserted_count:
+            TaskCounterWriter.record_task_mutation(account_id=account_id, active_task_count_delta=inserted_count)
+        return inserted_count, insert_errors
+
+    @staticmethod
+    def _read_rows(stream: IO[bytes], file_format: TaskImportFormat) -> Iterator[Tuple[int, Any, Optional[str]]]:
+        """
+        Yields (row number, parsed row, parse error) for every record in the file.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+
+        def decode_lines() -> Iterator[str]:
+            for line_number, line in enumerate(iter(stream.readline, b""), start=1):
+                try:
+                    yield decoder.decode(line)
+                except UnicodeDecodeError:
+                    raise TaskBadRequestError(f"Line {line_number} is not valid UTF-8, the import stopped there")
+
+        if file_format == TaskImportFormat.CSV:
+            reader = csv.DictReader(decode_lines())
+            if not reader.fieldnames or not {"title", "description"} <= set(reader.fieldnames):
+                raise TaskBadRequestError("CSV header must include title and description columns")
+            try:
+                for row_number, csv_row in enumerate(reader, start=1):
+                    yield row_number, csv_row, None
+            except csv.Error as e:
+                raise TaskBadRequestError(f"CSV is malformed near line {reader.line_num}: {e}")
+            return
+
+        for row_number, line in enumerate(decode_lines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                yield row_number, json.loads(line), None
+            except json.JSONDecodeError:
+                yield row_number, None, "Row is not valid JSON"
@@ -0,0 +1,63 @@
+from datetime import datetime
+from typing import Optional
+
+# Digits in ascending byte order, so ranks compare correctly as plain strings and in the index
+POSITION_DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+# Wide enough for microseconds since the epoch until well past the year 2300
+POSITION_TIMESTAMP_WIDTH = 9
+# Ranks never end in the lowest digit, otherwise no rank would fit between "X" and "X0"
+POSITION_SUFFIX = POSITION_DIGITS[len(POSITION_DIGITS) // 2]
+
+
+class TaskPositionUtil:
+    @staticmethod
+    def get_position_for_number(number: int) -> str:
+        digits = []
+        for _ in range(POSITION_TIMESTAMP_WIDTH):
+            number, digit = divmod(number, len(POSITION_DIGITS))
+            digits.append(POSITION_DIGITS[digit])
+        return "".join(reversed(digits)) + POSITION_SUFFIX
+
+    @staticmethod
+    def get_position_for_time(time: datetime) -> str:
+        """
+        New tasks are ranked by creation time, so they go to the end of the list without reading the current last
+        rank, and every rank produced by moves or a rebalance sorts before them.
+        """
+        return TaskPositionUtil.get_position_for_number(int(time.timestamp() * 1_000_000))
+
+    @staticmethod
+    def get_position_between(previous_position: Optional[str], next_position: Optional[str]) -> str:
+        """
+        Returns a rank strictly between the two, either of which may be open. Ranks are compared as base 62
+        fractions, so a rank always fits between two distinct ones and only the moved task is rewritten.
+        """
+        if previous_position is not None and next_position is not None and previous_position >= next_position:
+            raise ValueError(f"Position {previous_position} does not sort before {next_position}")
+
+        if next_position is None:
+            # Moving to the end keeps ranks short by reusing the creation-time scheme whenever it sorts last
+            time_position = TaskPositionUtil.get_position_for_time(datetime.now())
+            if previous_position is None or time_position > previous_position:
+                return time_position
+
+        return TaskPositionUtil._get_midpoint(previous_position or "", next_position)
+
+    @staticmethod
+    def _get_midpoint(lower: str, upper: Optional[str]) -> str:
+        if upper is not None:
+            prefix_length = 0
+            while (lower[prefix_length] if prefix_length < len(lower) else POSITION_DIGITS[0]) == upper[prefix_length]:
+                prefix_length += 1
+            if prefix_length > 0:
+                return upper[:prefix_length] + TaskPositionUtil._get_midpoint(
+                    lower[prefix_length:], upper[prefix_length:]
+                )
+
+        lower_digit = POSITION_DIGITS.index(lower[0]) if lower else 0
+        upper_digit = POSITION_DIGITS.index(upper[0]) if upper is not None else len(POSITION_DIGITS)
+        if upper_digit - lower_digit > 1:
+            return POSITION_DIGITS[(lower_digit + upper_digit) // 2]
+        if upper is not None and len(upper) > 1:
+            return upper[:1]
+        return POSITION_DIGITS[lower_digit] + TaskPositionUtil._get_midpoint(lower[1:], None)
@@ -0,0 +1,135 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson.objectid import ObjectId
+from pymongo import ReturnDocument, UpdateOne
+
+from modules.task.constants import TASK_POSITION_REBALANCE_BATCH_SIZE
+from modules.task.errors import TaskBadRequestError, TaskNotFoundError
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_activity_writer import TaskActivityWriter
+from modules.task.internal.task_counter_writer import TaskCounterWriter
+from modules.task.internal.task_position_util import TaskPositionUtil
+from modules.task.internal.task_util import TaskUtil
+from modules.task.types import MoveTaskParams, Task, TaskActivityAction, TaskPositionRebalanceResult
+
+
+class TaskPositionWriter:
+    @staticmethod
+    def move_task(*, params: MoveTaskParams) -> Task:
+        """
+        Gives the task a rank between its new neighbors. Only the moved task is written, whatever the list size.
+        """
+        neighbor_ids = [task_id for task_id in (params.previous_task_id, params.next_task_id) if task_id]
+        if not neighbor_ids:
+            raise TaskBadRequestError("A previous or next task is required")
+        if any(not ObjectId.is_valid(task_id) or task_id == params.task_id for task_id in neighbor_ids):
+            raise TaskBadRequestError("Previous and next tasks must be valid ids of other tasks")
+
+        base_filter: Dict[str, Any] = {
+            "account_id": params.account_id,
+            "active": True,
+            "_id": {"$ne": ObjectId(params.task_id)},
+        }
+        positions_by_id = {
+            str(task_bson["_id"]): task_bson.get("position", "")
+            for task_bson in TaskRepository.collection().find(
+                {**base_filter, "_id": {"$in": [ObjectId(task_id) for task_id in neighbor_ids]}}, {"position": 1}
+            )
+        }
+        for task_id in neighbor_ids:
+            if task_id not in positions_by_id:
+                raise TaskNotFoundError(task_id=task_id)
+
+        # A single neighbor stands for the gap next to it, so the other side is looked up through the position index
+        previous_position = positions_by_id.get(params.previous_task_id or "")
+        next_position = positions_by_id.get(params.next_task_id or "")
+        if params.next_task_id is None and previous_position is not None:
+            next_position = TaskPositionWriter._find_adjacent_position(
+                filter_query={**base_filter, "position": {"$gt": previous_position}}, direction=1
+            )
+        elif params.previous_task_id is None and next_position is not None:
+            previous_position = TaskPositionWriter._find_adjacent_position(
+                filter_query={**base_filter, "position": {"$lt": next_position}}, direction=-1
+            )
+
+        try:
+            position = TaskPositionUtil.get_position_between(previous_position, next_position)
+        except ValueError:
+            raise TaskBadRequestError("Previous task must come before next task in the current order")
+
+        updated_task_bson = TaskRepository.collection().find_one_and_update(
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True},
+            {"$set": {"position": position, "updated_at": datetime.now()}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if updated_task_bson is None:
+            raise TaskNotFoundError(task_id=params.task_id)
+
+        TaskCounterWriter.record_task_mutation(account_id=params.account_id)
+        TaskActivityWriter.record_task_events(
+            account_id=params.account_id,
+            events=[
+                TaskActivityWriter.build_task_event(
+                    action=TaskActivityAction.MOVED,
+                    occurred_at=updated_task_bson["updated_at"],
+                    task_id=updated_task_bson["_id"],
+                    fields=["position"],
+                )
+            ],
+        )
+
+        return TaskUtil.convert_task_bson_to_task(updated_task_bson)
+
+    @staticmethod
+    def rebalance_task_positions(*, account_id: str) -> TaskPositionRebalanceResult:
+        """
+        Rewrites the account's ranks as evenly spaced fixed-width ones in the current order, all sorting before the
+        creation-time ranks of tasks created afterwards. A task moved while this runs keeps its new rank, and the
+        list may show mixed old and new ranks until the run completes.
+        """
+        task_filter = {"account_id": account_id, "active": True}
+        # The order is snapshotted before any rank is rewritten, since a cursor sorted on position could revisit or
+        # skip tasks whose rank changes under it. Only ids and ranks are held, a few dozen bytes per task
+        ordered_tasks: List[Tuple[ObjectId, Optional[str]]] = [
+            (task_bson["_id"], task_bson.get("position"))
+            for task_bson in TaskRepository.collection()
+            .find(task_filter, {"position": 1})
+            .sort([("position", 1), ("_id", 1)])
+            .batch_size(TASK_POSITION_REBALANCE_BATCH_SIZE)
+        ]
+        if not ordered_tasks:
+            return TaskPositionRebalanceResult(account_id=account_id, rebalanced_count=0)
+
+        time_position_number = int(datetime.now().timestamp() * 1_000_000)
+        step = time_position_number // (len(ordered_tasks) + 1)
+
+        rebalanced_count = 0
+        pending_updates: List[UpdateOne] = []
+        for index, (task_id, position) in enumerate(ordered_tasks):
+            pending_updates.append(
+                UpdateOne(
+                    {"_id": task_id, "position": position},
+                    {"$set": {"position": TaskPositionUtil.get_position_for_number((index + 1) * step)}},
+                )
+            )
+            if len(pending_updates) >= TASK_POSITION_REBALANCE_BATCH_SIZE:
+                rebalanced_count += (
+                    TaskRepository.collection().bulk_write(pending_updates, ordered=False).modified_count
+                )
+                pending_updates = []
+
+        if pending_updates:
+            rebalanced_count += TaskRepository.collection().bulk_write(pending_updates, ordered=False).modified_count
+
+        # Ranks are part of every task body, so cached lists must not be served again
+        TaskCounterWriter.record_task_mutation(account_id=account_id)
+
+        return TaskPositionRebalanceResult(account_id=account_id, rebalanced_count=rebalanced_count)
+
+    @staticmethod
+    def _find_adjacent_position(*, filter_query: Dict[str, Any], direction: int) -> Optional[str]:
+        adjacent_task_bson = TaskRepository.collection().find_one(
+            filter_query, {"position": 1}, sort=[("position", direction), ("_id", direction)]
+        )
+        return adjacent_task_bson.get("position", "") if adjacent_task_bson else None
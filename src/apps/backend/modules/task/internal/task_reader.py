@@ -1,39 +1,288 @@
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
 from bson.objectid import ObjectId
 
 from modules.application.common.base_model import BaseModel
-from modules.application.common.types import PaginationResult
-from modules.task.errors import TaskNotFoundError
+from modules.application.common.types import CursorPaginationResult, PaginationParams, PaginationResult
+from modules.task.constants import (
+    TASK_ARCHIVAL_CHECKPOINT_ID,
+    TASK_CHANGES_SORT_PARAMS,
+    TASK_FIELDS,
+    TASK_SEARCH_SORT_PARAMS,
+)
+from modules.task.errors import TaskBadRequestError, TaskChangesExpiredError, TaskNotFoundError
+from modules.task.internal.store.task_archival_checkpoint_repository import TaskArchivalCheckpointRepository
 from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_counter_reader import TaskCounterReader
 from modules.task.internal.task_util import TaskUtil
-from modules.task.types import GetPaginatedTasksParams, GetTaskParams, Task
+from modules.task.types import (
+    ExportTasksParams,
+    GetCursorPaginatedTasksParams,
+    GetPaginatedTasksParams,
+    GetTaskChangesParams,
+    GetTaskParams,
+    GetTasksByIdsParams,
+    PartialTask,
+    SearchTasksParams,
+    Task,
+    TaskChange,
+    TasksByIdsResult,
+    VersionedTask,
+)
 
 
 class TaskReader:
     @staticmethod
     def get_task(*, params: GetTaskParams) -> Task:
-        task_bson = TaskRepository.collection().find_one(
-            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True}
+        task_bson = TaskReader._find_task_bson(params=params, projection=None)
+        return TaskUtil.convert_task_bson_to_task(task_bson)
+
+    @staticmethod
+    def get_task_updated_at(*, params: GetTaskParams) -> datetime:
+        task_bson = TaskReader._find_task_bson(params=params, projection={"updated_at": 1})
+        updated_at: datetime = task_bson["updated_at"]
+        return updated_at
+
+    @staticmethod
+    def get_versioned_task(*, params: GetTaskParams) -> VersionedTask:
+        if not params.fields:
+            task_bson = TaskReader._find_task_bson(params=params, projection=None)
+            return VersionedTask(task=TaskUtil.convert_task_bson_to_task(task_bson), updated_at=task_bson["updated_at"])
+
+        # updated_at is read in the same query for the ETag, it only reaches the body when requested
+        projection = {**TaskUtil.get_task_projection(params.fields), "updated_at": 1}
+        task_bson = TaskReader._find_task_bson(params=params, projection=projection)
+        return VersionedTask(
+            task=TaskUtil.convert_task_bson_to_partial_task(task_bson, params.fields),
+            updated_at=task_bson["updated_at"],
+        )
+
+    @staticmethod
+    def get_partial_task(*, params: GetTaskParams) -> PartialTask:
+        fields = params.fields or list(TASK_FIELDS)
+        task_bson = TaskReader._find_task_bson(params=params, projection=TaskUtil.get_task_projection(fields))
+        return TaskUtil.convert_task_bson_to_partial_task(task_bson, fields)
+
+    @staticmethod
+    def get_tasks_by_ids(*, params: GetTasksByIdsParams) -> TasksByIdsResult:
+        requested_ids = list(dict.fromkeys(params.task_ids))
+        object_ids = [ObjectId(task_id) for task_id in requested_ids if ObjectId.is_valid(task_id)]
+
+        tasks_by_id: Dict[str, Task] = {}
+        if object_ids:
+            for task_bson in TaskRepository.collection().find(
+                {"_id": {"$in": object_ids}, "account_id": params.account_id, "active": True}
+            ):
+                task = TaskUtil.convert_task_bson_to_task(task_bson)
+                tasks_by_id[task.id] = task
+
+        return TasksByIdsResult(
+            items=[tasks_by_id[task_id] for task_id in requested_ids if task_id in tasks_by_id],
+            missing_ids=[task_id for task_id in requested_ids if task_id not in tasks_by_id],
+        )
+
+    @staticmethod
+    def get_paginated_tasks(*, params: GetPaginatedTasksParams) -> PaginationResult[Task]:
+        tasks_bson, pagination_params, total_count, total_pages = TaskReader._find_paginated_tasks_bson(
+            params=params, projection=None
+        )
+        tasks = [TaskUtil.convert_task_bson_to_task(task_bson) for task_bson in tasks_bson]
+        return PaginationResult(
+            items=tasks, pagination_params=pagination_params, total_count=total_count, total_pages=total_pages
+        )
+
+    @staticmethod
+    def get_paginated_partial_tasks(*, params: GetPaginatedTasksParams) -> PaginationResult[PartialTask]:
+        fields = params.fields or list(TASK_FIELDS)
+        tasks_bson, pagination_params, total_count, total_pages = TaskReader._find_paginated_tasks_bson(
+            params=params, projection=TaskUtil.get_task_projection(fields)
+        )
+        tasks = [TaskUtil.convert_task_bson_to_partial_task(task_bson, fields) for task_bson in tasks_bson]
+        return PaginationResult(
+            items=tasks, pagination_params=pagination_params, total_count=total_count, total_pages=total_pages
+        )
+
+    @staticmethod
+    def get_cursor_paginated_tasks(*, params: GetCursorPaginatedTasksParams) -> CursorPaginationResult[Task]:
+        tasks_bson, next_cursor, total_count = TaskReader._find_cursor_paginated_tasks_bson(
+            params=params, projection=None
+        )
+        tasks = [TaskUtil.convert_task_bson_to_task(task_bson) for task_bson in tasks_bson]
+        return CursorPaginationResult(items=tasks, next_cursor=next_cursor, total_count=total_count)
+
+    @staticmethod
+    def get_cursor_paginated_partial_tasks(
+        *, params: GetCursorPaginatedTasksParams
+    ) -> CursorPaginationResult[PartialTask]:
+        fields = params.fields or list(TASK_FIELDS)
+        tasks_bson, next_cursor, total_count = TaskReader._find_cursor_paginated_tasks_bson(
+            params=params, projection=TaskUtil.get_task_projection(fields)
+        )
+        tasks = [TaskUtil.convert_task_bson_to_partial_task(task_bson, fields) for task_bson in tasks_bson]
+        return CursorPaginationResult(items=tasks, next_cursor=next_cursor, total_count=total_count)
+
+    @staticmethod
+    def get_task_changes(*, params: GetTaskChangesParams) -> CursorPaginationResult[TaskChange]:
+        # Tombstones older than the archival cutoff may already be archived, so those deletions cannot be reported
+        archival_horizon = TaskReader._get_archival_horizon()
+        if archival_horizon is not None and params.updated_since < archival_horizon:
+            raise TaskChangesExpiredError(horizon=archival_horizon)
+
+        size = params.cursor_pagination_params.size
+        # Inclusive, so writes sharing the boundary millisecond are not lost; clients apply changes idempotently
+        filter_query: Dict[str, Any] = {"account_id": params.account_id, "updated_at": {"$gte": params.updated_since}}
+
+        if params.cursor_pagination_params.cursor:
+            try:
+                # The keyset bound on updated_at is never below updated_since, so it replaces that condition
+                filter_query.update(
+                    BaseModel.build_keyset_filter(TASK_CHANGES_SORT_PARAMS, params.cursor_pagination_params.cursor)
+                )
+            except ValueError:
+                raise TaskBadRequestError("Cursor is invalid or was not issued by a task delta sync")
+
+        cursor = BaseModel.apply_sort_params(TaskRepository.collection().find(filter_query), TASK_CHANGES_SORT_PARAMS)
+        tasks_bson = list(cursor.limit(size + 1))
+
+        next_cursor = None
+        if len(tasks_bson) > size:
+            tasks_bson = tasks_bson[:size]
+            next_cursor = BaseModel.encode_cursor(TASK_CHANGES_SORT_PARAMS, tasks_bson[-1])
+
+        task_changes = [TaskUtil.convert_task_bson_to_task_change(task_bson) for task_bson in tasks_bson]
+        return CursorPaginationResult(items=task_changes, next_cursor=next_cursor)
+
+    @staticmethod
+    def stream_tasks(*, params: ExportTasksParams) -> Iterator[Task]:
+        # One cursor walks the account in index order, so concurrent writes cannot shift pages the way skip does
+        cursor = (
+            TaskRepository.collection()
+            .find({"account_id": params.account_id, "active": True})
+            .sort([("created_at", 1), ("_id", 1)])
+            .batch_size(params.batch_size)
+        )
+        try:
+            for task_bson in cursor:
+                yield TaskUtil.convert_task_bson_to_task(task_bson)
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def search_tasks(*, params: SearchTasksParams) -> CursorPaginationResult[Task]:
+        size = params.cursor_pagination_params.size
+        pipeline: List[Dict[str, Any]] = [
+            {"$match": {"account_id": params.account_id, "active": True, "$text": {"$search": params.query}}},
+            {"$addFields": {TASK_SEARCH_SORT_PARAMS.sort_by: {"$meta": "textScore"}}},
+        ]
+
+        if params.cursor_pagination_params.cursor:
+            try:
+                keyset_filter = BaseModel.build_keyset_filter(
+                    TASK_SEARCH_SORT_PARAMS, params.cursor_pagination_params.cursor
+                )
+            except ValueError:
+                raise TaskBadRequestError("Cursor is invalid or was not issued by a task search")
+            pipeline.append({"$match": keyset_filter})
+
+        pipeline.extend(
+            [
+                {
+                    "$sort": {
+                        TASK_SEARCH_SORT_PARAMS.sort_by: TASK_SEARCH_SORT_PARAMS.sort_direction.numeric_value,
+                        "_id": TASK_SEARCH_SORT_PARAMS.sort_direction.numeric_value,
+                    }
+                },
+                # Fetch one extra document to find out whether another page exists
+                {"$limit": size + 1},
+            ]
+        )
+        tasks_bson = list(TaskRepository.collection().aggregate(pipeline))
+
+        next_cursor = None
+        if len(tasks_bson) > size:
+            tasks_bson = tasks_bson[:size]
+            next_cursor = BaseModel.encode_cursor(TASK_SEARCH_SORT_PARAMS, tasks_bson[-1])
+
+        tasks = [TaskUtil.convert_task_bson_to_task(task_bson) for task_bson in tasks_bson]
+        return CursorPaginationResult(items=tasks, next_cursor=next_cursor)
+
+    @staticmethod
+    def _find_task_bson(*, params: GetTaskParams, projection: Optional[Dict[str, int]]) -> Dict[str, Any]:
+        task_bson: Optional[Dict[str, Any]] = TaskRepository.collection().find_one(
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True}, projection
         )
         if task_bson is None:
             raise TaskNotFoundError(task_id=params.task_id)
-        return TaskUtil.convert_task_bson_to_task(task_bson)
+        return task_bson
 
     @staticmethod
-    def get_paginated_tasks(*, params: GetPaginatedTasksParams) -> PaginationResult[Task]:
-        filter_query = {"account_id": params.account_id, "active": True}
-        total_count = TaskRepository.collection().count_documents(filter_query)
+    def _find_paginated_tasks_bson(
+        *, params: GetPaginatedTasksParams, projection: Optional[Dict[str, int]]
+    ) -> Tuple[List[Dict[str, Any]], PaginationParams, Optional[int], Optional[int]]:
+        filter_query = TaskUtil.get_task_filter_query(params.account_id, params.filter_params)
+        total_count = (
+            TaskReader._count_tasks(account_id=params.account_id, filter_query=filter_query)
+            if params.include_total
+            else None
+        )
         pagination_params, skip, total_pages = BaseModel.calculate_pagination_values(
             params.pagination_params, total_count
         )
-        cursor = TaskRepository.collection().find(filter_query)
-
-        if params.sort_params:
-            cursor = BaseModel.apply_sort_params(cursor, params.sort_params)
-        else:
-            cursor = cursor.sort([("created_at", -1), ("_id", -1)])
+        cursor = BaseModel.apply_sort_params(
+            TaskRepository.collection().find(filter_query, projection),
+            TaskUtil.get_task_sort_params(params.sort_params, filter_query),
+        )
 
         tasks_bson = list(cursor.skip(skip).limit(pagination_params.size))
-        tasks = [TaskUtil.convert_task_bson_to_task(task_bson) for task_bson in tasks_bson]
-        return PaginationResult(
-            items=tasks, pagination_params=pagination_params, total_count=total_count, total_pages=total_pages
+        return tasks_bson, pagination_params, total_count, total_pages
+
+    @staticmethod
+    def _find_cursor_paginated_tasks_bson(
+        *, params: GetCursorPaginatedTasksParams, projection: Optional[Dict[str, int]]
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[int]]:
+        size = params.cursor_pagination_params.size
+        filter_query = TaskUtil.get_task_filter_query(params.account_id, params.filter_params)
+        sort_params = TaskUtil.get_task_sort_params(params.sort_params, filter_query)
+        # Counted before the keyset bound is added, the total covers every page
+        total_count = (
+            TaskReader._count_tasks(account_id=params.account_id, filter_query=filter_query)
+            if params.include_total
+            else None
         )
+
+        if params.cursor_pagination_params.cursor:
+            try:
+                filter_query.update(BaseModel.build_keyset_filter(sort_params, params.cursor_pagination_params.cursor))
+            except ValueError:
+                raise TaskBadRequestError("Cursor is invalid or was issued for a different sort order")
+
+        # The next cursor is built from the sort field, so it is read even when the client did not ask for it
+        if projection is not None:
+            projection = {**projection, sort_params.sort_by: 1}
+
+        # Fetch one extra document to find out whether another page exists
+        cursor = BaseModel.apply_sort_params(TaskRepository.collection().find(filter_query, projection), sort_params)
+        tasks_bson = list(cursor.limit(size + 1))
+
+        next_cursor = None
+        if len(tasks_bson) > size:
+            tasks_bson = tasks_bson[:size]
+            next_cursor = BaseModel.encode_cursor(sort_params, tasks_bson[-1])
+
+        return tasks_bson, next_cursor, total_count
+
+    @staticmethod
+    def _get_archival_horizon() -> Optional[datetime]:
+        checkpoint_bson = TaskArchivalCheckpointRepository.collection().find_one(
+            {"_id": TASK_ARCHIVAL_CHECKPOINT_ID}, {"cutoff": 1}
+        )
+        return checkpoint_bson["cutoff"] if checkpoint_bson is not None else None
+
+    @staticmethod
+    def _count_tasks(*, account_id: str, filter_query: Dict[str, Any]) -> int:
+        # Unfiltered lists read the maintained counter; filtered ones count over the same partial index as the page
+        if filter_query == {"account_id": account_id, "active": True}:
+            return TaskCounterReader.get_active_task_count(account_id=account_id)
+        task_count: int = TaskRepository.collection().count_documents(filter_query)
+        return task_count
@@ -0,0 +1,162 @@
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson.objectid import ObjectId
+
+from modules.account.account_service import AccountService
+from modules.config.config_service import ConfigService
+from modules.notification.notification_service import NotificationService
+from modules.notification.types import (
+    AccountEmail,
+    EmailRecipient,
+    EmailSender,
+    SendEmailParams,
+    SendEmailsForAccountsParams,
+)
+from modules.task.internal.store.task_reminder_repository import TaskReminderRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.types import DispatchTaskRemindersParams, TaskReminderDispatchResult
+
+
+class TaskReminderWriter:
+    @staticmethod
+    def schedule_task_reminder(*, account_id: str, task_id: ObjectId, remind_at: Optional[datetime]) -> None:
+        """
+        Replaces the task's pending reminder, or drops it when remind_at is None. Rescheduling clears any claim, so
+        a worker still holding the old reminder cannot complete the new one.
+        """
+        if remind_at is None:
+            TaskReminderRepository.collection().delete_one({"_id": task_id})
+            return
+
+        TaskReminderRepository.collection().update_one(
+            {"_id": task_id},
+            {
+                "$set": {"account_id": account_id, "remind_at": remind_at},
+                "$unset": {"claim_token": ""},
+                "$setOnInsert": {"created_at": datetime.now()},
+            },
+            upsert=True,
+        )
+
+    @staticmethod
+    def delete_task_reminders(*, task_ids: List[ObjectId]) -> None:
+        if task_ids:
+            TaskReminderRepository.collection().delete_many({"_id": {"$in": task_ids}})
+
+    @staticmethod
+    def dispatch_due_task_reminders(*, params: DispatchTaskRemindersParams) -> TaskReminderDispatchResult:
+        claim_token, reminders_bson = TaskReminderWriter._claim_due_task_reminders(params=params)
+        if not reminders_bson:
+            return TaskReminderDispatchResult(claimed_count=0, sent_count=0, skipped_count=0)
+
+        emails_by_reminder_id = TaskReminderWriter._build_reminder_emails(reminders_bson)
+        send_result = NotificationService.send_emails_for_accounts(
+            params=SendEmailsForAccountsParams(emails=list(emails_by_reminder_id.values()))
+        )
+        failed_email_ids = {id(email) for email in send_result.failed_emails}
+        failed_reminder_ids = {
+            reminder_id for reminder_id, email in emails_by_reminder_id.items() if id(email) in failed_email_ids
+        }
+
+        # Reminders whose send request failed keep their lease and are retried once it expires, while those already
+        # handed over are removed, so a partly failed batch does not send its delivered reminders a second time. If
+        # sending raised, nothing is removed and the whole batch is retried.
+        TaskReminderRepository.collection().delete_many(
+            {
+                "_id": {
+                    "$in": [
+                        reminder_bson["_id"]
+                        for reminder_bson in reminders_bson
+                        if reminder_bson["_id"] not in failed_reminder_ids
+                    ]
+                },
+                "claim_token": claim_token,
+            }
+        )
+
+        return TaskReminderDispatchResult(
+            claimed_count=len(reminders_bson),
+            sent_count=send_result.sent_count,
+            skipped_count=len(reminders_bson) - send_result.sent_count - len(failed_reminder_ids),
+            failed_count=len(failed_reminder_ids),
+        )
+
+    @staticmethod
+    def _claim_due_task_reminders(*, params: DispatchTaskRemindersParams) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        Claims up to batch_size due reminders, oldest first, by pushing their remind_at past the lease. Each update
+        re-checks that the reminder is still due, so concurrent workers never claim the same reminder, and claimed
+        reminders leave the due range of the (remind_at, _id) index instead of being rescanned by every poll.
+        """
+        now = datetime.now()
+        candidate_ids = [
+            reminder_bson["_id"]
+            for reminder_bson in TaskReminderRepository.collection()
+            .find({"remind_at": {"$lte": now}}, {"_id": 1})
+            .sort([("remind_at", 1), ("_id", 1)])
+            .limit(params.batch_size)
+        ]
+        if not candidate_ids:
+            return "", []
+
+        claim_token = uuid.uuid4().hex
+        TaskReminderRepository.collection().update_many(
+            {"_id": {"$in": candidate_ids}, "remind_at": {"$lte": now}},
+            {"$set": {"claim_token": claim_token, "remind_at": now + timedelta(seconds=params.lease_seconds)}},
+        )
+        claimed_reminders_bson = list(
+            TaskReminderRepository.collection().find({"_id": {"$in": candidate_ids}, "claim_token": claim_token})
+        )
+        return claim_token, claimed_reminders_bson
+
+    @staticmethod
+    def _build_reminder_emails(reminders_bson: List[Dict[str, Any]]) -> Dict[ObjectId, AccountEmail]:
+        """
+        Builds the email of each reminder, keyed by reminder id, skipping reminders whose task or account is gone.
+        """
+        tasks_by_id = {
+            task_bson["_id"]: task_bson
+            for task_bson in TaskRepository.collection().find(
+                {"_id": {"$in": [reminder_bson["_id"] for reminder_bson in reminders_bson]}, "active": True},
+                {"account_id": 1, "due_at": 1, "title": 1},
+            )
+        }
+        accounts_by_id = {
+            account.id: account
+            for account in AccountService.get_accounts_by_ids(
+                account_ids=list({task_bson["account_id"] for task_bson in tasks_by_id.values()})
+            )
+        }
+
+        web_app_host = ConfigService[str].get_value(key="web_app_host")
+        sender = EmailSender(
+            email=ConfigService[str].get_value(key="mailer.default_email"),
+            name=ConfigService[str].get_value(key="mailer.default_email_name"),
+        )
+        template_id = ConfigService[str].get_value(key="mailer.task_reminder_mail_template_id")
+
+        emails_by_reminder_id: Dict[ObjectId, AccountEmail] = {}
+        for task_bson in tasks_by_id.values():
+            account = accounts_by_id.get(task_bson["account_id"])
+            if account is None:
+                continue
+
+            template_data = {
+                "first_name": account.first_name,
+                "task_title": task_bson["title"],
+                "task_due_at": task_bson["due_at"].isoformat() if task_bson.get("due_at") else None,
+                "tasks_link": f"{web_app_host}/tasks",
+            }
+            # A reminder shares its task's _id
+            emails_by_reminder_id[task_bson["_id"]] = AccountEmail(
+                account_id=account.id,
+                params=SendEmailParams(
+                    recipient=EmailRecipient(email=account.username),
+                    sender=sender,
+                    template_id=template_id,
+                    template_data=template_data,
+                ),
+            )
+        return emails_by_reminder_id
@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from modules.task.constants import TASK_SUMMARY_RECENT_TASKS_LIMIT
+from modules.task.internal.store.task_counter_repository import TaskCounterRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_util import TaskUtil
+from modules.task.types import GetTaskSummaryParams, TaskStatus, TaskSummary
+
+
+class TaskSummaryReader:
+    @staticmethod
+    def get_task_summary(*, params: GetTaskSummaryParams) -> TaskSummary:
+        """
+        Serves the summary cached on the account's task counter while it is fresh, otherwise computes it with one
+        aggregation. Task writes drop the cache; the TTL bounds how stale the time-based overdue count can get.
+        """
+        counter_bson: Optional[Dict[str, Any]] = TaskCounterRepository.collection().find_one(
+            {"account_id": params.account_id}, {"version": 1, "summary": 1}
+        )
+        version = counter_bson.get("version") if counter_bson else None
+        cached_summary = counter_bson.get("summary") if counter_bson else None
+
+        now = datetime.now()
+        if (
+            cached_summary
+            and cached_summary["version"] == version
+            and cached_summary["generated_at"] > now - timedelta(seconds=params.cache_ttl_seconds)
+        ):
+            return TaskUtil.convert_task_summary_bson_to_task_summary(cached_summary)
+
+        summary_bson = TaskSummaryReader._aggregate_task_summary_bson(account_id=params.account_id, now=now)
+        # Only cached while the version is unchanged, so a write racing the aggregation cannot be masked by it.
+        # Accounts without a counter yet are not cached until their first task write creates one
+        if counter_bson is not None:
+            summary_bson["version"] = version
+            TaskCounterRepository.collection().update_one(
+                {"account_id": params.account_id, "version": version}, {"$set": {"summary": summary_bson}}
+            )
+        return TaskUtil.convert_task_summary_bson_to_task_summary(summary_bson)
+
+    @staticmethod
+    def _aggregate_task_summary_bson(*, account_id: str, now: datetime) -> Dict[str, Any]:
+        pipeline = [
+            {"$match": {"account_id": account_id, "active": True}},
+            {
+                "$facet": {
+                    "totals": [{"$count": "total_count"}],
+                    "status_counts": [
+                        {"$group": {"_id": {"$ifNull": ["$status", str(TaskStatus.OPEN)]}, "count": {"$sum": 1}}}
+                    ],
+                    "overdue": [
+                        {"$match": {"status": {"$ne": str(TaskStatus.DONE)}, "due_at": {"$lt": now}}},
+                        {"$count": "overdue_count"},
+                    ],
+                    "recently_updated": [
+                        {"$sort": {"updated_at": -1, "_id": -1}},
+                        {"$limit": TASK_SUMMARY_RECENT_TASKS_LIMIT},
+                    ],
+                }
+            },
+        ]
+        facets = next(TaskRepository.collection().aggregate(pipeline))
+
+        status_counts = {str(status): 0 for status in TaskStatus}
+        status_counts.update({status_count["_id"]: status_count["count"] for status_count in facets["status_counts"]})
+        return {
+            "total_count": facets["totals"][0]["total_count"] if facets["totals"] else 0,
+            "status_counts": status_counts,
+            "overdue_count": facets["overdue"][0]["overdue_count"] if facets["overdue"] else 0,
+            "recently_updated": facets["recently_updated"],
+            "generated_at": now,
+        }
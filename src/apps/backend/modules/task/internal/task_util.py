@@ -1,7 +1,29 @@
-from typing import Any
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
+from bson.objectid import ObjectId
+
+from modules.application.common.types import SortParams
+from modules.task.constants import DEFAULT_TASK_SORT_PARAMS, DUE_FILTERED_TASK_SORT_PARAMS
+from modules.task.internal.store.task_attachment_model import TaskAttachmentModel
+from modules.task.internal.store.task_import_model import TaskImportModel
 from modules.task.internal.store.task_model import TaskModel
-from modules.task.types import Task
+from modules.task.types import (
+    PartialTask,
+    Task,
+    TaskAttachment,
+    TaskBatchOperation,
+    TaskBatchOperationType,
+    TaskChange,
+    TaskFilterParams,
+    TaskImport,
+    TaskImportFormat,
+    TaskImportRowError,
+    TaskImportStatus,
+    TaskPriority,
+    TaskStatus,
+    TaskSummary,
+)
 
 
 class TaskUtil:
@@ -13,4 +35,139 @@ class TaskUtil:
             description=validated_task_data.description,
             id=str(validated_task_data.id),
             title=validated_task_data.title,
+            status=TaskStatus(validated_task_data.status),
+            priority=TaskPriority(validated_task_data.priority),
+            due_at=validated_task_data.due_at.isoformat() if validated_task_data.due_at else None,
+            remind_at=validated_task_data.remind_at.isoformat() if validated_task_data.remind_at else None,
+            position=validated_task_data.position,
+            attachment_count=validated_task_data.attachment_count,
+        )
+
+    @staticmethod
+    def convert_task_bson_to_task_change(task_bson: dict[str, Any]) -> TaskChange:
+        active = bool(task_bson.get("active", True))
+        return TaskChange(
+            task_id=str(task_bson["_id"]),
+            active=active,
+            updated_at=task_bson["updated_at"].isoformat(),
+            task=TaskUtil.convert_task_bson_to_task(task_bson) if active else None,
+        )
+
+    @staticmethod
+    def convert_task_summary_bson_to_task_summary(summary_bson: dict[str, Any]) -> TaskSummary:
+        return TaskSummary(
+            total_count=summary_bson["total_count"],
+            status_counts=summary_bson["status_counts"],
+            overdue_count=summary_bson["overdue_count"],
+            recently_updated=[
+                TaskUtil.convert_task_bson_to_task(task_bson) for task_bson in summary_bson["recently_updated"]
+            ],
+            generated_at=summary_bson["generated_at"].isoformat(),
+        )
+
+    @staticmethod
+    def convert_task_bson_to_partial_task(task_bson: dict[str, Any], fields: List[str]) -> PartialTask:
+        partial_task: PartialTask = {}
+        for field in fields:
+            if field == "id":
+                partial_task["id"] = str(task_bson["_id"])
+            elif field in ("due_at", "remind_at"):
+                partial_task[field] = task_bson[field].isoformat() if task_bson.get(field) else None
+            elif field == "attachment_count":
+                partial_task[field] = task_bson.get(field, 0)
+            elif field in task_bson:
+                partial_task[field] = task_bson[field]
+        return partial_task
+
+    @staticmethod
+    def get_task_filter_query(account_id: str, filter_params: Optional[TaskFilterParams]) -> Dict[str, Any]:
+        filter_query: Dict[str, Any] = {"account_id": account_id, "active": True}
+        if filter_params is None:
+            return filter_query
+
+        if filter_params.status:
+            filter_query["status"] = str(filter_params.status)
+        if filter_params.priority:
+            filter_query["priority"] = str(filter_params.priority)
+
+        due_at_range: Dict[str, datetime] = {}
+        if filter_params.due_after:
+            due_at_range["$gte"] = filter_params.due_after
+        if filter_params.due_before:
+            due_at_range["$lt"] = filter_params.due_before
+        if due_at_range:
+            filter_query["due_at"] = due_at_range
+
+        return filter_query
+
+    @staticmethod
+    def get_task_sort_params(sort_params: Optional[SortParams], filter_query: Dict[str, Any]) -> SortParams:
+        if sort_params:
+            return sort_params
+        return DUE_FILTERED_TASK_SORT_PARAMS if "due_at" in filter_query else DEFAULT_TASK_SORT_PARAMS
+
+    @staticmethod
+    def get_task_projection(fields: List[str]) -> Dict[str, int]:
+        projection = {"_id": 1}
+        projection.update({field: 1 for field in fields if field != "id"})
+        return projection
+
+    @staticmethod
+    def convert_task_import_bson_to_task_import(task_import_bson: dict[str, Any]) -> TaskImport:
+        validated_task_import_data = TaskImportModel.from_bson(task_import_bson)
+        return TaskImport(
+            id=str(validated_task_import_data.id),
+            account_id=validated_task_import_data.account_id,
+            status=TaskImportStatus(validated_task_import_data.status),
+            file_format=TaskImportFormat(validated_task_import_data.file_format),
+            processed_rows=validated_task_import_data.processed_rows,
+            imported_count=validated_task_import_data.imported_count,
+            failed_count=validated_task_import_data.failed_count,
+            errors=[
+                TaskImportRowError(row=error["row"], message=error["message"])
+                for error in validated_task_import_data.errors
+            ],
+            failure_reason=validated_task_import_data.failure_reason,
+            worker_id=validated_task_import_data.worker_id,
         )
+
+    @staticmethod
+    def convert_task_attachment_bson_to_task_attachment(task_attachment_bson: dict[str, Any]) -> TaskAttachment:
+        validated_task_attachment_data = TaskAttachmentModel.from_bson(task_attachment_bson)
+        return TaskAttachment(
+            id=str(validated_task_attachment_data.id),
+            account_id=validated_task_attachment_data.account_id,
+            task_id=validated_task_attachment_data.task_id,
+            filename=validated_task_attachment_data.filename,
+            content_type=validated_task_attachment_data.content_type,
+            size=validated_task_attachment_data.size,
+            created_at=(
+                validated_task_attachment_data.created_at.isoformat()
+                if validated_task_attachment_data.created_at
+                else ""
+            ),
+        )
+
+    @staticmethod
+    def get_task_import_row_error(row: Any) -> Optional[str]:
+        if not isinstance(row, dict):
+            return "Row must be an object with title and description"
+        if not isinstance(row.get("title"), str) or not row["title"].strip():
+            return "Title is required"
+        if not isinstance(row.get("description"), str) or not row["description"].strip():
+            return "Description is required"
+        return None
+
+    @staticmethod
+    def get_task_batch_operation_error(operation: TaskBatchOperation) -> Optional[str]:
+        if operation.op != TaskBatchOperationType.CREATE:
+            if not operation.task_id or not ObjectId.is_valid(operation.task_id):
+                return "A valid task_id is required"
+
+        if operation.op != TaskBatchOperationType.DELETE:
+            if not isinstance(operation.title, str) or not operation.title.strip():
+                return "Title is required"
+            if not isinstance(operation.description, str) or not operation.description.strip():
+                return "Description is required"
+
+        return None
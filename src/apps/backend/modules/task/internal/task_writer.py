@@ -1,60 +1,371 @@
 from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
 
 from bson.objectid import ObjectId
-from pymongo import ReturnDocument
+from pymongo import InsertOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError
 
-from modules.task.errors import TaskNotFoundError
+from modules.application.common.types import UNSET
+from modules.task.errors import TaskBadRequestError, TaskNotFoundError
 from modules.task.internal.store.task_model import TaskModel
 from modules.task.internal.store.task_repository import TaskRepository
-from modules.task.internal.task_reader import TaskReader
+from modules.task.internal.task_activity_writer import TaskActivityWriter
+from modules.task.internal.task_counter_writer import TaskCounterWriter
+from modules.task.internal.task_reminder_writer import TaskReminderWriter
 from modules.task.internal.task_util import TaskUtil
 from modules.task.types import (
     CreateTaskParams,
     DeleteTaskParams,
-    GetTaskParams,
     Task,
+    TaskActivityAction,
+    TaskBatchOperationError,
+    TaskBatchOperationResult,
+    TaskBatchOperationType,
+    TaskBatchParams,
+    TaskBatchResult,
+    TaskBulkActionParams,
+    TaskBulkActionResult,
+    TaskBulkActionType,
     TaskDeletionResult,
+    TaskErrorCode,
     UpdateTaskParams,
 )
 
+# Batch operations are recorded as the same events as their single-task counterparts
+TASK_ACTIVITY_ACTIONS_BY_BATCH_OPERATION = {
+    TaskBatchOperationType.CREATE: TaskActivityAction.CREATED,
+    TaskBatchOperationType.UPDATE: TaskActivityAction.UPDATED,
+    TaskBatchOperationType.DELETE: TaskActivityAction.DELETED,
+}
+
+TASK_BATCH_NOT_EXECUTED_MESSAGE = "Not executed because an earlier operation in the ordered batch failed"
+
 
 class TaskWriter:
     @staticmethod
     def create_task(*, params: CreateTaskParams) -> Task:
         task_bson = TaskModel(
-            account_id=params.account_id, description=params.description, title=params.title
+            account_id=params.account_id,
+            description=params.description,
+            due_at=params.due_at,
+            priority=str(params.priority),
+            remind_at=params.remind_at,
+            status=str(params.status),
+            title=params.title,
         ).to_bson()
 
         query = TaskRepository.collection().insert_one(task_bson)
-        created_task_bson = TaskRepository.collection().find_one({"_id": query.inserted_id})
+        task_bson["_id"] = query.inserted_id
+        TaskCounterWriter.record_task_mutation(account_id=params.account_id, active_task_count_delta=1)
+        TaskActivityWriter.record_task_events(
+            account_id=params.account_id,
+            events=[
+                TaskActivityWriter.build_task_event(
+                    action=TaskActivityAction.CREATED, occurred_at=task_bson["created_at"], task_id=query.inserted_id
+                )
+            ],
+        )
+        if params.remind_at is not None:
+            TaskReminderWriter.schedule_task_reminder(
+                account_id=params.account_id, task_id=query.inserted_id, remind_at=params.remind_at
+            )
 
-        return TaskUtil.convert_task_bson_to_task(created_task_bson)
+        return TaskUtil.convert_task_bson_to_task(task_bson)
 
     @staticmethod
     def update_task(*, params: UpdateTaskParams) -> Task:
+        task_updates: Dict[str, Any] = {
+            "description": params.description,
+            "title": params.title,
+            "updated_at": datetime.now(),
+        }
+        if params.status is not None:
+            task_updates["status"] = str(params.status)
+        if params.priority is not None:
+            task_updates["priority"] = str(params.priority)
+        if params.due_at is not UNSET:
+            task_updates["due_at"] = params.due_at
+        if params.remind_at is not UNSET:
+            task_updates["remind_at"] = params.remind_at
+
         updated_task_bson = TaskRepository.collection().find_one_and_update(
             {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True},
-            {"$set": {"description": params.description, "title": params.title, "updated_at": datetime.now()}},
+            {"$set": task_updates},
             return_document=ReturnDocument.AFTER,
         )
 
         if updated_task_bson is None:
             raise TaskNotFoundError(task_id=params.task_id)
 
+        TaskCounterWriter.record_task_mutation(account_id=params.account_id)
+        TaskActivityWriter.record_task_events(
+            account_id=params.account_id,
+            events=[
+                TaskActivityWriter.build_task_event(
+                    action=TaskActivityAction.UPDATED,
+                    occurred_at=task_updates["updated_at"],
+                    task_id=updated_task_bson["_id"],
+                    fields=[field_name for field_name in task_updates if field_name != "updated_at"],
+                )
+            ],
+        )
+        if params.remind_at is not UNSET:
+            TaskReminderWriter.schedule_task_reminder(
+                account_id=params.account_id,
+                task_id=updated_task_bson["_id"],
+                remind_at=updated_task_bson.get("remind_at"),
+            )
+
         return TaskUtil.convert_task_bson_to_task(updated_task_bson)
 
     @staticmethod
     def delete_task(*, params: DeleteTaskParams) -> TaskDeletionResult:
-        task = TaskReader.get_task(params=GetTaskParams(account_id=params.account_id, task_id=params.task_id))
-
         deletion_time = datetime.now()
         updated_task_bson = TaskRepository.collection().find_one_and_update(
-            {"_id": ObjectId(task.id)},
+            {"_id": ObjectId(params.task_id), "account_id": params.account_id, "active": True},
             {"$set": {"active": False, "updated_at": deletion_time}},
-            return_document=ReturnDocument.AFTER,
+            projection={"_id": 1, "attachment_count": 1, "remind_at": 1},
         )
 
         if updated_task_bson is None:
             raise TaskNotFoundError(task_id=params.task_id)
 
-        return TaskDeletionResult(task_id=params.task_id, deleted_at=deletion_time, success=True)
+        TaskCounterWriter.record_task_mutation(account_id=params.account_id, active_task_count_delta=-1)
+        TaskActivityWriter.record_task_events(
+            account_id=params.account_id,
+            events=[
+                TaskActivityWriter.build_task_event(
+                    action=TaskActivityAction.DELETED, occurred_at=deletion_time, task_id=updated_task_bson["_id"]
+                )
+            ],
+        )
+        if updated_task_bson.get("remind_at"):
+            TaskReminderWriter.delete_task_reminders(task_ids=[updated_task_bson["_id"]])
+
+        return TaskDeletionResult(
+            task_id=params.task_id,
+            deleted_at=deletion_time,
+            success=True,
+            attachment_count=updated_task_bson.get("attachment_count", 0),
+        )
+
+    @staticmethod
+    def apply_task_bulk_action(*, params: TaskBulkActionParams) -> TaskBulkActionResult:
+        """
+        Applies one update to every task matching the filter with a single update_many. Reminders of deleted tasks
+        are left to the reminder dispatch, which drops those of inactive tasks without sending them.
+        """
+        filter_query = TaskUtil.get_task_filter_query(params.account_id, params.filter_params)
+        now = datetime.now()
+
+        if params.action == TaskBulkActionType.DELETE:
+            task_updates: Dict[str, Any] = {"active": False, "updated_at": now}
+        else:
+            task_updates = {"updated_at": now}
+            if params.status is not None:
+                task_updates["status"] = str(params.status)
+            if params.priority is not None:
+                task_updates["priority"] = str(params.priority)
+            if params.due_at is not UNSET:
+                task_updates["due_at"] = params.due_at
+            if len(task_updates) == 1:
+                raise TaskBadRequestError("An update must change at least one of status, priority or due_at")
+
+        result = TaskRepository.collection().update_many(filter_query, {"$set": task_updates})
+
+        # The filter only matches active tasks, so every modified task of a delete was active until now
+        if result.modified_count:
+            TaskCounterWriter.record_task_mutation(
+                account_id=params.account_id,
+                active_task_count_delta=(-result.modified_count if params.action == TaskBulkActionType.DELETE else 0),
+            )
+            # One event stands for every task the action changed, since their ids are never read
+            TaskActivityWriter.record_task_events(
+                account_id=params.account_id,
+                events=[
+                    TaskActivityWriter.build_task_event(
+                        action=(
+                            TaskActivityAction.BULK_DELETED
+                            if params.action == TaskBulkActionType.DELETE
+                            else TaskActivityAction.BULK_UPDATED
+                        ),
+                        occurred_at=now,
+                        fields=[
+                            field_name for field_name in task_updates if field_name not in ("active", "updated_at")
+                        ],
+                        task_count=result.modified_count,
+                    )
+                ],
+            )
+
+        return TaskBulkActionResult(matched_count=result.matched_count, modified_count=result.modified_count)
+
+    @staticmethod
+    def apply_task_batch(*, params: TaskBatchParams) -> TaskBatchResult:
+        validation_errors = []
+        for index, operation in enumerate(params.operations):
+            error = TaskUtil.get_task_batch_operation_error(operation)
+            if error:
+                validation_errors.append(f"Operation {index}: {error}")
+
+        if validation_errors:
+            raise TaskBadRequestError("; ".join(validation_errors))
+
+        # A single lookup tells which referenced tasks exist, since bulk_write only reports aggregate match counts
+        referenced_task_ids = [
+            ObjectId(operation.task_id)
+            for operation in params.operations
+            if operation.op != TaskBatchOperationType.CREATE
+        ]
+        available_tasks_bson: Dict[ObjectId, Dict[str, Any]] = {}
+        if referenced_task_ids:
+            available_tasks_bson = {
+                task_bson["_id"]: task_bson
+                for task_bson in TaskRepository.collection().find(
+                    {"_id": {"$in": referenced_task_ids}, "account_id": params.account_id, "active": True},
+                    {"_id": 1, "account_id": 1, "due_at": 1, "priority": 1, "remind_at": 1, "status": 1},
+                )
+            }
+
+        task_ids_with_reminders = {
+            task_id for task_id, task_bson in available_tasks_bson.items() if task_bson.get("remind_at")
+        }
+
+        now = datetime.now()
+        results: Dict[int, TaskBatchOperationResult] = {}
+        planned_results: Dict[int, TaskBatchOperationResult] = {}
+        bulk_requests: List[Union[InsertOne, UpdateOne]] = []
+        bulk_request_indexes: List[int] = []
+
+        # An ordered batch stops at its first failure, whether found here or reported by the write
+        halted_index: Optional[int] = None
+        for index, operation in enumerate(params.operations):
+            if halted_index is not None:
+                results[index] = TaskBatchOperationResult(
+                    index=index,
+                    op=operation.op,
+                    success=False,
+                    task_id=operation.task_id,
+                    error=TaskBatchOperationError(
+                        code=TaskErrorCode.BAD_REQUEST, message=TASK_BATCH_NOT_EXECUTED_MESSAGE
+                    ),
+                )
+                continue
+
+            if operation.op == TaskBatchOperationType.CREATE:
+                task_bson = TaskModel(
+                    account_id=params.account_id,
+                    created_at=now,
+                    description=str(operation.description),
+                    id=ObjectId(),
+                    title=str(operation.title),
+                    updated_at=now,
+                ).to_bson()
+                task = TaskUtil.convert_task_bson_to_task(task_bson)
+                bulk_requests.append(InsertOne(task_bson))
+                planned_results[index] = TaskBatchOperationResult(
+                    index=index, op=operation.op, success=True, task_id=task.id, task=task
+                )
+                bulk_request_indexes.append(index)
+                continue
+
+            task_id = ObjectId(operation.task_id)
+            if task_id not in available_tasks_bson:
+                not_found_error = TaskNotFoundError(task_id=str(operation.task_id))
+                results[index] = TaskBatchOperationResult(
+                    index=index,
+                    op=operation.op,
+                    success=False,
+                    task_id=operation.task_id,
+                    error=TaskBatchOperationError(code=not_found_error.code, message=not_found_error.message),
+                )
+                if params.ordered:
+                    halted_index = index
+                continue
+
+            task_filter = {"_id": task_id, "account_id": params.account_id, "active": True}
+            if operation.op == TaskBatchOperationType.UPDATE:
+                bulk_requests.append(
+                    UpdateOne(
+                        task_filter,
+                        {"$set": {"description": operation.description, "title": operation.title, "updated_at": now}},
+                    )
+                )
+                planned_results[index] = TaskBatchOperationResult(
+                    index=index,
+                    op=operation.op,
+                    success=True,
+                    task_id=operation.task_id,
+                    task=TaskUtil.convert_task_bson_to_task(
+                        {
+                            **available_tasks_bson[task_id],
+                            "description": operation.description,
+                            "title": operation.title,
+                        }
+                    ),
+                )
+            else:
+                # Later operations in the same batch must not see a task deleted here
+                available_tasks_bson.pop(task_id)
+                bulk_requests.append(UpdateOne(task_filter, {"$set": {"active": False, "updated_at": now}}))
+                planned_results[index] = TaskBatchOperationResult(
+                    index=index, op=operation.op, success=True, task_id=operation.task_id
+                )
+            bulk_request_indexes.append(index)
+
+        write_errors: Dict[int, Dict[str, Any]] = {}
+        halted_at = len(bulk_requests)
+        if bulk_requests:
+            try:
+                TaskRepository.collection().bulk_write(bulk_requests, ordered=params.ordered)
+            except BulkWriteError as e:
+                for write_error in e.details.get("writeErrors", []):
+                    write_errors[write_error["index"]] = write_error
+                if params.ordered and write_errors:
+                    halted_at = min(write_errors)
+
+        active_task_count_delta = 0
+        deleted_task_ids_with_reminders: List[ObjectId] = []
+        activity_events: List[Dict[str, Any]] = []
+        for position, index in enumerate(bulk_request_indexes):
+            planned_result = planned_results[index]
+            if position in write_errors or position > halted_at:
+                message = (
+                    write_errors[position].get("errmsg", "Write failed")
+                    if position in write_errors
+                    else TASK_BATCH_NOT_EXECUTED_MESSAGE
+                )
+                results[index] = TaskBatchOperationResult(
+                    index=index,
+                    op=planned_result.op,
+                    success=False,
+                    task_id=planned_result.task_id,
+                    error=TaskBatchOperationError(code=TaskErrorCode.BAD_REQUEST, message=message),
+                )
+                continue
+
+            results[index] = planned_result
+            activity_events.append(
+                TaskActivityWriter.build_task_event(
+                    action=TASK_ACTIVITY_ACTIONS_BY_BATCH_OPERATION[planned_result.op],
+                    occurred_at=now,
+                    task_id=planned_result.task_id,
+                    fields=["description", "title"] if planned_result.op == TaskBatchOperationType.UPDATE else [],
+                )
+            )
+            if planned_result.op == TaskBatchOperationType.CREATE:
+                active_task_count_delta += 1
+            elif planned_result.op == TaskBatchOperationType.DELETE:
+                active_task_count_delta -= 1
+                task_id = ObjectId(planned_result.task_id)
+                if task_id in task_ids_with_reminders:
+                    deleted_task_ids_with_reminders.append(task_id)
+
+        if any(result.success for result in results.values()):
+            TaskCounterWriter.record_task_mutation(
+                account_id=params.account_id, active_task_count_delta=active_task_count_delta
+            )
+        TaskReminderWriter.delete_task_reminders(task_ids=deleted_task_ids_with_reminders)
+        TaskActivityWriter.record_task_events(account_id=params.account_id, events=activity_events)
+
+        return TaskBatchResult(results=[results[index] for index in range(len(params.operations))])
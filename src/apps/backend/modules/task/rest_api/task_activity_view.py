@@ -0,0 +1,32 @@
+from dataclasses import asdict
+
+from flask import jsonify, request
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.application.common.constants import DEFAULT_PAGINATION_PARAMS
+from modules.application.common.types import CursorPaginationParams
+from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.task.errors import TaskBadRequestError
+from modules.task.task_service import TaskService
+from modules.task.types import GetTaskActivityParams
+
+
+class TaskActivityView(MethodView):
+    @access_auth_middleware
+    def get(self, account_id: str) -> ResponseReturnValue:
+        size = request.args.get("size", type=int)
+
+        if size is not None and size < 1:
+            raise TaskBadRequestError("Size must be greater than 0")
+
+        if size is None:
+            size = DEFAULT_PAGINATION_PARAMS.size
+
+        activity_params = GetTaskActivityParams(
+            account_id=account_id,
+            cursor_pagination_params=CursorPaginationParams(size=size, cursor=request.args.get("cursor") or None),
+        )
+        activity_result = TaskService.get_task_activity(params=activity_params)
+
+        return jsonify(asdict(activity_result)), 200
@@ -0,0 +1,105 @@
+from dataclasses import asdict
+from typing import IO, Iterator, Optional
+
+from flask import Response, jsonify, request
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+from werkzeug.datastructures import ContentRange
+
+from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.config.config_service import ConfigService
+from modules.task.constants import TASK_ATTACHMENT_CHUNK_SIZE
+from modules.task.errors import TaskAttachmentTooLargeError, TaskBadRequestError
+from modules.task.task_service import TaskService
+from modules.task.types import (
+    DeleteTaskAttachmentParams,
+    GetTaskAttachmentParams,
+    GetTaskAttachmentsParams,
+    UploadTaskAttachmentParams,
+)
+
+
+class TaskAttachmentView(MethodView):
+    @access_auth_middleware
+    def post(self, account_id: str, task_id: str) -> ResponseReturnValue:
+        filename = request.args.get("filename", "").strip()
+        if not filename:
+            raise TaskBadRequestError("Filename is required")
+
+        max_size_bytes = ConfigService[int].get_value(key="tasks.attachments.max_size_bytes", default=25 * 1024 * 1024)
+        # A declared size is checked before any of the body is read; chunked uploads are checked as they stream in
+        if request.content_length is not None and request.content_length > max_size_bytes:
+            raise TaskAttachmentTooLargeError(max_size_bytes=max_size_bytes)
+
+        upload_params = UploadTaskAttachmentParams(
+            account_id=account_id,
+            task_id=task_id,
+            filename=filename,
+            content_type=request.mimetype or "application/octet-stream",
+            stream=request.stream,
+            max_size_bytes=max_size_bytes,
+        )
+        attachment = TaskService.upload_task_attachment(params=upload_params)
+
+        return jsonify(asdict(attachment)), 201
+
+    @access_auth_middleware
+    def get(self, account_id: str, task_id: str, attachment_id: Optional[str] = None) -> ResponseReturnValue:
+        if attachment_id is None:
+            attachments = TaskService.get_task_attachments(
+                params=GetTaskAttachmentsParams(account_id=account_id, task_id=task_id)
+            )
+            return jsonify({"items": [asdict(attachment) for attachment in attachments]}), 200
+
+        content = TaskService.open_task_attachment(
+            params=GetTaskAttachmentParams(account_id=account_id, task_id=task_id, attachment_id=attachment_id)
+        )
+        size = content.attachment.size
+
+        # A single byte range is served as a partial response; several ranges fall back to the whole file
+        start, stop, is_partial = 0, size, False
+        requested_range = request.range
+        if requested_range is not None and len(requested_range.ranges) == 1:
+            byte_range = requested_range.range_for_length(size)
+            if byte_range is None:
+                content.stream.close()
+                response = Response(status=416)
+                response.headers["Content-Range"] = f"bytes */{size}"
+                return response
+            start, stop = byte_range
+            is_partial = True
+
+        response = Response(
+            TaskAttachmentView._generate_file_chunks(content.stream, start, stop),
+            status=206 if is_partial else 200,
+            mimetype=content.attachment.content_type,
+        )
+        response.content_length = stop - start
+        if is_partial:
+            response.content_range = ContentRange("bytes", start, stop, size)
+        response.headers["Accept-Ranges"] = "bytes"
+        response.headers.set("Content-Disposition", "attachment", filename=content.attachment.filename)
+        return response
+
+    @access_auth_middleware
+    def delete(self, account_id: str, task_id: str, attachment_id: str) -> ResponseReturnValue:
+        TaskService.delete_task_attachment(
+            params=DeleteTaskAttachmentParams(account_id=account_id, task_id=task_id, attachment_id=attachment_id)
+        )
+
+        return "", 204
+
+    @staticmethod
+    def _generate_file_chunks(stream: IO[bytes], start: int, stop: int) -> Iterator[bytes]:
+        # GridFS seeks to the chunk holding start, so a range never reads the chunks before it
+        try:
+            stream.seek(start)
+            remaining = stop - start
+            while remaining > 0:
+                chunk = stream.read(min(TASK_ATTACHMENT_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            stream.close()
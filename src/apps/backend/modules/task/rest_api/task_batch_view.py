@@ -0,0 +1,66 @@
+from dataclasses import asdict
+
+from flask import jsonify, request
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.application.application_service import ApplicationService
+from modules.application.errors import AppError
+from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.logger.logger import Logger
+from modules.task.constants import MAX_TASK_BATCH_OPERATIONS
+from modules.task.errors import TaskBadRequestError
+from modules.task.task_service import TaskService
+from modules.task.types import TaskBatchOperation, TaskBatchOperationType, TaskBatchParams
+from modules.task.workers.task_attachment_cleanup_worker import TaskAttachmentCleanupWorker
+
+
+class TaskBatchView(MethodView):
+    @access_auth_middleware
+    def post(self, account_id: str) -> ResponseReturnValue:
+        request_data = request.get_json()
+
+        if request_data is None:
+            raise TaskBadRequestError("Request body is required")
+
+        operations_data = request_data.get("operations")
+        if not isinstance(operations_data, list) or not operations_data:
+            raise TaskBadRequestError("Operations must be a non-empty list")
+
+        if len(operations_data) > MAX_TASK_BATCH_OPERATIONS:
+            raise TaskBadRequestError(f"A batch can contain at most {MAX_TASK_BATCH_OPERATIONS} operations")
+
+        ordered = request_data.get("ordered", True)
+        if not isinstance(ordered, bool):
+            raise TaskBadRequestError("Ordered must be a boolean")
+
+        operations = []
+        for index, operation_data in enumerate(operations_data):
+            if not isinstance(operation_data, dict):
+                raise TaskBadRequestError(f"Operation {index} must be an object")
+
+            try:
+                op = TaskBatchOperationType(str(operation_data.get("op")))
+            except ValueError:
+                raise TaskBadRequestError(f"Operation {index} must have op set to one of create, update or delete")
+
+            operations.append(
+                TaskBatchOperation(
+                    op=op,
+                    task_id=operation_data.get("task_id"),
+                    title=operation_data.get("title"),
+                    description=operation_data.get("description"),
+                )
+            )
+
+        batch_params = TaskBatchParams(account_id=account_id, operations=operations, ordered=ordered)
+        batch_result = TaskService.apply_task_batch(params=batch_params)
+
+        # The cleanup finds which of the deleted tasks had attachments, so it runs after any successful delete
+        if any(result.success and result.op == TaskBatchOperationType.DELETE for result in batch_result.results):
+            try:
+                ApplicationService.run_worker_immediately(cls=TaskAttachmentCleanupWorker, arguments=(account_id,))
+            except AppError as e:
+                Logger.error(message=f"Could not start task attachment cleanup for account {account_id}: {e.message}")
+
+        return jsonify(asdict(batch_result)), 200
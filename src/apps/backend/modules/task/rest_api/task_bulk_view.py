@@ -0,0 +1,66 @@
+from dataclasses import asdict
+
+from flask import jsonify, request
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.application.application_service import ApplicationService
+from modules.application.common.types import UNSET
+from modules.application.errors import AppError
+from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.logger.logger import Logger
+from modules.task.errors import TaskBadRequestError
+from modules.task.rest_api.task_request_parser import TaskRequestParser
+from modules.task.task_service import TaskService
+from modules.task.types import TaskBulkActionParams, TaskBulkActionType, TaskPriority, TaskStatus
+from modules.task.workers.task_attachment_cleanup_worker import TaskAttachmentCleanupWorker
+
+
+class TaskBulkView(MethodView):
+    @access_auth_middleware
+    def post(self, account_id: str) -> ResponseReturnValue:
+        request_data = request.get_json()
+
+        if request_data is None:
+            raise TaskBadRequestError("Request body is required")
+
+        try:
+            action = TaskBulkActionType(str(request_data.get("action")))
+        except ValueError:
+            raise TaskBadRequestError("Action must be one of update or delete")
+
+        filter_data = request_data.get("filter")
+        if not isinstance(filter_data, dict):
+            raise TaskBadRequestError("Filter must be an object")
+
+        # An empty filter would act on every task of the account, which is never what a bulk action is for
+        filter_params = TaskRequestParser.parse_filter_params(filter_data)
+        if filter_params is None:
+            raise TaskBadRequestError("Filter must set at least one of status, priority, due_before or due_after")
+
+        changes_data = request_data.get("changes") or {}
+        if not isinstance(changes_data, dict):
+            raise TaskBadRequestError("Changes must be an object")
+
+        bulk_action_params = TaskBulkActionParams(
+            account_id=account_id,
+            action=action,
+            filter_params=filter_params,
+            status=TaskRequestParser.parse_enum(TaskStatus, changes_data.get("status"), "Status"),
+            priority=TaskRequestParser.parse_enum(TaskPriority, changes_data.get("priority"), "Priority"),
+            due_at=(
+                TaskRequestParser.parse_optional_timestamp(changes_data["due_at"], "Due at")
+                if "due_at" in changes_data
+                else UNSET
+            ),
+        )
+        bulk_action_result = TaskService.apply_task_bulk_action(params=bulk_action_params)
+
+        # The cleanup finds which of the deleted tasks had attachments, so it runs after any delete that matched
+        if action == TaskBulkActionType.DELETE and bulk_action_result.modified_count:
+            try:
+                ApplicationService.run_worker_immediately(cls=TaskAttachmentCleanupWorker, arguments=(account_id,))
+            except AppError as e:
+                Logger.error(message=f"Could not start task attachment cleanup for account {account_id}: {e.message}")
+
+        return jsonify(asdict(bulk_action_result)), 200
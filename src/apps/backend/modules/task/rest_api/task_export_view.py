@@ -0,0 +1,52 @@
+import json
+import zlib
+from dataclasses import asdict
+from typing import Iterator
+
+from flask import Response, request, stream_with_context
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.task.constants import TASK_EXPORT_BATCH_SIZE, TASK_EXPORT_CHUNK_SIZE
+from modules.task.task_service import TaskService
+from modules.task.types import ExportTasksParams
+
+
+class TaskExportView(MethodView):
+    @access_auth_middleware
+    def get(self, account_id: str) -> ResponseReturnValue:
+        export_params = ExportTasksParams(account_id=account_id, batch_size=TASK_EXPORT_BATCH_SIZE)
+        use_gzip = request.accept_encodings["gzip"] > 0
+
+        chunks = TaskExportView._generate_ndjson_chunks(export_params)
+        if use_gzip:
+            chunks = TaskExportView._gzip_chunks(chunks)
+
+        response = Response(stream_with_context(chunks), status=200, mimetype="application/x-ndjson")
+        response.headers["Content-Disposition"] = f'attachment; filename="tasks-{account_id}.ndjson"'
+        response.headers["Vary"] = "Accept-Encoding"
+        if use_gzip:
+            response.headers["Content-Encoding"] = "gzip"
+        return response
+
+    @staticmethod
+    def _generate_ndjson_chunks(export_params: ExportTasksParams) -> Iterator[bytes]:
+        buffer = bytearray()
+        for task in TaskService.stream_tasks(params=export_params):
+            buffer += json.dumps(asdict(task)).encode("utf-8") + b"\n"
+            if len(buffer) >= TASK_EXPORT_CHUNK_SIZE:
+                yield bytes(buffer)
+                buffer.clear()
+        if buffer:
+            yield bytes(buffer)
+
+    @staticmethod
+    def _gzip_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+        # wbits=31 writes a gzip header and trailer around the deflate stream
+        compressor = zlib.compressobj(wbits=31)
+        for chunk in chunks:
+            compressed_chunk = compressor.compress(chunk)
+            if compressed_chunk:
+                yield compressed_chunk
+        yield compressor.flush()
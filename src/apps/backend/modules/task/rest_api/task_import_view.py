@@ -0,0 +1,73 @@
+from dataclasses import asdict, replace
+from typing import Optional
+
+from flask import jsonify, request
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.application.application_service import ApplicationService
+from modules.application.errors import AppError
+from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.config.config_service import ConfigService
+from modules.task.errors import TaskBadRequestError
+from modules.task.task_service import TaskService
+from modules.task.types import GetTaskImportParams, ImportTasksParams, StageTaskImportParams, TaskImportFormat
+from modules.task.workers.task_import_worker import TaskImportWorker
+
+
+class TaskImportView(MethodView):
+    @access_auth_middleware
+    def post(self, account_id: str) -> ResponseReturnValue:
+        file_format = TaskImportView._get_import_format()
+        async_threshold_bytes = ConfigService[int].get_value(
+            key="tasks.import.async_threshold_bytes", default=5 * 1024 * 1024
+        )
+
+        # Small uploads are imported while the request streams in, anything larger (or of unknown size) is staged
+        if request.content_length is not None and request.content_length <= async_threshold_bytes:
+            import_params = ImportTasksParams(
+                account_id=account_id,
+                file_format=file_format,
+                stream=request.stream,
+                batch_size=ConfigService[int].get_value(key="tasks.import.batch_size", default=1000),
+            )
+            import_result = TaskService.import_tasks(params=import_params)
+            return jsonify(asdict(import_result)), 200
+
+        task_import = TaskService.stage_task_import(
+            params=StageTaskImportParams(account_id=account_id, file_format=file_format, stream=request.stream)
+        )
+        worker_id = ApplicationService.run_worker_immediately(cls=TaskImportWorker, arguments=(task_import.id,))
+        TaskService.set_task_import_worker(import_id=task_import.id, worker_id=worker_id)
+
+        return jsonify(asdict(replace(task_import, worker_id=worker_id))), 202
+
+    @access_auth_middleware
+    def get(self, account_id: str, import_id: str) -> ResponseReturnValue:
+        task_import = TaskService.get_task_import(
+            params=GetTaskImportParams(account_id=account_id, import_id=import_id)
+        )
+
+        worker_status: Optional[str] = None
+        if task_import.worker_id:
+            try:
+                worker = ApplicationService.get_worker_by_id(worker_id=task_import.worker_id)
+                worker_status = worker.status.name if worker.status else None
+            except AppError:
+                # The progress recorded on the import stays meaningful when Temporal cannot be reached
+                pass
+
+        return jsonify(asdict(replace(task_import, worker_status=worker_status))), 200
+
+    @staticmethod
+    def _get_import_format() -> TaskImportFormat:
+        requested_format = request.args.get("format", "") or {
+            "text/csv": TaskImportFormat.CSV,
+            "application/x-ndjson": TaskImportFormat.NDJSON,
+            "application/jsonl": TaskImportFormat.NDJSON,
+        }.get(request.mimetype, "")
+
+        try:
+            return TaskImportFormat(requested_format)
+        except ValueError:
+            raise TaskBadRequestError("Upload must be text/csv or application/x-ndjson, or set format to csv or ndjson")
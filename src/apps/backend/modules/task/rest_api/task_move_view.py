@@ -0,0 +1,42 @@
+from dataclasses import asdict
+
+from flask import jsonify, request
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.application.application_service import ApplicationService
+from modules.application.errors import AppError
+from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.logger.logger import Logger
+from modules.task.constants import MAX_TASK_POSITION_LENGTH
+from modules.task.errors import TaskBadRequestError
+from modules.task.task_service import TaskService
+from modules.task.types import MoveTaskParams
+from modules.task.workers.task_position_rebalance_worker import TaskPositionRebalanceWorker
+
+
+class TaskMoveView(MethodView):
+    @access_auth_middleware
+    def post(self, account_id: str, task_id: str) -> ResponseReturnValue:
+        request_data = request.get_json()
+
+        if request_data is None:
+            raise TaskBadRequestError("Request body is required")
+
+        move_task_params = MoveTaskParams(
+            account_id=account_id,
+            task_id=task_id,
+            previous_task_id=request_data.get("previous_task_id"),
+            next_task_id=request_data.get("next_task_id"),
+        )
+        moved_task = TaskService.move_task(params=move_task_params)
+
+        # Repeated moves into the same gap lengthen ranks, so the account is respaced in the background
+        if len(moved_task.position) > MAX_TASK_POSITION_LENGTH:
+            try:
+                ApplicationService.run_worker_immediately(cls=TaskPositionRebalanceWorker, arguments=(account_id,))
+            except AppError as e:
+                # The move itself succeeded; a later long rank triggers the rebalance again
+                Logger.error(message=f"Could not start task position rebalance for account {account_id}: {e.message}")
+
+        return jsonify(asdict(moved_task)), 200
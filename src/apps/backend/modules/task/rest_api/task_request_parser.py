@@ -0,0 +1,57 @@
+from datetime import datetime
+from typing import Any, Mapping, Optional, Type, TypeVar
+
+from modules.task.errors import TaskBadRequestError
+from modules.task.types import TaskFilterParams, TaskPriority, TaskStatus
+
+TaskEnum = TypeVar("TaskEnum", TaskStatus, TaskPriority)
+
+
+class TaskRequestParser:
+    @staticmethod
+    def parse_filter_params(values: Mapping[str, Any]) -> Optional[TaskFilterParams]:
+        # Accepts query arguments and JSON bodies alike; blank values count as absent
+        status = values.get("status") or None
+        priority = values.get("priority") or None
+        due_before = values.get("due_before") or None
+        due_after = values.get("due_after") or None
+        if not (status or priority or due_before or due_after):
+            return None
+
+        return TaskFilterParams(
+            status=TaskRequestParser.parse_enum(TaskStatus, status, "Status"),
+            priority=TaskRequestParser.parse_enum(TaskPriority, priority, "Priority"),
+            due_before=TaskRequestParser.parse_optional_timestamp(due_before, "Due before"),
+            due_after=TaskRequestParser.parse_optional_timestamp(due_after, "Due after"),
+        )
+
+    @staticmethod
+    def parse_enum(enum_type: Type[TaskEnum], value: Any, name: str) -> Optional[TaskEnum]:
+        if value is None:
+            return None
+
+        try:
+            return enum_type(value)
+        except ValueError:
+            raise TaskBadRequestError(f"{name} must be one of: {', '.join(member.value for member in enum_type)}")
+
+    @staticmethod
+    def parse_optional_timestamp(timestamp: Any, name: str) -> Optional[datetime]:
+        if timestamp is None:
+            return None
+
+        if not isinstance(timestamp, str):
+            raise TaskBadRequestError(f"{name} must be an ISO 8601 timestamp")
+        return TaskRequestParser.parse_timestamp(timestamp, name)
+
+    @staticmethod
+    def parse_timestamp(timestamp: str, name: str) -> datetime:
+        try:
+            parsed_timestamp = datetime.fromisoformat(timestamp)
+        except ValueError:
+            raise TaskBadRequestError(f"{name} must be an ISO 8601 timestamp")
+
+        # Task timestamps are stored as naive server-local times
+        if parsed_timestamp.tzinfo is not None:
+            parsed_timestamp = parsed_timestamp.astimezone().replace(tzinfo=None)
+        return parsed_timestamp
@@ -0,0 +1,18 @@
+from dataclasses import asdict
+
+from flask import jsonify
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.task.task_service import TaskService
+from modules.task.types import RestoreArchivedTaskParams
+
+
+class TaskRestoreView(MethodView):
+    @access_auth_middleware
+    def post(self, account_id: str, task_id: str) -> ResponseReturnValue:
+        restored_task = TaskService.restore_archived_task(
+            params=RestoreArchivedTaskParams(account_id=account_id, task_id=task_id)
+        )
+        return jsonify(asdict(restored_task)), 200
@@ -1,5 +1,15 @@
 from flask import Blueprint
 
+from modules.task.rest_api.task_activity_view import TaskActivityView
+from modules.task.rest_api.task_attachment_view import TaskAttachmentView
+from modules.task.rest_api.task_batch_view import TaskBatchView
+from modules.task.rest_api.task_bulk_view import TaskBulkView
+from modules.task.rest_api.task_export_view import TaskExportView
+from modules.task.rest_api.task_import_view import TaskImportView
+from modules.task.rest_api.task_move_view import TaskMoveView
+from modules.task.rest_api.task_restore_view import TaskRestoreView
+from modules.task.rest_api.task_search_view import TaskSearchView
+from modules.task.rest_api.task_summary_view import TaskSummaryView
 from modules.task.rest_api.task_view import TaskView
 
 
@@ -9,10 +19,62 @@ class TaskRouter:
         blueprint.add_url_rule(
             "/accounts/<account_id>/tasks", view_func=TaskView.as_view("task_view"), methods=["POST", "GET"]
         )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/export", view_func=TaskExportView.as_view("task_export_view"), methods=["GET"]
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/task-imports",
+            view_func=TaskImportView.as_view("task_import_view"),
+            methods=["POST"],
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/task-imports/<import_id>",
+            view_func=TaskImportView.as_view("task_import_view_by_id"),
+            methods=["GET"],
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/search", view_func=TaskSearchView.as_view("task_search_view"), methods=["GET"]
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/activity",
+            view_func=TaskActivityView.as_view("task_activity_view"),
+            methods=["GET"],
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/summary",
+            view_func=TaskSummaryView.as_view("task_summary_view"),
+            methods=["GET"],
+        )
         blueprint.add_url_rule(
             "/accounts/<account_id>/tasks/<task_id>",
             view_func=TaskView.as_view("task_view_by_id"),
             methods=["GET", "PATCH", "DELETE"],
         )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/<task_id>:move",
+            view_func=TaskMoveView.as_view("task_move_view"),
+            methods=["POST"],
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/<task_id>:restore",
+            view_func=TaskRestoreView.as_view("task_restore_view"),
+            methods=["POST"],
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/<task_id>/attachments",
+            view_func=TaskAttachmentView.as_view("task_attachment_view"),
+            methods=["POST", "GET"],
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks/<task_id>/attachments/<attachment_id>",
+            view_func=TaskAttachmentView.as_view("task_attachment_view_by_id"),
+            methods=["GET", "DELETE"],
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks:batch", view_func=TaskBatchView.as_view("task_batch_view"), methods=["POST"]
+        )
+        blueprint.add_url_rule(
+            "/accounts/<account_id>/tasks:bulk", view_func=TaskBulkView.as_view("task_bulk_view"), methods=["POST"]
+        )
 
         return blueprint
@@ -0,0 +1,37 @@
+from dataclasses import asdict
+
+from flask import jsonify, request
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.application.common.constants import DEFAULT_PAGINATION_PARAMS
+from modules.application.common.types import CursorPaginationParams
+from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.task.errors import TaskBadRequestError
+from modules.task.task_service import TaskService
+from modules.task.types import SearchTasksParams
+
+
+class TaskSearchView(MethodView):
+    @access_auth_middleware
+    def get(self, account_id: str) -> ResponseReturnValue:
+        query = request.args.get("q", "").strip()
+        size = request.args.get("size", type=int)
+
+        if not query:
+            raise TaskBadRequestError("Search query is required")
+
+        if size is not None and size < 1:
+            raise TaskBadRequestError("Size must be greater than 0")
+
+        if size is None:
+            size = DEFAULT_PAGINATION_PARAMS.size
+
+        search_params = SearchTasksParams(
+            account_id=account_id,
+            query=query,
+            cursor_pagination_params=CursorPaginationParams(size=size, cursor=request.args.get("cursor") or None),
+        )
+        search_result = TaskService.search_tasks(params=search_params)
+
+        return jsonify(asdict(search_result)), 200
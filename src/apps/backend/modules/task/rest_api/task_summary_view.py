@@ -0,0 +1,22 @@
+from dataclasses import asdict
+
+from flask import jsonify
+from flask.typing import ResponseReturnValue
+from flask.views import MethodView
+
+from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.config.config_service import ConfigService
+from modules.task.task_service import TaskService
+from modules.task.types import GetTaskSummaryParams
+
+
+class TaskSummaryView(MethodView):
+    @access_auth_middleware
+    def get(self, account_id: str) -> ResponseReturnValue:
+        summary_params = GetTaskSummaryParams(
+            account_id=account_id,
+            cache_ttl_seconds=ConfigService[int].get_value(key="tasks.summary_cache_ttl_seconds", default=60),
+        )
+        task_summary = TaskService.get_task_summary(params=summary_params)
+
+        return jsonify(asdict(task_summary)), 200
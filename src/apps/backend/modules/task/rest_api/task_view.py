@@ -1,22 +1,34 @@
+import hashlib
 from dataclasses import asdict
-from typing import Optional
+from typing import List, Optional
 
-from flask import jsonify, request
+from flask import jsonify, make_response, request
 from flask.typing import ResponseReturnValue
 from flask.views import MethodView
 
+from modules.application.application_service import ApplicationService
 from modules.application.common.constants import DEFAULT_PAGINATION_PARAMS
-from modules.application.common.types import PaginationParams
+from modules.application.common.types import UNSET, CursorPaginationParams, PaginationParams, SortDirection, SortParams
+from modules.application.errors import AppError
 from modules.authentication.rest_api.access_auth_middleware import access_auth_middleware
+from modules.logger.logger import Logger
+from modules.task.constants import DEFAULT_TASK_SORT_PARAMS, MAX_TASK_IDS_PER_REQUEST, TASK_FIELDS, TASK_SORT_FIELDS
 from modules.task.errors import TaskBadRequestError
+from modules.task.rest_api.task_request_parser import TaskRequestParser
 from modules.task.task_service import TaskService
 from modules.task.types import (
     CreateTaskParams,
     DeleteTaskParams,
+    GetCursorPaginatedTasksParams,
     GetPaginatedTasksParams,
+    GetTaskChangesParams,
     GetTaskParams,
+    GetTasksByIdsParams,
+    TaskPriority,
+    TaskStatus,
     UpdateTaskParams,
 )
+from modules.task.workers.task_attachment_cleanup_worker import TaskAttachmentCleanupWorker
 
 
 class TaskView(MethodView):
@@ -34,7 +46,14 @@ class TaskView(MethodView):
             raise TaskBadRequestError("Description is required")
 
         create_task_params = CreateTaskParams(
-            account_id=account_id, title=request_data["title"], description=request_data["description"]
+            account_id=account_id,
+            title=request_data["title"],
+            description=request_data["description"],
+            status=TaskRequestParser.parse_enum(TaskStatus, request_data.get("status"), "Status") or TaskStatus.OPEN,
+            priority=TaskRequestParser.parse_enum(TaskPriority, request_data.get("priority"), "Priority")
+            or TaskPriority.MEDIUM,
+            due_at=TaskRequestParser.parse_optional_timestamp(request_data.get("due_at"), "Due at"),
+            remind_at=TaskRequestParser.parse_optional_timestamp(request_data.get("remind_at"), "Remind at"),
         )
 
         created_task = TaskService.create_task(params=create_task_params)
@@ -44,34 +63,165 @@ class TaskView(MethodView):
 
     @access_auth_middleware
     def get(self, account_id: str, task_id: Optional[str] = None) -> ResponseReturnValue:
+        fields = self._get_requested_fields()
+
         if task_id:
-            task_params = GetTaskParams(account_id=account_id, task_id=task_id)
-            task = TaskService.get_task(params=task_params)
-            task_dict = asdict(task)
-            return jsonify(task_dict), 200
+            return self._get_task_response(account_id, task_id, fields)
+
+        # The version is read before the tasks, so a concurrent write can only leave the ETag older than the body
+        etag = self._build_etag(account_id, str(TaskService.get_task_list_version(account_id=account_id)))
+        if request.if_none_match.contains(etag):
+            response = make_response("", 304)
         else:
-            page = request.args.get("page", type=int)
-            size = request.args.get("size", type=int)
+            response = make_response(self._get_task_list_response(account_id, fields))
+
+        response.set_etag(etag)
+        return response
+
+    @classmethod
+    def _get_task_response(cls, account_id: str, task_id: str, fields: Optional[List[str]]) -> ResponseReturnValue:
+        task_params = GetTaskParams(account_id=account_id, task_id=task_id, fields=fields)
+
+        # Only a conditional request pays for the updated_at read, and a match then skips reading the task body
+        if request.if_none_match:
+            etag = cls._build_etag(task_id, TaskService.get_task_updated_at(params=task_params).isoformat())
+            if request.if_none_match.contains(etag):
+                response = make_response("", 304)
+                response.set_etag(etag)
+                return response
+
+        versioned_task = TaskService.get_versioned_task(params=task_params)
+        task_body = versioned_task.task if isinstance(versioned_task.task, dict) else asdict(versioned_task.task)
+        response = make_response(jsonify(task_body), 200)
+        response.set_etag(cls._build_etag(task_id, versioned_task.updated_at.isoformat()))
+        return response
+
+    @staticmethod
+    def _get_task_list_response(account_id: str, fields: Optional[List[str]]) -> ResponseReturnValue:
+        if "ids" in request.args:
+            if fields:
+                raise TaskBadRequestError("Fields cannot be combined with ids")
+
+            task_ids = [task_id.strip() for task_id in request.args["ids"].split(",") if task_id.strip()]
+            if not task_ids or len(task_ids) > MAX_TASK_IDS_PER_REQUEST:
+                raise TaskBadRequestError(
+                    f"Ids must be a comma separated list of 1 to {MAX_TASK_IDS_PER_REQUEST} task ids"
+                )
+
+            tasks_by_ids_result = TaskService.get_tasks_by_ids(
+                params=GetTasksByIdsParams(account_id=account_id, task_ids=task_ids)
+            )
+            return jsonify(asdict(tasks_by_ids_result)), 200
+
+        page = request.args.get("page", type=int)
+        size = request.args.get("size", type=int)
+
+        if page is not None and page < 1:
+            raise TaskBadRequestError("Page must be greater than 0")
+
+        if size is not None and size < 1:
+            raise TaskBadRequestError("Size must be greater than 0")
+
+        if size is None:
+            size = DEFAULT_PAGINATION_PARAMS.size
 
-            if page is not None and page < 1:
-                raise TaskBadRequestError("Page must be greater than 0")
+        include_total = request.args.get("include_total", "true").lower() != "false"
+        sort_params = TaskView._get_requested_sort_params()
+        filter_params = TaskRequestParser.parse_filter_params(request.args)
 
-            if size is not None and size < 1:
-                raise TaskBadRequestError("Size must be greater than 0")
+        if "updated_since" in request.args:
+            if fields:
+                raise TaskBadRequestError("Fields cannot be combined with updated_since")
+            if filter_params:
+                raise TaskBadRequestError("Filters cannot be combined with updated_since")
 
-            if page is None:
-                page = DEFAULT_PAGINATION_PARAMS.page
-            if size is None:
-                size = DEFAULT_PAGINATION_PARAMS.size
+            task_changes_params = GetTaskChangesParams(
+                account_id=account_id,
+                updated_since=TaskRequestParser.parse_timestamp(request.args["updated_since"], "Updated since"),
+                cursor_pagination_params=CursorPaginationParams(size=size, cursor=request.args.get("cursor") or None),
+            )
+            task_changes_result = TaskService.get_task_changes(params=task_changes_params)
+            return jsonify(asdict(task_changes_result)), 200
 
-            pagination_params = PaginationParams(page=page, size=size, offset=0)
-            tasks_params = GetPaginatedTasksParams(account_id=account_id, pagination_params=pagination_params)
+        # Passing `cursor` (empty for the first page) switches to keyset pagination
+        if "cursor" in request.args:
+            cursor_pagination_params = CursorPaginationParams(size=size, cursor=request.args.get("cursor") or None)
+            cursor_tasks_params = GetCursorPaginatedTasksParams(
+                account_id=account_id,
+                cursor_pagination_params=cursor_pagination_params,
+                sort_params=sort_params,
+                include_total=include_total,
+                fields=fields,
+                filter_params=filter_params,
+            )
+            if fields:
+                cursor_partial_result = TaskService.get_cursor_paginated_partial_tasks(params=cursor_tasks_params)
+                return jsonify(asdict(cursor_partial_result)), 200
+            cursor_pagination_result = TaskService.get_cursor_paginated_tasks(params=cursor_tasks_params)
+            return jsonify(asdict(cursor_pagination_result)), 200
 
-            pagination_result = TaskService.get_paginated_tasks(params=tasks_params)
+        if page is None:
+            page = DEFAULT_PAGINATION_PARAMS.page
 
-            response_data = asdict(pagination_result)
+        pagination_params = PaginationParams(page=page, size=size, offset=0)
+        tasks_params = GetPaginatedTasksParams(
+            account_id=account_id,
+            pagination_params=pagination_params,
+            sort_params=sort_params,
+            include_total=include_total,
+            fields=fields,
+            filter_params=filter_params,
+        )
+
+        if fields:
+            partial_pagination_result = TaskService.get_paginated_partial_tasks(params=tasks_params)
+            return jsonify(asdict(partial_pagination_result)), 200
+
+        pagination_result = TaskService.get_paginated_tasks(params=tasks_params)
+
+        response_data = asdict(pagination_result)
+
+        return jsonify(response_data), 200
+
+    @staticmethod
+    def _get_requested_sort_params() -> Optional[SortParams]:
+        sort_by = request.args.get("sort_by")
+        sort_direction = request.args.get("sort_direction")
+        if sort_by is None and sort_direction is None:
+            return None
+
+        sort_by = sort_by or DEFAULT_TASK_SORT_PARAMS.sort_by
+        if sort_by not in TASK_SORT_FIELDS:
+            raise TaskBadRequestError(f"Sort by must be one of: {', '.join(TASK_SORT_FIELDS)}")
 
-            return jsonify(response_data), 200
+        try:
+            direction = (
+                SortDirection.from_string(sort_direction.lower())
+                if sort_direction
+                else DEFAULT_TASK_SORT_PARAMS.sort_direction
+            )
+        except ValueError:
+            raise TaskBadRequestError("Sort direction must be asc or desc")
+
+        return SortParams(sort_by=sort_by, sort_direction=direction)
+
+    @staticmethod
+    def _build_etag(resource_id: str, version: str) -> str:
+        # The query string is part of the tag because pages, field sets and cursors render different bodies
+        return hashlib.sha256(f"{resource_id}:{version}:{request.query_string.decode()}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _get_requested_fields() -> Optional[List[str]]:
+        fields_param = request.args.get("fields")
+        if not fields_param:
+            return None
+
+        fields = list(dict.fromkeys(field.strip() for field in fields_param.split(",") if field.strip()))
+        unknown_fields = [field for field in fields if field not in TASK_FIELDS]
+        if not fields or unknown_fields:
+            raise TaskBadRequestError(f"Fields must be a comma separated list of: {', '.join(TASK_FIELDS)}")
+
+        return fields
 
     @access_auth_middleware
     def patch(self, account_id: str, task_id: str) -> ResponseReturnValue:
@@ -87,7 +237,22 @@ class TaskView(MethodView):
             raise TaskBadRequestError("Description is required")
 
         update_task_params = UpdateTaskParams(
-            account_id=account_id, task_id=task_id, title=request_data["title"], description=request_data["description"]
+            account_id=account_id,
+            task_id=task_id,
+            title=request_data["title"],
+            description=request_data["description"],
+            status=TaskRequestParser.parse_enum(TaskStatus, request_data.get("status"), "Status"),
+            priority=TaskRequestParser.parse_enum(TaskPriority, request_data.get("priority"), "Priority"),
+            due_at=(
+                TaskRequestParser.parse_optional_timestamp(request_data["due_at"], "Due at")
+                if "due_at" in request_data
+                else UNSET
+            ),
+            remind_at=(
+                TaskRequestParser.parse_optional_timestamp(request_data["remind_at"], "Remind at")
+                if "remind_at" in request_data
+                else UNSET
+            ),
         )
 
         updated_task = TaskService.update_task(params=update_task_params)
@@ -99,6 +264,14 @@ class TaskView(MethodView):
     def delete(self, account_id: str, task_id: str) -> ResponseReturnValue:
         delete_params = DeleteTaskParams(account_id=account_id, task_id=task_id)
 
-        TaskService.delete_task(params=delete_params)
+        deletion_result = TaskService.delete_task(params=delete_params)
+
+        # Files can be large, so they are removed in the background rather than within the request
+        if deletion_result.attachment_count:
+            try:
+                ApplicationService.run_worker_immediately(cls=TaskAttachmentCleanupWorker, arguments=(account_id,))
+            except AppError as e:
+                # The task is deleted; its attachments are picked up by the next cleanup of the account
+                Logger.error(message=f"Could not start task attachment cleanup for account {account_id}: {e.message}")
 
         return "", 204
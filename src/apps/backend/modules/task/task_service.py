@@ -1,14 +1,66 @@
-from modules.application.common.types import PaginationResult
+from datetime import datetime
+from typing import Iterator, List
+
+from modules.application.common.types import CursorPaginationResult, PaginationResult
+from modules.task.internal.task_activity_reader import TaskActivityReader
+from modules.task.internal.task_archival_writer import TaskArchivalWriter
+from modules.task.internal.task_attachment_reader import TaskAttachmentReader
+from modules.task.internal.task_attachment_writer import TaskAttachmentWriter
+from modules.task.internal.task_counter_reader import TaskCounterReader
+from modules.task.internal.task_counter_writer import TaskCounterWriter
+from modules.task.internal.task_import_reader import TaskImportReader
+from modules.task.internal.task_import_writer import TaskImportWriter
+from modules.task.internal.task_position_writer import TaskPositionWriter
 from modules.task.internal.task_reader import TaskReader
+from modules.task.internal.task_reminder_writer import TaskReminderWriter
+from modules.task.internal.task_summary_reader import TaskSummaryReader
 from modules.task.internal.task_writer import TaskWriter
 from modules.task.types import (
+    ArchiveInactiveTasksParams,
     CreateTaskParams,
+    DeleteTaskAttachmentParams,
     DeleteTaskParams,
+    DispatchTaskRemindersParams,
+    ExportTasksParams,
+    GetCursorPaginatedTasksParams,
     GetPaginatedTasksParams,
+    GetTaskActivityParams,
+    GetTaskAttachmentParams,
+    GetTaskAttachmentsParams,
+    GetTaskChangesParams,
+    GetTaskImportParams,
     GetTaskParams,
+    GetTasksByIdsParams,
+    GetTaskSummaryParams,
+    ImportTasksParams,
+    MoveTaskParams,
+    PartialTask,
+    RestoreArchivedTaskParams,
+    RunTaskImportParams,
+    SearchTasksParams,
+    StageTaskImportParams,
     Task,
+    TaskActivityEvent,
+    TaskArchivalBatchResult,
+    TaskAttachment,
+    TaskAttachmentCleanupResult,
+    TaskAttachmentContent,
+    TaskBatchParams,
+    TaskBatchResult,
+    TaskBulkActionParams,
+    TaskBulkActionResult,
+    TaskChange,
+    TaskCounterRepairResult,
     TaskDeletionResult,
+    TaskImport,
+    TaskImportResult,
+    TaskPositionRebalanceResult,
+    TaskReminderDispatchResult,
+    TasksByIdsResult,
+    TaskSummary,
     UpdateTaskParams,
+    UploadTaskAttachmentParams,
+    VersionedTask,
 )
 
 
@@ -21,14 +73,140 @@ class TaskService:
     def get_task(*, params: GetTaskParams) -> Task:
         return TaskReader.get_task(params=params)
 
+    @staticmethod
+    def get_task_updated_at(*, params: GetTaskParams) -> datetime:
+        return TaskReader.get_task_updated_at(params=params)
+
+    @staticmethod
+    def get_versioned_task(*, params: GetTaskParams) -> VersionedTask:
+        return TaskReader.get_versioned_task(params=params)
+
+    @staticmethod
+    def get_task_list_version(*, account_id: str) -> int:
+        return TaskCounterReader.get_task_version(account_id=account_id)
+
+    @staticmethod
+    def get_partial_task(*, params: GetTaskParams) -> PartialTask:
+        return TaskReader.get_partial_task(params=params)
+
+    @staticmethod
+    def get_tasks_by_ids(*, params: GetTasksByIdsParams) -> TasksByIdsResult:
+        return TaskReader.get_tasks_by_ids(params=params)
+
     @staticmethod
     def get_paginated_tasks(*, params: GetPaginatedTasksParams) -> PaginationResult[Task]:
         return TaskReader.get_paginated_tasks(params=params)
 
+    @staticmethod
+    def get_paginated_partial_tasks(*, params: GetPaginatedTasksParams) -> PaginationResult[PartialTask]:
+        return TaskReader.get_paginated_partial_tasks(params=params)
+
+    @staticmethod
+    def get_cursor_paginated_tasks(*, params: GetCursorPaginatedTasksParams) -> CursorPaginationResult[Task]:
+        return TaskReader.get_cursor_paginated_tasks(params=params)
+
+    @staticmethod
+    def get_cursor_paginated_partial_tasks(
+        *, params: GetCursorPaginatedTasksParams
+    ) -> CursorPaginationResult[PartialTask]:
+        return TaskReader.get_cursor_paginated_partial_tasks(params=params)
+
+    @staticmethod
+    def get_task_changes(*, params: GetTaskChangesParams) -> CursorPaginationResult[TaskChange]:
+        return TaskReader.get_task_changes(params=params)
+
+    @staticmethod
+    def stream_tasks(*, params: ExportTasksParams) -> Iterator[Task]:
+        return TaskReader.stream_tasks(params=params)
+
+    @staticmethod
+    def search_tasks(*, params: SearchTasksParams) -> CursorPaginationResult[Task]:
+        return TaskReader.search_tasks(params=params)
+
+    @staticmethod
+    def get_task_summary(*, params: GetTaskSummaryParams) -> TaskSummary:
+        return TaskSummaryReader.get_task_summary(params=params)
+
     @staticmethod
     def update_task(*, params: UpdateTaskParams) -> Task:
         return TaskWriter.update_task(params=params)
 
+    @staticmethod
+    def move_task(*, params: MoveTaskParams) -> Task:
+        return TaskPositionWriter.move_task(params=params)
+
+    @staticmethod
+    def rebalance_task_positions(*, account_id: str) -> TaskPositionRebalanceResult:
+        return TaskPositionWriter.rebalance_task_positions(account_id=account_id)
+
     @staticmethod
     def delete_task(*, params: DeleteTaskParams) -> TaskDeletionResult:
         return TaskWriter.delete_task(params=params)
+
+    @staticmethod
+    def apply_task_batch(*, params: TaskBatchParams) -> TaskBatchResult:
+        return TaskWriter.apply_task_batch(params=params)
+
+    @staticmethod
+    def apply_task_bulk_action(*, params: TaskBulkActionParams) -> TaskBulkActionResult:
+        return TaskWriter.apply_task_bulk_action(params=params)
+
+    @staticmethod
+    def repair_task_counters(*, batch_size: int) -> TaskCounterRepairResult:
+        return TaskCounterWriter.repair_task_counters(batch_size=batch_size)
+
+    @staticmethod
+    def dispatch_due_task_reminders(*, params: DispatchTaskRemindersParams) -> TaskReminderDispatchResult:
+        return TaskReminderWriter.dispatch_due_task_reminders(params=params)
+
+    @staticmethod
+    def archive_inactive_tasks_batch(*, params: ArchiveInactiveTasksParams) -> TaskArchivalBatchResult:
+        return TaskArchivalWriter.archive_inactive_tasks_batch(params=params)
+
+    @staticmethod
+    def restore_archived_task(*, params: RestoreArchivedTaskParams) -> Task:
+        return TaskArchivalWriter.restore_archived_task(params=params)
+
+    @staticmethod
+    def import_tasks(*, params: ImportTasksParams) -> TaskImportResult:
+        return TaskImportWriter.import_tasks(params=params)
+
+    @staticmethod
+    def stage_task_import(*, params: StageTaskImportParams) -> TaskImport:
+        return TaskImportWriter.stage_task_import(params=params)
+
+    @staticmethod
+    def set_task_import_worker(*, import_id: str, worker_id: str) -> None:
+        return TaskImportWriter.set_task_import_worker(import_id=import_id, worker_id=worker_id)
+
+    @staticmethod
+    def run_task_import(*, params: RunTaskImportParams) -> TaskImport:
+        return TaskImportWriter.run_task_import(params=params)
+
+    @staticmethod
+    def get_task_import(*, params: GetTaskImportParams) -> TaskImport:
+        return TaskImportReader.get_task_import(params=params)
+
+    @staticmethod
+    def upload_task_attachment(*, params: UploadTaskAttachmentParams) -> TaskAttachment:
+        return TaskAttachmentWriter.upload_task_attachment(params=params)
+
+    @staticmethod
+    def get_task_attachments(*, params: GetTaskAttachmentsParams) -> List[TaskAttachment]:
+        return TaskAttachmentReader.get_task_attachments(params=params)
+
+    @staticmethod
+    def open_task_attachment(*, params: GetTaskAttachmentParams) -> TaskAttachmentContent:
+        return TaskAttachmentReader.open_task_attachment(params=params)
+
+    @staticmethod
+    def delete_task_attachment(*, params: DeleteTaskAttachmentParams) -> None:
+        return TaskAttachmentWriter.delete_task_attachment(params=params)
+
+    @staticmethod
+    def delete_orphaned_task_attachments(*, account_id: str) -> TaskAttachmentCleanupResult:
+        return TaskAttachmentWriter.delete_orphaned_task_attachments(account_id=account_id)
+
+    @staticmethod
+    def get_task_activity(*, params: GetTaskActivityParams) -> CursorPaginationResult[TaskActivityEvent]:
+        return TaskActivityReader.get_task_activity(params=params)
@@ -1,8 +1,26 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from enum import StrEnum
+from typing import IO, Any, Dict, List, Optional, Union
 
-from modules.application.common.types import PaginationParams, PaginationResult, SortParams
+from modules.application.common.types import (
+    UNSET,
+    CursorPaginationParams,
+    PaginationParams,
+    PaginationResult,
+    SortParams,
+)
+
+
+class TaskStatus(StrEnum):
+    OPEN = "open"
+    DONE = "done"
+
+
+class TaskPriority(StrEnum):
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
 
 
 @dataclass(frozen=True)
@@ -11,12 +29,40 @@ class Task:
     account_id: str
     description: str
     title: str
+    status: TaskStatus = TaskStatus.OPEN
+    priority: TaskPriority = TaskPriority.MEDIUM
+    # ISO 8601, in the same format the list accepts for `due_before` and `due_after`
+    due_at: Optional[str] = None
+    remind_at: Optional[str] = None
+    # Manual order rank; tasks sort by it as plain strings
+    position: str = ""
+    attachment_count: int = 0
+
+
+# A task restricted to the fields requested by the client; fields that were not requested are absent
+PartialTask = Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class VersionedTask:
+    # A partial task when fields were requested, the full task otherwise
+    task: Union[Task, PartialTask]
+    updated_at: datetime
 
 
 @dataclass(frozen=True)
 class GetTaskParams:
     account_id: str
     task_id: str
+    fields: Optional[List[str]] = None
+
+
+@dataclass(frozen=True)
+class TaskFilterParams:
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    due_before: Optional[datetime] = None
+    due_after: Optional[datetime] = None
 
 
 @dataclass(frozen=True)
@@ -24,6 +70,76 @@ class GetPaginatedTasksParams:
     account_id: str
     pagination_params: PaginationParams
     sort_params: Optional[SortParams] = None
+    include_total: bool = True
+    fields: Optional[List[str]] = None
+    filter_params: Optional[TaskFilterParams] = None
+
+
+@dataclass(frozen=True)
+class GetCursorPaginatedTasksParams:
+    account_id: str
+    cursor_pagination_params: CursorPaginationParams
+    sort_params: Optional[SortParams] = None
+    include_total: bool = True
+    fields: Optional[List[str]] = None
+    filter_params: Optional[TaskFilterParams] = None
+
+
+@dataclass(frozen=True)
+class GetTasksByIdsParams:
+    account_id: str
+    task_ids: List[str]
+
+
+@dataclass(frozen=True)
+class TasksByIdsResult:
+    items: List[Task]
+    missing_ids: List[str]
+
+
+@dataclass(frozen=True)
+class GetTaskChangesParams:
+    account_id: str
+    updated_since: datetime
+    cursor_pagination_params: CursorPaginationParams
+
+
+@dataclass(frozen=True)
+class TaskChange:
+    task_id: str
+    active: bool
+    # ISO 8601 with microseconds, so clients can pass it back as `updated_since` without losing precision
+    updated_at: str
+    task: Optional[Task] = None
+
+
+@dataclass(frozen=True)
+class ExportTasksParams:
+    account_id: str
+    batch_size: int
+
+
+@dataclass(frozen=True)
+class SearchTasksParams:
+    account_id: str
+    query: str
+    cursor_pagination_params: CursorPaginationParams
+
+
+@dataclass(frozen=True)
+class GetTaskSummaryParams:
+    account_id: str
+    cache_ttl_seconds: int
+
+
+@dataclass(frozen=True)
+class TaskSummary:
+    total_count: int
+    status_counts: Dict[str, int]
+    overdue_count: int
+    recently_updated: List[Task]
+    # ISO 8601; overdue counts are as of this time, since the summary may be served from cache
+    generated_at: str
 
 
 @dataclass(frozen=True)
@@ -31,6 +147,10 @@ class CreateTaskParams:
     account_id: str
     description: str
     title: str
+    status: TaskStatus = TaskStatus.OPEN
+    priority: TaskPriority = TaskPriority.MEDIUM
+    due_at: Optional[datetime] = None
+    remind_at: Optional[datetime] = None
 
 
 @dataclass(frozen=True)
@@ -39,6 +159,27 @@ class UpdateTaskParams:
     task_id: str
     description: str
     title: str
+    # Left as None the current value is kept
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    # UNSET keeps the current due date or reminder, None clears it
+    due_at: Optional[datetime] | object = UNSET
+    remind_at: Optional[datetime] | object = UNSET
+
+
+@dataclass(frozen=True)
+class MoveTaskParams:
+    account_id: str
+    task_id: str
+    # The task ends up between these two; either may be left out to move it to the start or end of the list
+    previous_task_id: Optional[str] = None
+    next_task_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TaskPositionRebalanceResult:
+    account_id: str
+    rebalanced_count: int
 
 
 @dataclass(frozen=True)
@@ -52,9 +193,268 @@ class TaskDeletionResult:
     task_id: str
     deleted_at: datetime
     success: bool
+    attachment_count: int = 0
+
+
+class TaskBulkActionType(StrEnum):
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+@dataclass(frozen=True)
+class TaskBulkActionParams:
+    account_id: str
+    action: TaskBulkActionType
+    filter_params: TaskFilterParams
+    # Fields set on every matching task by an update; left as None or UNSET they are not changed
+    status: Optional[TaskStatus] = None
+    priority: Optional[TaskPriority] = None
+    due_at: Optional[datetime] | object = UNSET
+
+
+@dataclass(frozen=True)
+class TaskBulkActionResult:
+    matched_count: int
+    modified_count: int
+
+
+class TaskBatchOperationType(StrEnum):
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+@dataclass(frozen=True)
+class TaskBatchOperation:
+    op: TaskBatchOperationType
+    task_id: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TaskBatchParams:
+    account_id: str
+    operations: List[TaskBatchOperation]
+    ordered: bool = True
+
+
+@dataclass(frozen=True)
+class TaskBatchOperationError:
+    code: str
+    message: str
+
+
+@dataclass(frozen=True)
+class TaskBatchOperationResult:
+    index: int
+    op: TaskBatchOperationType
+    success: bool
+    task_id: Optional[str] = None
+    task: Optional[Task] = None
+    error: Optional[TaskBatchOperationError] = None
+
+
+@dataclass(frozen=True)
+class TaskBatchResult:
+    results: List[TaskBatchOperationResult]
+
+
+@dataclass(frozen=True)
+class TaskCounterRepairResult:
+    repaired_counters: int
+    started_at: datetime
+
+
+@dataclass(frozen=True)
+class ArchiveInactiveTasksParams:
+    min_age_days: int
+    batch_size: int
+
+
+@dataclass(frozen=True)
+class DispatchTaskRemindersParams:
+    batch_size: int
+    # How long a claimed reminder stays hidden from other workers; one that is never completed is retried after it
+    lease_seconds: int
+
+
+@dataclass(frozen=True)
+class TaskReminderDispatchResult:
+    claimed_count: int
+    sent_count: int
+    skipped_count: int
+    # Reminders whose email failed to send; they keep their lease and are claimed again once it expires
+    failed_count: int = 0
+
+
+@dataclass(frozen=True)
+class TaskArchivalBatchResult:
+    archived_count: int
+    completed: bool
+
+
+@dataclass(frozen=True)
+class RestoreArchivedTaskParams:
+    account_id: str
+    task_id: str
+
+
+class TaskImportFormat(StrEnum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class TaskImportStatus(StrEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class TaskImportRowError:
+    row: int
+    message: str
+
+
+@dataclass(frozen=True)
+class ImportTasksParams:
+    account_id: str
+    file_format: TaskImportFormat
+    stream: IO[bytes]
+    batch_size: int
+
+
+@dataclass(frozen=True)
+class TaskImportResult:
+    processed_rows: int
+    imported_count: int
+    failed_count: int
+    errors: List[TaskImportRowError]
+
+
+@dataclass(frozen=True)
+class StageTaskImportParams:
+    account_id: str
+    file_format: TaskImportFormat
+    stream: IO[bytes]
+
+
+@dataclass(frozen=True)
+class RunTaskImportParams:
+    import_id: str
+    batch_size: int
+    # A running import with no progress saved for this long is treated as abandoned by its worker
+    lease_seconds: int
+
+
+@dataclass(frozen=True)
+class GetTaskImportParams:
+    account_id: str
+    import_id: str
+
+
+@dataclass(frozen=True)
+class TaskImport:
+    id: str
+    account_id: str
+    status: TaskImportStatus
+    file_format: TaskImportFormat
+    processed_rows: int
+    imported_count: int
+    failed_count: int
+    errors: List[TaskImportRowError]
+    failure_reason: Optional[str] = None
+    worker_id: Optional[str] = None
+    worker_status: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class TaskAttachment:
+    id: str
+    account_id: str
+    task_id: str
+    filename: str
+    content_type: str
+    size: int
+    created_at: str
+
+
+@dataclass(frozen=True)
+class TaskAttachmentContent:
+    attachment: TaskAttachment
+    # Seekable and read chunk by chunk; the caller closes it
+    stream: IO[bytes]
+
+
+@dataclass(frozen=True)
+class UploadTaskAttachmentParams:
+    account_id: str
+    task_id: str
+    filename: str
+    content_type: str
+    stream: IO[bytes]
+    max_size_bytes: int
+
+
+@dataclass(frozen=True)
+class GetTaskAttachmentsParams:
+    account_id: str
+    task_id: str
+
+
+@dataclass(frozen=True)
+class GetTaskAttachmentParams:
+    account_id: str
+    task_id: str
+    attachment_id: str
+
+
+@dataclass(frozen=True)
+class DeleteTaskAttachmentParams:
+    account_id: str
+    task_id: str
+    attachment_id: str
+
+
+@dataclass(frozen=True)
+class TaskAttachmentCleanupResult:
+    account_id: str
+    deleted_count: int
+
+
+class TaskActivityAction(StrEnum):
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    MOVED = "moved"
+    BULK_UPDATED = "bulk_updated"
+    BULK_DELETED = "bulk_deleted"
+    RESTORED = "restored"
+
+
+@dataclass(frozen=True)
+class TaskActivityEvent:
+    action: TaskActivityAction
+    occurred_at: str
+    # Not set for bulk actions, which record one event for all the tasks they changed
+    task_id: Optional[str] = None
+    fields: List[str] = field(default_factory=list)
+    task_count: int = 1
+
+
+@dataclass(frozen=True)
+class GetTaskActivityParams:
+    account_id: str
+    cursor_pagination_params: CursorPaginationParams
 
 
 @dataclass(frozen=True)
 class TaskErrorCode:
     NOT_FOUND: str = "TASK_ERR_01"
     BAD_REQUEST: str = "TASK_ERR_02"
+    IMPORT_NOT_FOUND: str = "TASK_ERR_03"
+    ATTACHMENT_NOT_FOUND: str = "TASK_ERR_04"
+    ATTACHMENT_TOO_LARGE: str = "TASK_ERR_05"
+    CHANGES_EXPIRED: str = "TASK_ERR_06"
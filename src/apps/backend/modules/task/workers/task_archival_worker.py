@@ -0,0 +1,35 @@
+import asyncio
+from typing import Any
+
+from modules.application.types import BaseWorker
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.task.task_service import TaskService
+from modules.task.types import ArchiveInactiveTasksParams
+
+
+class TaskArchivalWorker(BaseWorker):
+    max_execution_time_in_seconds = 3600
+    max_retries = 1
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        archive_params = ArchiveInactiveTasksParams(
+            min_age_days=ConfigService[int].get_value(key="tasks.archival.min_age_days", default=30),
+            batch_size=ConfigService[int].get_value(key="tasks.archival.batch_size", default=500),
+        )
+        throttle_ms = ConfigService[int].get_value(key="tasks.archival.throttle_ms", default=200)
+
+        archived_count = 0
+        while True:
+            result = TaskService.archive_inactive_tasks_batch(params=archive_params)
+            archived_count += result.archived_count
+            if result.completed:
+                break
+            # Pause between batches so archival does not compete with request traffic for the primary
+            await asyncio.sleep(throttle_ms / 1000)
+
+        Logger.info(message=f"Archived {archived_count} soft-deleted task(s)")
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
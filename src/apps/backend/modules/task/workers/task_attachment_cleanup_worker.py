@@ -0,0 +1,22 @@
+from typing import Any
+
+from modules.application.types import BaseWorker
+from modules.logger.logger import Logger
+from modules.task.task_service import TaskService
+
+
+class TaskAttachmentCleanupWorker(BaseWorker):
+    max_execution_time_in_seconds = 600
+    max_retries = 3
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        account_id = args[0]
+        result = TaskService.delete_orphaned_task_attachments(account_id=account_id)
+        if result.deleted_count:
+            Logger.info(
+                message=f"Deleted {result.deleted_count} attachment(s) of deleted tasks for account {account_id}"
+            )
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
@@ -0,0 +1,20 @@
+from typing import Any
+
+from modules.application.types import BaseWorker
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.task.task_service import TaskService
+
+
+class TaskCounterRepairWorker(BaseWorker):
+    max_execution_time_in_seconds = 1800
+    max_retries = 1
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        batch_size = ConfigService[int].get_value(key="tasks.counter_repair_batch_size", default=500)
+        result = TaskService.repair_task_counters(batch_size=batch_size)
+        Logger.info(message=f"Repaired {result.repaired_counters} task counter(s) in batches of {batch_size}")
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
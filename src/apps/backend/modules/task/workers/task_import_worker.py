@@ -0,0 +1,28 @@
+from typing import Any
+
+from modules.application.types import BaseWorker
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.task.task_service import TaskService
+from modules.task.types import RunTaskImportParams
+
+
+class TaskImportWorker(BaseWorker):
+    max_execution_time_in_seconds = 3600
+    max_retries = 1
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        import_id = args[0]
+        batch_size = ConfigService[int].get_value(key="tasks.import.batch_size", default=1000)
+        lease_seconds = ConfigService[int].get_value(key="tasks.import.lease_seconds", default=600)
+        task_import = TaskService.run_task_import(
+            params=RunTaskImportParams(import_id=import_id, batch_size=batch_size, lease_seconds=lease_seconds)
+        )
+        Logger.info(
+            message=f"Task import {import_id} {task_import.status}: {task_import.imported_count} imported, "
+            f"{task_import.failed_count} failed"
+        )
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
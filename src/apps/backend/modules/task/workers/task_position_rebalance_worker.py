@@ -0,0 +1,19 @@
+from typing import Any
+
+from modules.application.types import BaseWorker
+from modules.logger.logger import Logger
+from modules.task.task_service import TaskService
+
+
+class TaskPositionRebalanceWorker(BaseWorker):
+    max_execution_time_in_seconds = 600
+    max_retries = 3
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        account_id = args[0]
+        result = TaskService.rebalance_task_positions(account_id=account_id)
+        Logger.info(message=f"Rebalanced {result.rebalanced_count} task position(s) for account {account_id}")
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
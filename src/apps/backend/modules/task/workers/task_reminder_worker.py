@@ -0,0 +1,38 @@
+from typing import Any
+
+from modules.application.types import BaseWorker
+from modules.config.config_service import ConfigService
+from modules.logger.logger import Logger
+from modules.task.task_service import TaskService
+from modules.task.types import DispatchTaskRemindersParams
+
+
+class TaskReminderWorker(BaseWorker):
+    max_execution_time_in_seconds = 300
+    max_retries = 1
+
+    @staticmethod
+    async def execute(*args: Any) -> None:
+        dispatch_params = DispatchTaskRemindersParams(
+            batch_size=ConfigService[int].get_value(key="tasks.reminders.batch_size", default=500),
+            lease_seconds=ConfigService[int].get_value(key="tasks.reminders.lease_seconds", default=300),
+        )
+        max_batches = ConfigService[int].get_value(key="tasks.reminders.max_batches_per_run", default=100)
+
+        # Reminders are claimed atomically, so overlapping runs or several workers split the due reminders between them
+        claimed_count, sent_count, failed_count = 0, 0, 0
+        for _ in range(max_batches):
+            result = TaskService.dispatch_due_task_reminders(params=dispatch_params)
+            claimed_count += result.claimed_count
+            sent_count += result.sent_count
+            failed_count += result.failed_count
+            if result.claimed_count < dispatch_params.batch_size:
+                break
+
+        if claimed_count:
+            Logger.info(
+                message=f"Dispatched {claimed_count} task reminder(s), {sent_count} sent, {failed_count} failed to send"
+            )
+
+    async def run(self, *args: Any) -> None:
+        await super().run(*args)
@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import List
+
+from pymongo import UpdateOne
+
+from modules.logger.logger import Logger
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_position_util import TaskPositionUtil
+from modules.task.types import TaskPriority, TaskStatus
+
+# Tasks created before status and priority existed read back with the defaults, but the filtered lists match on the
+# stored values, so the defaults are written once for every task that lacks them
+TASK_FIELD_DEFAULTS = {"status": str(TaskStatus.OPEN), "priority": str(TaskPriority.MEDIUM)}
+POSITION_BATCH_SIZE = 1000
+
+
+def backfill_positions() -> None:
+    # Ranked by creation time, the same as tasks created today, so the existing order of each list is kept
+    backfilled_count = 0
+    pending_updates: List[UpdateOne] = []
+    for task_bson in TaskRepository.collection().find({"position": {"$exists": False}}, {"created_at": 1}):
+        position = TaskPositionUtil.get_position_for_time(task_bson.get("created_at") or datetime.now())
+        pending_updates.append(UpdateOne({"_id": task_bson["_id"]}, {"$set": {"position": position}}))
+        if len(pending_updates) == POSITION_BATCH_SIZE:
+            backfilled_count += TaskRepository.collection().bulk_write(pending_updates, ordered=False).modified_count
+            pending_updates = []
+    if pending_updates:
+        backfilled_count += TaskRepository.collection().bulk_write(pending_updates, ordered=False).modified_count
+    Logger.info(message=f"Backfilled position on {backfilled_count} tasks")
+
+
+def run() -> None:
+    for field_name, default_value in TASK_FIELD_DEFAULTS.items():
+        result = TaskRepository.collection().update_many(
+            {field_name: {"$exists": False}}, {"$set": {field_name: default_value}}
+        )
+        Logger.info(message=f"Backfilled {field_name}={default_value} on {result.modified_count} tasks")
+    backfill_positions()
+
+
+if __name__ == "__main__":
+    run()
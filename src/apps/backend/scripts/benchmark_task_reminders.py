@@ -0,0 +1,111 @@
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+from unittest import mock
+
+from bson.objectid import ObjectId
+
+from modules.logger.logger import Logger
+from modules.notification.notification_service import NotificationService
+from modules.notification.types import SendEmailsForAccountsParams, SendEmailsResult
+from modules.task.internal.store.task_reminder_repository import TaskReminderRepository
+from modules.task.task_service import TaskService
+from modules.task.types import DispatchTaskRemindersParams
+
+INSERT_BATCH_SIZE = 10_000
+# Backlog sizes at which dispatch lag is measured; the last one is raised to --reminders
+BACKLOG_CHECKPOINTS = [10_000, 100_000]
+
+
+def seed_future_reminders(account_id: str, count: int) -> None:
+    # Pending reminders spread over the next month, all of them in the index but none due during the run
+    now = datetime.now()
+    batch: List[Dict[str, Any]] = []
+    for _ in range(count):
+        batch.append(
+            {
+                "_id": ObjectId(),
+                "account_id": account_id,
+                "created_at": now,
+                "remind_at": now + timedelta(hours=1, seconds=random.randrange(30 * 24 * 3600)),
+            }
+        )
+        if len(batch) == INSERT_BATCH_SIZE:
+            TaskReminderRepository.collection().insert_many(batch, ordered=False)
+            batch = []
+    if batch:
+        TaskReminderRepository.collection().insert_many(batch, ordered=False)
+
+
+def measure_wave(account_id: str, due_count: int, dispatch_params: DispatchTaskRemindersParams) -> List[float]:
+    """
+    Makes due_count reminders come due at once and dispatches until none is left, returning each reminder's lag in
+    milliseconds between coming due and being claimed.
+    """
+    due_at = datetime.now()
+    TaskReminderRepository.collection().insert_many(
+        [
+            {"_id": ObjectId(), "account_id": account_id, "created_at": due_at, "remind_at": due_at}
+            for _ in range(due_count)
+        ],
+        ordered=False,
+    )
+
+    lags_ms: List[float] = []
+    while True:
+        result = TaskService.dispatch_due_task_reminders(params=dispatch_params)
+        lag_ms = (datetime.now() - due_at).total_seconds() * 1000
+        lags_ms.extend([lag_ms] * result.claimed_count)
+        if result.claimed_count < dispatch_params.batch_size:
+            return lags_ms
+
+
+def log_lags(label: str, lags_ms: List[float]) -> None:
+    lags_ms = sorted(lags_ms)
+    p95 = lags_ms[max(0, int(len(lags_ms) * 0.95) - 1)]
+    Logger.info(message=f"{label}: reminders={len(lags_ms)} median={statistics.median(lags_ms):.1f}ms p95={p95:.1f}ms")
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark task reminder dispatch lag against a growing backlog")
+    parser.add_argument("--reminders", type=int, default=1_000_000, help="pending reminders at the last checkpoint")
+    parser.add_argument("--waves", type=int, default=20, help="waves of due reminders measured per checkpoint")
+    parser.add_argument("--due-per-wave", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded reminders after the run")
+    args = parser.parse_args()
+
+    account_id = f"benchmark-{ObjectId()}"
+    dispatch_params = DispatchTaskRemindersParams(batch_size=args.batch_size, lease_seconds=300)
+    checkpoints = [checkpoint for checkpoint in BACKLOG_CHECKPOINTS if checkpoint < args.reminders] + [args.reminders]
+
+    def send_nothing(*, params: SendEmailsForAccountsParams) -> SendEmailsResult:
+        # The reminders point at no task, so nothing would be sent anyway; this keeps the benchmark offline for sure
+        return SendEmailsResult(sent_count=0, skipped_count=len(params.emails))
+
+    try:
+        with mock.patch.object(NotificationService, "send_emails_for_accounts", side_effect=send_nothing):
+            seeded_count = 0
+            for checkpoint in checkpoints:
+                Logger.info(message=f"Seeding pending reminders up to {checkpoint}")
+                seed_future_reminders(account_id, checkpoint - seeded_count)
+                seeded_count = checkpoint
+
+                started = time.perf_counter()
+                lags_ms: List[float] = []
+                for _ in range(args.waves):
+                    lags_ms.extend(measure_wave(account_id, args.due_per_wave, dispatch_params))
+                elapsed = time.perf_counter() - started
+
+                log_lags(f"Backlog {checkpoint}", lags_ms)
+                Logger.info(message=f"Backlog {checkpoint}: throughput={len(lags_ms) / elapsed:.0f} reminders/s")
+    finally:
+        if not args.keep:
+            TaskReminderRepository.collection().delete_many({"account_id": account_id})
+
+
+if __name__ == "__main__":
+    run()
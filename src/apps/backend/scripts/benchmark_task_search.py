@@ -0,0 +1,114 @@
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from bson.objectid import ObjectId
+
+from modules.application.common.types import CursorPaginationParams
+from modules.logger.logger import Logger
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.task_service import TaskService
+from modules.task.types import SearchTasksParams
+
+# fmt: off
+WORDS = [
+    "alpha", "budget", "client", "deploy", "estimate", "feedback", "groceries", "hiring", "invoice", "journal",
+    "kickoff", "launch", "meeting", "newsletter", "onboarding", "payroll", "quarterly", "release", "sprint", "taxes",
+    "upgrade", "vendor", "workshop", "yearly", "zoning",
+]
+# fmt: on
+INSERT_BATCH_SIZE = 5000
+# Each ticket token appears in task_count / TICKET_COUNT titles, giving selective queries next to the broad ones
+TICKET_COUNT = 1000
+
+
+def seed_tasks(account_id: str, task_count: int) -> None:
+    started_at = datetime.now()
+    batch: List[Dict[str, Any]] = []
+    for index in range(task_count):
+        created_at = started_at - timedelta(seconds=index)
+        batch.append(
+            {
+                "account_id": account_id,
+                "active": True,
+                "created_at": created_at,
+                "description": " ".join(random.choices(WORDS, k=30)),
+                "title": " ".join(random.choices(WORDS, k=4) + [f"ticket{index % TICKET_COUNT}"]),
+                "updated_at": created_at,
+            }
+        )
+        if len(batch) == INSERT_BATCH_SIZE:
+            TaskRepository.collection().insert_many(batch, ordered=False)
+            batch = []
+    if batch:
+        TaskRepository.collection().insert_many(batch, ordered=False)
+
+
+def time_search(account_id: str, query: str, page_size: int, cursor: Optional[str]) -> tuple[float, Optional[str]]:
+    search_params = SearchTasksParams(
+        account_id=account_id,
+        query=query,
+        cursor_pagination_params=CursorPaginationParams(size=page_size, cursor=cursor),
+    )
+    started = time.perf_counter()
+    result = TaskService.search_tasks(params=search_params)
+    return (time.perf_counter() - started) * 1000, result.next_cursor
+
+
+def log_latencies(label: str, latencies_ms: List[float]) -> None:
+    latencies_ms = sorted(latencies_ms)
+    p95 = latencies_ms[max(0, int(len(latencies_ms) * 0.95) - 1)]
+    Logger.info(
+        message=f"{label}: runs={len(latencies_ms)} median={statistics.median(latencies_ms):.1f}ms p95={p95:.1f}ms"
+    )
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark task full-text search against a large seeded account")
+    parser.add_argument("--tasks", type=int, default=100_000, help="number of tasks to seed for the benchmark account")
+    parser.add_argument("--queries", type=int, default=50, help="number of search queries to time")
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded tasks after the run")
+    args = parser.parse_args()
+
+    account_id = f"benchmark-{ObjectId()}"
+    Logger.info(message=f"Seeding {args.tasks} tasks for {account_id}")
+    seed_tasks(account_id, args.tasks)
+    # Noise in another account must not be scanned by an account-scoped search
+    noise_account_id = f"benchmark-noise-{ObjectId()}"
+    seed_tasks(noise_account_id, min(args.tasks, 10_000))
+
+    try:
+        winning_plan = (
+            TaskRepository.collection()
+            .find({"account_id": account_id, "active": True, "$text": {"$search": WORDS[0]}})
+            .explain()["queryPlanner"]["winningPlan"]
+        )
+        Logger.info(message=f"Winning plan: {winning_plan}")
+
+        queries = {
+            "Selective query": [f"ticket{random.randrange(TICKET_COUNT)}" for _ in range(args.queries)],
+            "Broad query": [random.choice(WORDS) for _ in range(args.queries)],
+        }
+        for label, query_terms in queries.items():
+            first_page_latencies, second_page_latencies = [], []
+            for query in query_terms:
+                first_page_ms, next_cursor = time_search(account_id, query, args.page_size, None)
+                first_page_latencies.append(first_page_ms)
+                if next_cursor:
+                    second_page_ms, _ = time_search(account_id, query, args.page_size, next_cursor)
+                    second_page_latencies.append(second_page_ms)
+
+            log_latencies(f"{label}, first page", first_page_latencies)
+            if second_page_latencies:
+                log_latencies(f"{label}, second page", second_page_latencies)
+    finally:
+        if not args.keep:
+            TaskRepository.collection().delete_many({"account_id": {"$in": [account_id, noise_account_id]}})
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,42 @@
+import argparse
+import os
+import sys
+
+from modules.account.account_service import AccountService
+from modules.account.types import ProvisionAccountsParams
+from modules.application.password_hasher import PasswordHasher
+from modules.logger.logger import Logger
+
+
+def run() -> None:
+    parser = argparse.ArgumentParser(
+        description="Create accounts from NDJSON, one {username, password, first_name, last_name} object per line"
+    )
+    parser.add_argument("--file", help="NDJSON file to read, standard input when omitted")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--processes", type=int, default=os.cpu_count() or 1, help="processes hashing passwords in parallel"
+    )
+    args = parser.parse_args()
+
+    PasswordHasher.set_pool_size(pool_size=args.processes)
+    stream = open(args.file, "rb") if args.file else sys.stdin.buffer
+    try:
+        result = AccountService.provision_accounts(
+            params=ProvisionAccountsParams(stream=stream, batch_size=args.batch_size)
+        )
+    finally:
+        if args.file:
+            stream.close()
+
+    for row_error in result.errors:
+        Logger.error(message=f"Row {row_error.row} ({row_error.username or 'no username'}): {row_error.message}")
+    if result.failed_count > len(result.errors):
+        Logger.error(message=f"{result.failed_count - len(result.errors)} more rows failed")
+    Logger.info(
+        message=f"Provisioned {result.created_count} of {result.processed_rows} accounts, {result.failed_count} failed"
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -14,6 +14,9 @@ from modules.config.config_service import ConfigService
 from modules.logger.logger import Logger
 from modules.logger.logger_manager import LoggerManager
 from modules.task.rest_api.task_rest_api_server import TaskRestApiServer
+from modules.task.workers.task_archival_worker import TaskArchivalWorker
+from modules.task.workers.task_counter_repair_worker import TaskCounterRepairWorker
+from modules.task.workers.task_reminder_worker import TaskReminderWorker
 from scripts.bootstrap_app import BootstrapApp
 
 load_dotenv()
@@ -35,6 +38,15 @@ try:
     # In production, it is optional to run this worker
     ApplicationService.schedule_worker_as_cron(cls=HealthCheckWorker, cron_schedule="*/10 * * * *")
 
+    # Correct any drift in the per-account task counters once a night
+    ApplicationService.schedule_worker_as_cron(cls=TaskCounterRepairWorker, cron_schedule="0 3 * * *")
+
+    # Move old soft-deleted tasks out of the hot collection, resuming any run that was cut short
+    ApplicationService.schedule_worker_as_cron(cls=TaskArchivalWorker, cron_schedule="30 3 * * *")
+
+    # Send task reminders that have come due since the previous run
+    ApplicationService.schedule_worker_as_cron(cls=TaskReminderWorker, cron_schedule="* * * * *")
+
 except WorkerClientConnectionError as e:
     Logger.critical(message=e.message)
 
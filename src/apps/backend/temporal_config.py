@@ -4,10 +4,24 @@ from temporalio import activity, workflow
 
 from modules.application.types import BaseWorker, RegisteredWorker
 from modules.application.workers.health_check_worker import HealthCheckWorker
+from modules.task.workers.task_archival_worker import TaskArchivalWorker
+from modules.task.workers.task_attachment_cleanup_worker import TaskAttachmentCleanupWorker
+from modules.task.workers.task_counter_repair_worker import TaskCounterRepairWorker
+from modules.task.workers.task_import_worker import TaskImportWorker
+from modules.task.workers.task_position_rebalance_worker import TaskPositionRebalanceWorker
+from modules.task.workers.task_reminder_worker import TaskReminderWorker
 
 
 class TemporalConfig:
-    WORKERS: List[Type[BaseWorker]] = [HealthCheckWorker]
+    WORKERS: List[Type[BaseWorker]] = [
+        HealthCheckWorker,
+        TaskCounterRepairWorker,
+        TaskArchivalWorker,
+        TaskImportWorker,
+        TaskReminderWorker,
+        TaskPositionRebalanceWorker,
+        TaskAttachmentCleanupWorker,
+    ]
 
     REGISTERED_WORKERS: List[RegisteredWorker] = []
 
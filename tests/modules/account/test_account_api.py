@@ -8,6 +8,7 @@ from server import app
 from modules.account.account_service import AccountService
 from modules.account.types import (
     AccountErrorCode,
+    AccountSearchParams,
     CreateAccountByPhoneNumberParams,
     CreateAccountByUsernameAndPasswordParams,
     PhoneNumber,
@@ -19,6 +20,8 @@ from tests.modules.account.base_test_account import BaseTestAccount
 
 ACCOUNT_URL = "http://127.0.0.1:8080/api/accounts"
 HEADERS = {"Content-Type": "application/json"}
+ACCOUNT_PROVISIONING_URL = f"{ACCOUNT_URL}:provision"
+ADMIN_HEADERS = {"Content-Type": "application/x-ndjson", "X-Admin-Api-Key": "test-admin-api-key"}
 
 
 class TestAccountApi(BaseTestAccount):
@@ -441,3 +444,49 @@ class TestAccountApi(BaseTestAccount):
             )
 
             assert response.status_code == 500
+
+    def test_provision_accounts(self) -> None:
+        AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="taken@example.com"
+            )
+        )
+        rows = [
+            {"username": "first@example.com", "password": "password", "first_name": "First", "last_name": "User"},
+            {"username": "taken@example.com", "password": "password"},
+            {"username": "second@example.com"},
+            {"username": "second@example.com", "password": "password"},
+            {"username": "second@example.com", "password": "password"},
+        ]
+        data = "\n".join(json.dumps(row) for row in rows) + "\nnot json\n"
+
+        with app.test_client() as client:
+            response = client.post(ACCOUNT_PROVISIONING_URL, headers=ADMIN_HEADERS, data=data)
+
+        assert response.status_code == 200
+        assert response.json
+        assert response.json["processed_rows"] == 6
+        assert response.json["created_count"] == 2
+        assert response.json["failed_count"] == 4
+        assert sorted(error["row"] for error in response.json["errors"]) == [2, 3, 5, 6]
+
+        account = AccountService.get_account_by_username(username="first@example.com")
+        assert account.first_name == "First"
+        assert AccountService.get_account_by_username_and_password(
+            params=AccountSearchParams(username="second@example.com", password="password")
+        )
+        assert AccountService.get_account_notification_preferences_by_account_id(account_id=account.id).email_enabled
+
+    def test_provision_accounts_requires_admin_api_key(self) -> None:
+        data = json.dumps({"username": "first@example.com", "password": "password"})
+
+        with app.test_client() as client:
+            missing_key_response = client.post(
+                ACCOUNT_PROVISIONING_URL, headers={"Content-Type": "application/x-ndjson"}, data=data
+            )
+            wrong_key_response = client.post(
+                ACCOUNT_PROVISIONING_URL, headers={**ADMIN_HEADERS, "X-Admin-Api-Key": "wrong"}, data=data
+            )
+
+        assert missing_key_response.status_code == 401
+        assert wrong_key_response.status_code == 401
@@ -1,18 +1,33 @@
 from datetime import datetime
-from unittest.mock import patch
+from typing import Any
+from unittest.mock import MagicMock, patch
 
+from bson.objectid import ObjectId
+from pymongo.errors import OperationFailure
 from server import app
 
 from modules.account.account_service import AccountService
-from modules.account.errors import AccountNotFoundError, AccountWithIdNotFoundError
+from modules.account.errors import (
+    AccountInvalidPasswordError,
+    AccountNotFoundError,
+    AccountWithIdNotFoundError,
+    AccountWithPhoneNumberExistsError,
+    AccountWithUserNameExistsError,
+)
+from modules.account.internal.account_cache import AccountCache
+from modules.account.internal.account_util import AccountUtil
+from modules.account.internal.account_writer import AccountWriter
+from modules.account.internal.store.account_repository import AccountRepository
 from modules.account.types import (
     AccountErrorCode,
     AccountSearchByIdParams,
+    AccountSearchParams,
     CreateAccountByPhoneNumberParams,
     CreateAccountByUsernameAndPasswordParams,
     PhoneNumber,
     UpdateAccountProfileParams,
 )
+from modules.application.repository import ApplicationRepositoryClient
 from modules.authentication.types import AccessTokenPayload
 from tests.modules.account.base_test_account import BaseTestAccount
 
@@ -29,6 +44,54 @@ class TestAccountService(BaseTestAccount):
         assert account.first_name == "first_name"
         assert account.last_name == "last_name"
 
+    def test_create_account_by_username_and_password_is_a_single_insert(self) -> None:
+        ApplicationRepositoryClient.command_counter.reset()
+
+        AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                password="password", username="username", first_name="first_name", last_name="last_name"
+            )
+        )
+
+        assert ApplicationRepositoryClient.command_counter.count(collection_name="accounts") == 1
+        assert ApplicationRepositoryClient.command_counter.count(collection_name="accounts", command_name="insert") == 1
+
+    def test_create_account_by_username_and_password_round_trip_budget(self) -> None:
+        ApplicationRepositoryClient.command_counter.reset()
+
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                password="password", username="username", first_name="first_name", last_name="last_name"
+            )
+        )
+
+        assert ApplicationRepositoryClient.command_counter.count() <= 2
+        assert AccountService.get_account_notification_preferences_by_account_id(account_id=account.id).email_enabled
+
+    def test_create_account_with_existing_username_raises(self) -> None:
+        params = CreateAccountByUsernameAndPasswordParams(
+            password="password", username="username", first_name="first_name", last_name="last_name"
+        )
+        AccountService.create_account_by_username_and_password(params=params)
+
+        try:
+            AccountService.create_account_by_username_and_password(params=params)
+            assert False, "Expected AccountWithUserNameExistsError to be raised"
+        except AccountWithUserNameExistsError as exc:
+            assert exc.code == AccountErrorCode.USERNAME_ALREADY_EXISTS
+
+    def test_create_account_with_existing_phone_number_raises(self) -> None:
+        params = CreateAccountByPhoneNumberParams(
+            phone_number=PhoneNumber(country_code="+91", phone_number="9999999999")
+        )
+        AccountWriter.create_account_by_phone_number(params=params)
+
+        try:
+            AccountWriter.create_account_by_phone_number(params=params)
+            assert False, "Expected AccountWithPhoneNumberExistsError to be raised"
+        except AccountWithPhoneNumberExistsError as exc:
+            assert exc.code == AccountErrorCode.PHONE_NUMBER_ALREADY_EXISTS
+
     @patch("modules.authentication.authentication_service.AuthenticationService.verify_access_token")
     def test_get_account_by_id(self, mock_verify_access_token) -> None:
         account = AccountService.create_account_by_username_and_password(
@@ -295,3 +358,133 @@ class TestAccountService(BaseTestAccount):
         assert new_account.id != original_account.id
         assert new_account.phone_number.country_code == "+91"
         assert new_account.phone_number.phone_number == "9999999999"
+
+    def test_get_account_by_id_is_served_from_cache(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        AccountService.get_account_by_id(params=AccountSearchByIdParams(id=account.id))
+        hit_count = AccountService.get_account_cache_metrics().hit_count
+
+        ApplicationRepositoryClient.command_counter.reset()
+        cached_account = AccountService.get_account_by_id(params=AccountSearchByIdParams(id=account.id))
+        cached_account_by_username = AccountService.get_account_by_username(username=account.username)
+
+        assert cached_account.id == account.id
+        assert cached_account_by_username.id == account.id
+        assert ApplicationRepositoryClient.command_counter.count(collection_name="accounts") == 0
+        assert AccountService.get_account_cache_metrics().hit_count == hit_count + 2
+
+    def test_update_account_profile_invalidates_cached_account(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        AccountService.get_account_by_id(params=AccountSearchByIdParams(id=account.id))
+
+        AccountService.update_account_profile(
+            account_id=account.id, params=UpdateAccountProfileParams(first_name="Updated")
+        )
+
+        assert AccountService.get_account_by_id(params=AccountSearchByIdParams(id=account.id)).first_name == "Updated"
+        assert AccountService.get_account_by_username(username=account.username).first_name == "Updated"
+
+    def test_delete_account_invalidates_cached_account(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        AccountService.get_account_by_id(params=AccountSearchByIdParams(id=account.id))
+        AccountService.get_account_by_username(username=account.username)
+
+        AccountService.delete_account(account_id=account.id)
+
+        for get_account in (
+            lambda: AccountService.get_account_by_id(params=AccountSearchByIdParams(id=account.id)),
+            lambda: AccountService.get_account_by_username(username=account.username),
+        ):
+            try:
+                get_account()
+                assert False, "Expected AccountNotFoundError to be raised"
+            except AccountNotFoundError as exc:
+                assert exc.code == AccountErrorCode.NOT_FOUND
+
+    def test_revalidate_drops_accounts_written_by_another_process(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        other_account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="other_username"
+            )
+        )
+        AccountService.get_account_by_id(params=AccountSearchByIdParams(id=account.id))
+        AccountService.get_account_by_id(params=AccountSearchByIdParams(id=other_account.id))
+        stale_count = AccountService.get_account_cache_metrics().stale_count
+
+        # Written straight to the collection, so this process' cache is never told about them
+        AccountRepository.collection().update_one(
+            {"_id": ObjectId(account.id)}, {"$set": {"first_name": "Updated"}, "$inc": {"version": 1}}
+        )
+        AccountRepository.collection().update_one(
+            {"_id": ObjectId(other_account.id)}, {"$set": {"active": False}, "$inc": {"version": 1}}
+        )
+        assert (
+            AccountService.get_account_by_id(params=AccountSearchByIdParams(id=account.id)).first_name == "first_name"
+        )
+
+        ApplicationRepositoryClient.command_counter.reset()
+        AccountCache.revalidate()
+
+        assert ApplicationRepositoryClient.command_counter.count(collection_name="accounts") == 1
+        assert AccountService.get_account_cache_metrics().stale_count == stale_count + 2
+        assert AccountService.get_account_by_id(params=AccountSearchByIdParams(id=account.id)).first_name == "Updated"
+        with self.assertRaises(AccountNotFoundError):
+            AccountService.get_account_by_username(username=other_account.username)
+
+    def test_get_account_by_username_and_password_does_not_use_cache(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+        AccountService.get_account_by_username(username=account.username)
+
+        AccountRepository.collection().update_one(
+            {"_id": ObjectId(account.id)},
+            {"$set": {"hashed_password": AccountUtil.hash_password(password="new_password")}},
+        )
+
+        try:
+            AccountService.get_account_by_username_and_password(
+                params=AccountSearchParams(username=account.username, password="password")
+            )
+            assert False, "Expected AccountInvalidPasswordError to be raised"
+        except AccountInvalidPasswordError:
+            pass
+        assert (
+            AccountService.get_account_by_username_and_password(
+                params=AccountSearchParams(username=account.username, password="new_password")
+            ).id
+            == account.id
+        )
+
+    def test_unique_index_build_failure_is_raised(self) -> None:
+        def create_index(*args: Any, **kwargs: Any) -> str:
+            if kwargs.get("unique"):
+                raise OperationFailure("E11000 duplicate key error", code=11000)
+            return kwargs.get("name", "")
+
+        collection = MagicMock()
+        collection.create_index.side_effect = create_index
+
+        with self.assertRaises(OperationFailure) as context:
+            AccountRepository.on_init_collection(collection)
+        assert context.exception.code == 11000
+        collection.database.command.assert_not_called()
@@ -1,13 +1,12 @@
 from modules.account.account_service import AccountService
 from modules.account.types import (
-    CreateAccountByUsernameAndPasswordParams,
     CreateAccountByPhoneNumberParams,
+    CreateAccountByUsernameAndPasswordParams,
     PhoneNumber,
 )
-from modules.notification.errors import AccountNotificationPreferencesNotFoundError
+from modules.application.repository import ApplicationRepositoryClient
 from modules.notification.notification_service import NotificationService
 from modules.notification.types import CreateOrUpdateAccountNotificationPreferencesParams
-
 from tests.modules.account.base_test_account import BaseTestAccount
 
 
@@ -211,3 +210,22 @@ class TestNotificationPreferencesService(BaseTestAccount):
         assert preferences.email_enabled is True
         assert preferences.push_enabled is True
         assert preferences.sms_enabled is True
+
+    def test_first_partial_update_stores_defaults_for_other_preferences_in_one_command(self) -> None:
+        account = AccountService.create_account_by_username_and_password(
+            params=CreateAccountByUsernameAndPasswordParams(
+                first_name="first_name", last_name="last_name", password="password", username="username"
+            )
+        )
+
+        ApplicationRepositoryClient.command_counter.reset()
+        preferences = NotificationService.create_or_update_account_notification_preferences(
+            account_id=account.id, preferences=CreateOrUpdateAccountNotificationPreferencesParams(sms_enabled=False)
+        )
+
+        assert (
+            ApplicationRepositoryClient.command_counter.count(collection_name="account_notification_preferences") == 1
+        )
+        assert preferences.email_enabled is True
+        assert preferences.push_enabled is True
+        assert preferences.sms_enabled is False
@@ -0,0 +1,79 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+from unittest import mock
+
+import pytest
+
+from modules.application.application_service import ApplicationService
+from modules.application.errors import PasswordHasherErrorCode, PasswordHasherUnavailableError
+from modules.application.password_hasher import PasswordHasher
+from tests.modules.application.base_test_application import BaseTestApplication
+
+
+class TestPasswordHasher(BaseTestApplication):
+    def test_hash_and_compare_password(self) -> None:
+        hashed_password = PasswordHasher.hash_password(password="correct horse")
+
+        assert hashed_password != "correct horse"
+        assert PasswordHasher.compare_password(password="correct horse", hashed_password=hashed_password)
+        assert not PasswordHasher.compare_password(password="wrong horse", hashed_password=hashed_password)
+
+    def test_hash_passwords_keeps_input_order(self) -> None:
+        passwords = [f"password-{index}" for index in range(5)]
+
+        hashed_passwords = PasswordHasher.hash_passwords(passwords=passwords)
+
+        assert len(hashed_passwords) == len(passwords)
+        for password, hashed_password in zip(passwords, hashed_passwords):
+            assert PasswordHasher.compare_password(password=password, hashed_password=hashed_password)
+
+    def test_metrics_record_completed_work(self) -> None:
+        completed_count_before = ApplicationService.get_password_hasher_metrics().completed_count
+
+        PasswordHasher.hash_password(password="secret")
+
+        metrics = ApplicationService.get_password_hasher_metrics()
+        assert metrics.completed_count == completed_count_before + 1
+        assert metrics.in_flight_count == 0
+        assert metrics.hash_seconds_max > 0
+
+    def test_work_beyond_queue_depth_is_rejected(self) -> None:
+        rejected_count_before = ApplicationService.get_password_hasher_metrics().rejected_count
+
+        # A negative depth leaves no room even for the pool's own processes, so nothing is submitted
+        with mock.patch.object(PasswordHasher, "_get_max_queue_depth", return_value=-PasswordHasher._get_pool_size()):
+            with pytest.raises(PasswordHasherUnavailableError) as exc_info:
+                PasswordHasher.hash_password(password="secret")
+
+        assert exc_info.value.code == PasswordHasherErrorCode.UNAVAILABLE
+        assert exc_info.value.http_code == 503
+        assert ApplicationService.get_password_hasher_metrics().rejected_count == rejected_count_before + 1
+
+    def test_timed_out_work_holds_its_slot_until_it_finishes(self) -> None:
+        release = threading.Event()
+
+        def wait_for_release() -> Tuple[str, float, float]:
+            release.wait()
+            return "done", time.time(), 0.0
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        in_flight_count_before = ApplicationService.get_password_hasher_metrics().in_flight_count
+
+        with (
+            mock.patch.object(PasswordHasher, "_get_executor", return_value=executor),
+            mock.patch.object(PasswordHasher, "_get_timeout_seconds", return_value=0.05),
+        ):
+            # The first call's work starts running; the second's is still queued behind it when its caller gives up
+            with pytest.raises(PasswordHasherUnavailableError):
+                PasswordHasher._run(wait_for_release)
+            with pytest.raises(PasswordHasherUnavailableError):
+                PasswordHasher._run(wait_for_release)
+
+        assert ApplicationService.get_password_hasher_metrics().in_flight_count == in_flight_count_before + 1
+
+        release.set()
+        executor.shutdown(wait=True)
+
+        assert ApplicationService.get_password_hasher_metrics().in_flight_count == in_flight_count_before
@@ -1,6 +1,7 @@
 import unittest
 from typing import Callable
 
+from modules.account.internal.account_cache import AccountCache
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.authentication.internals.otp.store.otp_repository import OTPRepository
 from modules.authentication.rest_api.authentication_rest_api_server import AuthenticationRestApiServer
@@ -14,4 +15,5 @@ class BaseTestAccessToken(unittest.TestCase):
     def teardown_method(self, method: Callable) -> None:
         print(f"Executed:: {method.__name__}")
         AccountRepository.collection().delete_many({})
+        AccountCache.clear()
         OTPRepository.collection().delete_many({})
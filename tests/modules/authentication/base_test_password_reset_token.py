@@ -1,6 +1,7 @@
 import unittest
 from typing import Callable
 
+from modules.account.internal.account_cache import AccountCache
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.authentication.internals.password_reset_token.store.password_reset_token_repository import (
     PasswordResetTokenRepository,
@@ -16,4 +17,5 @@ class BaseTestPasswordResetToken(unittest.TestCase):
     def teardown_method(self, method: Callable) -> None:
         print(f"Executed:: {method.__name__}")
         AccountRepository.collection().delete_many({})
+        AccountCache.clear()
         PasswordResetTokenRepository.collection().delete_many({})
@@ -1,12 +1,20 @@
 import json
 import unittest
-from typing import Tuple
+from typing import Optional, Tuple
 
 from server import app
 from modules.account.account_service import AccountService
+from modules.account.internal.account_cache import AccountCache
 from modules.account.internal.store.account_repository import AccountRepository
 from modules.account.types import CreateAccountByUsernameAndPasswordParams, Account
 from modules.logger.logger_manager import LoggerManager
+from modules.task.internal.store.task_activity_bucket_repository import TaskActivityBucketRepository
+from modules.task.internal.store.task_archival_checkpoint_repository import TaskArchivalCheckpointRepository
+from modules.task.internal.store.task_archive_repository import TaskArchiveRepository
+from modules.task.internal.store.task_attachment_repository import TaskAttachmentRepository
+from modules.task.internal.store.task_counter_repository import TaskCounterRepository
+from modules.task.internal.store.task_import_repository import TaskImportRepository
+from modules.task.internal.store.task_reminder_repository import TaskReminderRepository
 from modules.task.internal.store.task_repository import TaskRepository
 from modules.task.rest_api.task_rest_api_server import TaskRestApiServer
 from modules.task.task_service import TaskService
@@ -30,7 +38,19 @@ class BaseTestTask(unittest.TestCase):
 
     def tearDown(self) -> None:
         TaskRepository.collection().delete_many({})
+        TaskCounterRepository.collection().delete_many({})
+        TaskArchiveRepository.collection().delete_many({})
+        TaskArchivalCheckpointRepository.collection().delete_many({})
+        for staged_file in TaskImportRepository.file_bucket().find():
+            TaskImportRepository.file_bucket().delete(staged_file._id)
+        TaskImportRepository.collection().delete_many({})
+        TaskReminderRepository.collection().delete_many({})
+        for attachment_file in TaskAttachmentRepository.file_bucket().find():
+            TaskAttachmentRepository.file_bucket().delete(attachment_file._id)
+        TaskAttachmentRepository.collection().delete_many({})
+        TaskActivityBucketRepository.collection().delete_many({})
         AccountRepository.collection().delete_many({})
+        AccountCache.clear()
 
     # URL HELPER METHODS
 
@@ -40,6 +60,18 @@ class BaseTestTask(unittest.TestCase):
     def get_task_by_id_api_url(self, account_id: str, task_id: str) -> str:
         return f"http://127.0.0.1:8080/api/accounts/{account_id}/tasks/{task_id}"
 
+    def get_task_batch_api_url(self, account_id: str) -> str:
+        return f"http://127.0.0.1:8080/api/accounts/{account_id}/tasks:batch"
+
+    def get_task_bulk_api_url(self, account_id: str) -> str:
+        return f"http://127.0.0.1:8080/api/accounts/{account_id}/tasks:bulk"
+
+    def get_task_attachments_api_url(self, account_id: str, task_id: str) -> str:
+        return f"http://127.0.0.1:8080/api/accounts/{account_id}/tasks/{task_id}/attachments"
+
+    def get_task_import_api_url(self, account_id: str) -> str:
+        return f"http://127.0.0.1:8080/api/accounts/{account_id}/task-imports"
+
     # ACCOUNT AND TOKEN HELPER METHODS
 
     def create_test_account(
@@ -116,6 +148,32 @@ class BaseTestTask(unittest.TestCase):
             elif method.upper() == "DELETE":
                 return client.delete(url, headers={"Authorization": f"Bearer {token}"})
 
+    def make_batch_request(self, account_id: str, token: str, data: dict = None):
+        headers = {**self.HEADERS, "Authorization": f"Bearer {token}"}
+
+        with app.test_client() as client:
+            return client.post(
+                self.get_task_batch_api_url(account_id),
+                headers=headers,
+                data=json.dumps(data) if data is not None else None,
+            )
+
+    def make_bulk_request(self, account_id: str, token: str, data: dict = None):
+        headers = {**self.HEADERS, "Authorization": f"Bearer {token}"}
+
+        with app.test_client() as client:
+            return client.post(
+                self.get_task_bulk_api_url(account_id),
+                headers=headers,
+                data=json.dumps(data) if data is not None else None,
+            )
+
+    def make_import_request(self, account_id: str, token: str, data: bytes, content_type: str):
+        headers = {"Authorization": f"Bearer {token}", "Content-Type": content_type}
+
+        with app.test_client() as client:
+            return client.post(self.get_task_import_api_url(account_id), headers=headers, data=data)
+
     def make_unauthenticated_request(self, method: str, account_id: str, task_id: str = None, data: dict = None):
         if task_id:
             url = self.get_task_by_id_api_url(account_id, task_id)
@@ -154,6 +212,21 @@ class BaseTestTask(unittest.TestCase):
 
     # ASSERTION HELPER METHODS
 
+    def get_plan_stages(self, plan: dict) -> list[str]:
+        stages = [plan["stage"]]
+        for child_plan in [plan.get("inputStage"), *plan.get("inputStages", [])]:
+            if child_plan:
+                stages.extend(self.get_plan_stages(child_plan))
+        return stages
+
+    def get_index_scan(self, plan: dict) -> Optional[dict]:
+        if plan["stage"] == "IXSCAN":
+            return plan
+        for child_plan in [plan.get("inputStage"), *plan.get("inputStages", [])]:
+            if child_plan and (index_scan := self.get_index_scan(child_plan)):
+                return index_scan
+        return None
+
     def assert_task_response(self, response_json: dict, expected_task: Task = None, **expected_fields):
         assert response_json.get("id") is not None
         assert response_json.get("account_id") is not None
@@ -1,7 +1,15 @@
+import gzip
+import json
+from datetime import datetime, timedelta
+
+from bson.objectid import ObjectId
 from server import app
 
+from modules.application.repository import ApplicationRepositoryClient
 from modules.authentication.types import AccessTokenErrorCode
-from modules.task.types import TaskErrorCode
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.task_service import TaskService
+from modules.task.types import ArchiveInactiveTasksParams, DeleteTaskParams, TaskErrorCode
 from tests.modules.task.base_test_task import BaseTestTask
 
 
@@ -106,6 +114,191 @@ class TestTaskApi(BaseTestTask):
 
         assert response1.json["items"][0]["id"] != response2.json["items"][0]["id"]
 
+    def test_get_all_tasks_without_total(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=2)
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="include_total=false")
+
+        assert response.status_code == 200
+        assert len(response.json["items"]) == 2
+        assert response.json["total_count"] is None
+        assert response.json["total_pages"] is None
+
+    def test_get_all_tasks_with_cursor_pagination(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=3)
+
+        response1 = self.make_authenticated_request("GET", account.id, token, query_params="cursor=&size=2")
+
+        assert response1.status_code == 200
+        assert [item["title"] for item in response1.json["items"]] == ["Task 3", "Task 2"]
+        assert response1.json["next_cursor"] is not None
+
+        response2 = self.make_authenticated_request(
+            "GET", account.id, token, query_params=f"cursor={response1.json['next_cursor']}&size=2"
+        )
+
+        assert response2.status_code == 200
+        assert [item["title"] for item in response2.json["items"]] == ["Task 1"]
+        assert response2.json["next_cursor"] is None
+
+    def test_get_all_tasks_with_invalid_cursor(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="cursor=invalid")
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_get_all_tasks_conditional_get(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_test_task(account_id=account.id)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        with app.test_client() as client:
+            first_response = client.get(self.get_task_api_url(account.id), headers=headers)
+            etag = first_response.headers["ETag"]
+            not_modified_response = client.get(
+                self.get_task_api_url(account.id), headers={**headers, "If-None-Match": etag}
+            )
+            self.create_test_task(account_id=account.id, title="Another Task")
+            modified_response = client.get(
+                self.get_task_api_url(account.id), headers={**headers, "If-None-Match": etag}
+            )
+
+        assert first_response.status_code == 200
+        assert not_modified_response.status_code == 304
+        assert not_modified_response.data == b""
+        assert modified_response.status_code == 200
+        assert modified_response.headers["ETag"] != etag
+        assert modified_response.json["total_count"] == 2
+
+    def test_get_all_tasks_updated_since(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_test_task(account_id=account.id, title="Old Task")
+        first_sync_response = self.make_authenticated_request(
+            "GET", account.id, token, query_params="updated_since=2000-01-01T00:00:00"
+        )
+        last_synced_at = first_sync_response.json["items"][-1]["updated_at"]
+        self.create_test_task(account_id=account.id, title="New Task")
+
+        response = self.make_authenticated_request(
+            "GET", account.id, token, query_params=f"updated_since={last_synced_at}"
+        )
+
+        assert response.status_code == 200
+        assert [item["task"]["title"] for item in response.json["items"]] == ["Old Task", "New Task"]
+
+    def test_get_all_tasks_invalid_updated_since(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="updated_since=yesterday")
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_get_all_tasks_sorted(self) -> None:
+        account, token = self.create_account_and_get_token()
+        for title in ["Banana", "Apple", "Cherry"]:
+            self.create_test_task(account_id=account.id, title=title)
+
+        response = self.make_authenticated_request(
+            "GET", account.id, token, query_params="sort_by=title&sort_direction=asc"
+        )
+
+        assert response.status_code == 200
+        assert [item["title"] for item in response.json["items"]] == ["Apple", "Banana", "Cherry"]
+
+    def test_get_all_tasks_unsupported_sort(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="sort_by=description")
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_get_all_tasks_filtered_by_status(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_test_task(account_id=account.id, title="Open task")
+        done_task_data = {
+            "title": "Done task",
+            "description": self.DEFAULT_TASK_DESCRIPTION,
+            "status": "done",
+            "priority": "high",
+            "due_at": "2030-01-01T09:00:00",
+        }
+        create_response = self.make_authenticated_request("POST", account.id, token, data=done_task_data)
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="status=done")
+
+        assert create_response.status_code == 201
+        assert response.status_code == 200
+        assert [item["title"] for item in response.json["items"]] == ["Done task"]
+        assert response.json["items"][0]["priority"] == "high"
+        assert response.json["items"][0]["due_at"] == "2030-01-01T09:00:00"
+        assert response.json["total_count"] == 1
+
+    def test_get_all_tasks_invalid_filter(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="status=archived")
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+        assert "Status must be one of" in response.json.get("message")
+
+    def test_move_task(self) -> None:
+        account, token = self.create_account_and_get_token()
+        first_task, second_task, third_task = self.create_multiple_test_tasks(account_id=account.id, count=3)
+
+        with app.test_client() as client:
+            response = client.post(
+                f"{self.get_task_by_id_api_url(account.id, third_task.id)}:move",
+                headers={**self.HEADERS, "Authorization": f"Bearer {token}"},
+                data=json.dumps({"previous_task_id": first_task.id, "next_task_id": second_task.id}),
+            )
+        list_response = self.make_authenticated_request(
+            "GET", account.id, token, query_params="sort_by=position&sort_direction=asc"
+        )
+
+        assert response.status_code == 200
+        assert first_task.position < response.json["position"] < second_task.position
+        assert [item["id"] for item in list_response.json["items"]] == [first_task.id, third_task.id, second_task.id]
+
+    def test_restore_archived_task(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        TaskService.delete_task(params=DeleteTaskParams(account_id=account.id, task_id=task.id))
+        TaskRepository.collection().update_one(
+            {"_id": ObjectId(task.id)}, {"$set": {"updated_at": datetime.now() - timedelta(days=60)}}
+        )
+        TaskService.archive_inactive_tasks_batch(params=ArchiveInactiveTasksParams(min_age_days=30, batch_size=10))
+
+        with app.test_client() as client:
+            response = client.post(
+                f"{self.get_task_by_id_api_url(account.id, task.id)}:restore",
+                headers={**self.HEADERS, "Authorization": f"Bearer {token}"},
+            )
+            missing_response = client.post(
+                f"{self.get_task_by_id_api_url(account.id, task.id)}:restore",
+                headers={**self.HEADERS, "Authorization": f"Bearer {token}"},
+            )
+
+        assert response.status_code == 200
+        assert response.json["id"] == task.id
+        assert missing_response.status_code == 404
+        assert missing_response.json["code"] == TaskErrorCode.NOT_FOUND
+
+    def test_get_tasks_by_ids(self) -> None:
+        account, token = self.create_account_and_get_token()
+        first_task, second_task = self.create_multiple_test_tasks(account_id=account.id, count=2)
+        missing_task_id = "507f1f77bcf86cd799439011"
+
+        response = self.make_authenticated_request(
+            "GET", account.id, token, query_params=f"ids={second_task.id},{missing_task_id},{first_task.id}"
+        )
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json["items"]] == [second_task.id, first_task.id]
+        assert response.json["missing_ids"] == [missing_task_id]
+
     def test_get_all_tasks_no_auth(self) -> None:
         account, _ = self.create_account_and_get_token()
 
@@ -113,6 +306,228 @@ class TestTaskApi(BaseTestTask):
 
         self.assert_error_response(response, 401, AccessTokenErrorCode.AUTHORIZATION_HEADER_NOT_FOUND)
 
+    def test_batch_tasks_success(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task_to_update, task_to_delete = self.create_multiple_test_tasks(account_id=account.id, count=2)
+        batch_data = {
+            "operations": [
+                {"op": "create", "title": "New Task", "description": "New Description"},
+                {"op": "update", "task_id": task_to_update.id, "title": "Updated", "description": "Updated"},
+                {"op": "delete", "task_id": task_to_delete.id},
+                {"op": "delete", "task_id": "507f1f77bcf86cd799439011"},
+            ]
+        }
+
+        response = self.make_batch_request(account.id, token, data=batch_data)
+
+        assert response.status_code == 200
+        results = response.json["results"]
+        assert [result["success"] for result in results] == [True, True, True, False]
+        assert results[0]["task"]["title"] == "New Task"
+        assert results[1]["task"]["title"] == "Updated"
+        assert results[3]["error"]["code"] == TaskErrorCode.NOT_FOUND
+
+        list_response = self.make_authenticated_request("GET", account.id, token)
+        assert sorted(item["title"] for item in list_response.json["items"]) == ["New Task", "Updated"]
+        assert list_response.json["total_count"] == 2
+
+    def test_batch_tasks_invalid_operation(self) -> None:
+        account, token = self.create_account_and_get_token()
+        batch_data = {"operations": [{"op": "create", "title": "Missing description"}]}
+
+        response = self.make_batch_request(account.id, token, data=batch_data)
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+        assert "Operation 0" in response.json.get("message")
+
+    def test_batch_tasks_empty_operations(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_batch_request(account.id, token, data={"operations": []})
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_bulk_update_tasks_by_filter(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=3)
+        bulk_data = {
+            "action": "update",
+            "filter": {"status": "open"},
+            "changes": {"status": "done", "priority": "high"},
+        }
+
+        response = self.make_bulk_request(account.id, token, data=bulk_data)
+
+        assert response.status_code == 200
+        assert response.json == {"matched_count": 3, "modified_count": 3}
+        list_response = self.make_authenticated_request("GET", account.id, token, query_params="status=done")
+        assert list_response.json["total_count"] == 3
+        assert {item["priority"] for item in list_response.json["items"]} == {"high"}
+
+    def test_bulk_delete_tasks_by_filter(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=2)
+
+        response = self.make_bulk_request(
+            account.id, token, data={"action": "delete", "filter": {"priority": "medium"}}
+        )
+
+        assert response.status_code == 200
+        assert response.json["modified_count"] == 2
+        list_response = self.make_authenticated_request("GET", account.id, token)
+        assert list_response.json["total_count"] == 0
+
+    def test_bulk_action_requires_filter(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_bulk_request(account.id, token, data={"action": "delete", "filter": {}})
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_upload_and_download_task_attachment(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        content = bytes(range(256)) * 4096
+
+        with app.test_client() as client:
+            upload_response = client.post(
+                f"{self.get_task_attachments_api_url(account.id, task.id)}?filename=data.bin",
+                headers={"Authorization": f"Bearer {token}", "Content-Type": "application/octet-stream"},
+                data=content,
+            )
+            download_response = client.get(
+                f"{self.get_task_attachments_api_url(account.id, task.id)}/{upload_response.json['id']}",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        assert upload_response.status_code == 201
+        assert upload_response.json["size"] == len(content)
+        assert download_response.status_code == 200
+        assert download_response.headers["Accept-Ranges"] == "bytes"
+        assert download_response.data == content
+
+    def test_download_task_attachment_range(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        content = bytes(range(256)) * 4096
+
+        with app.test_client() as client:
+            upload_response = client.post(
+                f"{self.get_task_attachments_api_url(account.id, task.id)}?filename=data.bin",
+                headers={"Authorization": f"Bearer {token}", "Content-Type": "application/octet-stream"},
+                data=content,
+            )
+            attachment_url = f"{self.get_task_attachments_api_url(account.id, task.id)}/{upload_response.json['id']}"
+            # Spans the boundary between the first and second GridFS chunks
+            range_response = client.get(
+                attachment_url, headers={"Authorization": f"Bearer {token}", "Range": "bytes=261000-262000"}
+            )
+            unsatisfiable_response = client.get(
+                attachment_url, headers={"Authorization": f"Bearer {token}", "Range": f"bytes={len(content)}-"}
+            )
+
+        assert range_response.status_code == 206
+        assert range_response.headers["Content-Range"] == f"bytes 261000-262000/{len(content)}"
+        assert range_response.data == content[261000:262001]
+        assert unsatisfiable_response.status_code == 416
+        assert unsatisfiable_response.headers["Content-Range"] == f"bytes */{len(content)}"
+
+    def test_get_task_activity(self) -> None:
+        account, token = self.create_account_and_get_token()
+        task = self.create_test_task(account_id=account.id)
+        self.make_authenticated_request("DELETE", account.id, token, task_id=task.id)
+
+        response = self.make_authenticated_request("GET", account.id, token, task_id="activity")
+
+        assert response.status_code == 200
+        assert [event["action"] for event in response.json["items"]] == ["deleted", "created"]
+        assert response.json["next_cursor"] is None
+
+    def test_export_tasks_streams_ndjson(self) -> None:
+        account, token = self.create_account_and_get_token()
+        created_tasks = self.create_multiple_test_tasks(account_id=account.id, count=3)
+
+        response = self.make_authenticated_request("GET", account.id, token, task_id="export")
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        exported_tasks = [json.loads(line) for line in response.data.decode("utf-8").splitlines()]
+        assert [task["id"] for task in exported_tasks] == [task.id for task in created_tasks]
+
+    def test_export_tasks_with_gzip(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=2)
+
+        with app.test_client() as client:
+            response = client.get(
+                f"{self.get_task_api_url(account.id)}/export",
+                headers={"Authorization": f"Bearer {token}", "Accept-Encoding": "gzip"},
+            )
+
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert len(gzip.decompress(response.data).decode("utf-8").splitlines()) == 2
+
+    def test_import_tasks_from_csv(self) -> None:
+        account, token = self.create_account_and_get_token()
+        csv_data = 'title,description\nFirst,"Multi\nline"\n,Missing title\nThird,Third description\n'
+
+        response = self.make_import_request(account.id, token, csv_data.encode("utf-8"), "text/csv")
+
+        assert response.status_code == 200
+        assert response.json["processed_rows"] == 3
+        assert response.json["imported_count"] == 2
+        assert response.json["errors"] == [{"row": 2, "message": "Title is required"}]
+        list_response = self.make_authenticated_request("GET", account.id, token)
+        assert list_response.json["total_count"] == 2
+
+    def test_import_tasks_from_ndjson(self) -> None:
+        account, token = self.create_account_and_get_token()
+        ndjson_data = '{"title": "First", "description": "First description"}\nnot json\n'
+
+        response = self.make_import_request(account.id, token, ndjson_data.encode("utf-8"), "application/x-ndjson")
+
+        assert response.status_code == 200
+        assert response.json["imported_count"] == 1
+        assert response.json["errors"] == [{"row": 2, "message": "Row is not valid JSON"}]
+
+    def test_import_tasks_unsupported_format(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_import_request(account.id, token, b"<tasks/>", "application/xml")
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_search_tasks_success(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_test_task(account_id=account.id, title="Pay invoice", description="Vendor invoice for March")
+        self.create_test_task(account_id=account.id, title="Groceries", description="Milk and eggs")
+
+        response = self.make_authenticated_request("GET", account.id, token, task_id="search", query_params="q=invoice")
+
+        assert response.status_code == 200
+        assert [item["title"] for item in response.json["items"]] == ["Pay invoice"]
+        assert response.json["next_cursor"] is None
+
+    def test_get_task_summary(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=2)
+
+        response = self.make_authenticated_request("GET", account.id, token, task_id="summary")
+
+        assert response.status_code == 200
+        assert response.json["total_count"] == 2
+        assert response.json["status_counts"] == {"open": 2, "done": 0}
+        assert response.json["overdue_count"] == 0
+        assert len(response.json["recently_updated"]) == 2
+
+    def test_search_tasks_missing_query(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_authenticated_request("GET", account.id, token, task_id="search")
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
     def test_get_specific_task_success(self) -> None:
         account, token = self.create_account_and_get_token()
         created_task = self.create_test_task(account_id=account.id)
@@ -122,6 +537,71 @@ class TestTaskApi(BaseTestTask):
         assert response.status_code == 200
         self.assert_task_response(response.json, expected_task=created_task)
 
+    def test_get_specific_task_with_fields(self) -> None:
+        account, token = self.create_account_and_get_token()
+        created_task = self.create_test_task(account_id=account.id)
+
+        response = self.make_authenticated_request(
+            "GET", account.id, token, task_id=created_task.id, query_params="fields=id,title"
+        )
+
+        assert response.status_code == 200
+        assert response.json == {"id": created_task.id, "title": created_task.title}
+
+    def test_get_all_tasks_with_fields(self) -> None:
+        account, token = self.create_account_and_get_token()
+        self.create_multiple_test_tasks(account_id=account.id, count=3)
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="fields=title&size=2&cursor=")
+
+        assert response.status_code == 200
+        assert response.json["items"] == [{"title": "Task 3"}, {"title": "Task 2"}]
+        assert response.json["next_cursor"] is not None
+
+    def test_get_all_tasks_with_unknown_field(self) -> None:
+        account, token = self.create_account_and_get_token()
+
+        response = self.make_authenticated_request("GET", account.id, token, query_params="fields=id,secret")
+
+        self.assert_error_response(response, 400, TaskErrorCode.BAD_REQUEST)
+
+    def test_get_specific_task_conditional_get(self) -> None:
+        account, token = self.create_account_and_get_token()
+        created_task = self.create_test_task(account_id=account.id)
+        task_url = self.get_task_by_id_api_url(account.id, created_task.id)
+        headers = {"Authorization": f"Bearer {token}"}
+
+        with app.test_client() as client:
+            etag = client.get(task_url, headers=headers).headers["ETag"]
+            not_modified_response = client.get(task_url, headers={**headers, "If-None-Match": etag})
+            client.patch(
+                task_url,
+                headers={**headers, **self.HEADERS},
+                data=json.dumps({"title": "Updated Title", "description": "Updated Description"}),
+            )
+            modified_response = client.get(task_url, headers={**headers, "If-None-Match": etag})
+
+        assert not_modified_response.status_code == 304
+        assert modified_response.status_code == 200
+        assert modified_response.json["title"] == "Updated Title"
+
+    def test_get_specific_task_reads_the_task_once(self) -> None:
+        account, token = self.create_account_and_get_token()
+        created_task = self.create_test_task(account_id=account.id)
+        task_url = f"{self.get_task_by_id_api_url(account.id, created_task.id)}?fields=title"
+        headers = {"Authorization": f"Bearer {token}"}
+
+        with app.test_client() as client:
+            ApplicationRepositoryClient.command_counter.reset()
+            response = client.get(task_url, headers=headers)
+            tasks_command_count = ApplicationRepositoryClient.command_counter.count(collection_name="tasks")
+            not_modified_response = client.get(task_url, headers={**headers, "If-None-Match": response.headers["ETag"]})
+
+        assert response.status_code == 200
+        assert response.json == {"title": created_task.title}
+        assert tasks_command_count == 1
+        assert not_modified_response.status_code == 304
+
     def test_get_specific_task_not_found(self) -> None:
         account, token = self.create_account_and_get_token()
         non_existent_task_id = "507f1f77bcf86cd799439011"
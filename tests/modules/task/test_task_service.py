@@ -1,15 +1,67 @@
-from datetime import datetime
+import io
+from datetime import datetime, timedelta
+from unittest import mock
 
-from modules.application.common.types import PaginationParams
-from modules.task.errors import TaskNotFoundError
+from bson.objectid import ObjectId
+from pymongo.errors import PyMongoError
+
+from modules.application.common.base_model import BaseModel
+from modules.application.common.types import CursorPaginationParams, PaginationParams, SortDirection, SortParams
+from modules.application.repository import ApplicationRepositoryClient
+from modules.notification.internals.sendgrid_service import SendGridService
+from modules.task.constants import TASK_SORT_FIELDS
+from modules.task.errors import (
+    TaskAttachmentTooLargeError,
+    TaskBadRequestError,
+    TaskChangesExpiredError,
+    TaskNotFoundError,
+)
+from modules.task.internal.store.task_activity_bucket_repository import TaskActivityBucketRepository
+from modules.task.internal.store.task_archive_repository import TaskArchiveRepository
+from modules.task.internal.store.task_attachment_repository import TaskAttachmentRepository
+from modules.task.internal.store.task_counter_repository import TaskCounterRepository
+from modules.task.internal.store.task_import_repository import TaskImportRepository
+from modules.task.internal.store.task_reminder_repository import TaskReminderRepository
+from modules.task.internal.store.task_repository import TaskRepository
+from modules.task.internal.task_import_writer import TaskImportWriter
+from modules.task.internal.task_util import TaskUtil
 from modules.task.task_service import TaskService
 from modules.task.types import (
+    ArchiveInactiveTasksParams,
     CreateTaskParams,
+    DeleteTaskAttachmentParams,
     DeleteTaskParams,
+    DispatchTaskRemindersParams,
+    GetCursorPaginatedTasksParams,
     GetPaginatedTasksParams,
+    GetTaskActivityParams,
+    GetTaskAttachmentParams,
+    GetTaskAttachmentsParams,
+    GetTaskChangesParams,
+    GetTaskImportParams,
     GetTaskParams,
+    GetTasksByIdsParams,
+    GetTaskSummaryParams,
+    ImportTasksParams,
+    MoveTaskParams,
+    RestoreArchivedTaskParams,
+    RunTaskImportParams,
+    SearchTasksParams,
+    StageTaskImportParams,
+    TaskActivityAction,
+    TaskBatchOperation,
+    TaskBatchOperationType,
+    TaskBatchParams,
+    TaskBulkActionParams,
+    TaskBulkActionType,
     TaskErrorCode,
+    TaskFilterParams,
+    TaskImportFormat,
+    TaskImportStatus,
+    TaskPriority,
+    TaskStatus,
     UpdateTaskParams,
+    UploadTaskAttachmentParams,
 )
 from tests.modules.task.base_test_task import BaseTestTask
 
@@ -30,6 +82,42 @@ class TestTaskService(BaseTestTask):
         assert task.description == self.DEFAULT_TASK_DESCRIPTION
         assert task.id is not None
 
+    def assert_task_write_round_trips(self, tasks_command_name: str) -> None:
+        # The whole budget of a single task write: the task itself, its account's counter and its activity bucket
+        expected_commands = {
+            ("tasks", tasks_command_name): 1,
+            ("task_counters", "update"): 1,
+            ("task_activity_buckets", "update"): 1,
+        }
+        for (collection_name, command_name), count in expected_commands.items():
+            assert (
+                ApplicationRepositoryClient.command_counter.count(
+                    collection_name=collection_name, command_name=command_name
+                )
+                == count
+            ), f"{command_name} on {collection_name}"
+        assert ApplicationRepositoryClient.command_counter.count() == sum(expected_commands.values())
+
+    def test_create_task_uses_single_tasks_round_trip(self) -> None:
+        self.create_test_task(account_id=self.account.id)
+        ApplicationRepositoryClient.command_counter.reset()
+
+        self.create_test_task(account_id=self.account.id)
+
+        self.assert_task_write_round_trips("insert")
+
+    def test_update_task_uses_single_tasks_round_trip(self) -> None:
+        created_task = self.create_test_task(account_id=self.account.id)
+        ApplicationRepositoryClient.command_counter.reset()
+
+        TaskService.update_task(
+            params=UpdateTaskParams(
+                account_id=self.account.id, task_id=created_task.id, title="Updated", description="Updated"
+            )
+        )
+
+        self.assert_task_write_round_trips("findAndModify")
+
     def test_get_task_for_account(self) -> None:
         created_task = self.create_test_task(account_id=self.account.id)
         get_params = GetTaskParams(account_id=self.account.id, task_id=created_task.id)
@@ -41,6 +129,33 @@ class TestTaskService(BaseTestTask):
         assert retrieved_task.title == self.DEFAULT_TASK_TITLE
         assert retrieved_task.description == self.DEFAULT_TASK_DESCRIPTION
 
+    def test_get_paginated_partial_tasks_projects_requested_fields(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=2)
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=PaginationParams(page=1, size=10, offset=0), fields=["title"]
+        )
+
+        result = TaskService.get_paginated_partial_tasks(params=get_params)
+
+        assert result.items == [{"title": "Task 2"}, {"title": "Task 1"}]
+
+    def test_get_tasks_by_ids_uses_single_query_and_reports_missing(self) -> None:
+        first_task, second_task = self.create_multiple_test_tasks(account_id=self.account.id, count=2)
+        other_account = self.create_test_account(username="other@example.com")
+        other_account_task = self.create_test_task(account_id=other_account.id)
+        ApplicationRepositoryClient.command_counter.reset()
+
+        result = TaskService.get_tasks_by_ids(
+            params=GetTasksByIdsParams(
+                account_id=self.account.id,
+                task_ids=[second_task.id, other_account_task.id, "not-an-id", first_task.id, second_task.id],
+            )
+        )
+
+        assert [task.id for task in result.items] == [second_task.id, first_task.id]
+        assert result.missing_ids == [other_account_task.id, "not-an-id"]
+        assert ApplicationRepositoryClient.command_counter.count(collection_name="tasks") == 1
+
     def test_get_task_for_account_not_found(self) -> None:
         non_existent_task_id = "507f1f77bcf86cd799439011"
         get_params = GetTaskParams(account_id=self.account.id, task_id=non_existent_task_id)
@@ -95,6 +210,946 @@ class TestTaskService(BaseTestTask):
         assert result.pagination_params.page == 1
         assert result.pagination_params.size == 1
 
+    def test_get_paginated_tasks_without_total(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=2)
+        pagination_params = PaginationParams(page=1, size=10, offset=0)
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id, pagination_params=pagination_params, include_total=False
+        )
+
+        result = TaskService.get_paginated_tasks(params=get_params)
+
+        assert len(result.items) == 2
+        assert result.total_count is None
+        assert result.total_pages is None
+
+    def test_get_paginated_tasks_sorted_by_title(self) -> None:
+        for title in ["Banana", "Apple", "Cherry"]:
+            self.create_test_task(account_id=self.account.id, title=title)
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id,
+            pagination_params=PaginationParams(page=1, size=10, offset=0),
+            sort_params=SortParams(sort_by="title", sort_direction=SortDirection.ASC),
+        )
+
+        result = TaskService.get_paginated_tasks(params=get_params)
+
+        assert [task.title for task in result.items] == ["Apple", "Banana", "Cherry"]
+
+    def test_supported_task_sorts_use_an_index(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+
+        for sort_by in TASK_SORT_FIELDS:
+            for sort_direction in SortDirection:
+                cursor = BaseModel.apply_sort_params(
+                    TaskRepository.collection().find({"account_id": self.account.id, "active": True}),
+                    SortParams(sort_by=sort_by, sort_direction=sort_direction),
+                )
+                winning_plan = cursor.skip(10).limit(10).explain()["queryPlanner"]["winningPlan"]
+                stages = self.get_plan_stages(winning_plan)
+
+                assert "IXSCAN" in stages, f"{sort_by} {sort_direction.string_value} does not use an index: {stages}"
+                assert "SORT" not in stages, f"{sort_by} {sort_direction.string_value} sorts in memory: {stages}"
+
+    def test_get_paginated_tasks_filtered_by_status_and_due_date(self) -> None:
+        now = datetime.now()
+        overdue_task = TaskService.create_task(
+            params=CreateTaskParams(
+                account_id=self.account.id, title="Overdue", description="Open", due_at=now - timedelta(days=1)
+            )
+        )
+        TaskService.create_task(
+            params=CreateTaskParams(
+                account_id=self.account.id, title="Later", description="Open", due_at=now + timedelta(days=7)
+            )
+        )
+        TaskService.create_task(
+            params=CreateTaskParams(
+                account_id=self.account.id,
+                title="Done",
+                description="Closed",
+                status=TaskStatus.DONE,
+                priority=TaskPriority.HIGH,
+                due_at=now - timedelta(days=2),
+            )
+        )
+        get_params = GetPaginatedTasksParams(
+            account_id=self.account.id,
+            pagination_params=PaginationParams(page=1, size=10, offset=0),
+            filter_params=TaskFilterParams(status=TaskStatus.OPEN, due_before=now),
+        )
+
+        result = TaskService.get_paginated_tasks(params=get_params)
+
+        assert [task.id for task in result.items] == [overdue_task.id]
+        assert result.items[0].status == TaskStatus.OPEN
+        assert result.items[0].priority == TaskPriority.MEDIUM
+        assert result.total_count == 1
+
+    def test_get_paginated_tasks_filtered_by_due_date_are_sorted_by_due_date(self) -> None:
+        now = datetime.now()
+        for title, due_at in [("Second", now - timedelta(hours=1)), ("First", now - timedelta(days=1))]:
+            TaskService.create_task(
+                params=CreateTaskParams(account_id=self.account.id, title=title, description="Open", due_at=due_at)
+            )
+
+        result = TaskService.get_paginated_tasks(
+            params=GetPaginatedTasksParams(
+                account_id=self.account.id,
+                pagination_params=PaginationParams(page=1, size=10, offset=0),
+                filter_params=TaskFilterParams(due_before=now),
+            )
+        )
+
+        assert [task.title for task in result.items] == ["First", "Second"]
+
+    def test_task_filters_use_an_index(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        now = datetime.now()
+
+        for filter_params in [
+            TaskFilterParams(status=TaskStatus.OPEN),
+            TaskFilterParams(priority=TaskPriority.HIGH),
+            TaskFilterParams(due_before=now),
+            TaskFilterParams(status=TaskStatus.OPEN, due_after=now - timedelta(days=1), due_before=now),
+        ]:
+            # The same query the task list runs: filter, default sort for the filter, then a page
+            filter_query = TaskUtil.get_task_filter_query(self.account.id, filter_params)
+            cursor = BaseModel.apply_sort_params(
+                TaskRepository.collection().find(filter_query), TaskUtil.get_task_sort_params(None, filter_query)
+            )
+            winning_plan = cursor.skip(10).limit(10).explain()["queryPlanner"]["winningPlan"]
+            stages = self.get_plan_stages(winning_plan)
+            index_scan = self.get_index_scan(winning_plan)
+
+            assert index_scan is not None, f"{filter_params} does not use an index: {stages}"
+            assert "SORT" not in stages, f"{filter_params} sorts in memory: {stages}"
+            filtered_keys = set(filter_query) - {"account_id", "active"}
+            assert filtered_keys & set(
+                index_scan["keyPattern"]
+            ), f"{filter_params} scans an index without its filter keys: {index_scan['indexName']}"
+
+    def test_get_task_summary_counts_statuses_and_overdue_tasks(self) -> None:
+        now = datetime.now()
+        self.create_test_task(account_id=self.account.id, title="Open")
+        TaskService.create_task(
+            params=CreateTaskParams(
+                account_id=self.account.id, title="Overdue", description="Open", due_at=now - timedelta(days=1)
+            )
+        )
+        done_task = TaskService.create_task(
+            params=CreateTaskParams(
+                account_id=self.account.id,
+                title="Done",
+                description="Closed",
+                status=TaskStatus.DONE,
+                due_at=now - timedelta(days=1),
+            )
+        )
+
+        summary = TaskService.get_task_summary(
+            params=GetTaskSummaryParams(account_id=self.account.id, cache_ttl_seconds=60)
+        )
+
+        assert summary.total_count == 3
+        assert summary.status_counts == {"open": 2, "done": 1}
+        assert summary.overdue_count == 1
+        assert summary.recently_updated[0].id == done_task.id
+
+    def test_get_task_summary_is_cached_until_a_task_write(self) -> None:
+        self.create_test_task(account_id=self.account.id)
+        summary_params = GetTaskSummaryParams(account_id=self.account.id, cache_ttl_seconds=60)
+        TaskService.get_task_summary(params=summary_params)
+        ApplicationRepositoryClient.command_counter.reset()
+
+        cached_summary = TaskService.get_task_summary(params=summary_params)
+        cached_aggregations = ApplicationRepositoryClient.command_counter.count(
+            collection_name=TaskRepository.collection_name, command_name="aggregate"
+        )
+        self.create_test_task(account_id=self.account.id)
+        refreshed_summary = TaskService.get_task_summary(params=summary_params)
+
+        assert cached_summary.total_count == 1
+        assert cached_aggregations == 0
+        assert refreshed_summary.total_count == 2
+
+    def test_move_task_writes_only_the_moved_task(self) -> None:
+        first_task, second_task, third_task = self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        ApplicationRepositoryClient.command_counter.reset()
+
+        moved_task = TaskService.move_task(
+            params=MoveTaskParams(
+                account_id=self.account.id,
+                task_id=third_task.id,
+                previous_task_id=first_task.id,
+                next_task_id=second_task.id,
+            )
+        )
+        result = TaskService.get_paginated_tasks(
+            params=GetPaginatedTasksParams(
+                account_id=self.account.id,
+                pagination_params=PaginationParams(page=1, size=10, offset=0),
+                sort_params=SortParams(sort_by="position", sort_direction=SortDirection.ASC),
+            )
+        )
+
+        assert first_task.position < moved_task.position < second_task.position
+        assert [task.id for task in result.items] == [first_task.id, third_task.id, second_task.id]
+        assert (
+            ApplicationRepositoryClient.command_counter.count(
+                collection_name=TaskRepository.collection_name, command_name="findAndModify"
+            )
+            == 1
+        )
+
+    def test_move_task_to_the_start_of_the_list(self) -> None:
+        first_task, second_task = self.create_multiple_test_tasks(account_id=self.account.id, count=2)
+
+        moved_task = TaskService.move_task(
+            params=MoveTaskParams(account_id=self.account.id, task_id=second_task.id, next_task_id=first_task.id)
+        )
+
+        assert moved_task.position < first_task.position
+
+    def test_move_task_rejects_neighbors_out_of_order(self) -> None:
+        first_task, second_task, third_task = self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+
+        with self.assertRaises(TaskBadRequestError):
+            TaskService.move_task(
+                params=MoveTaskParams(
+                    account_id=self.account.id,
+                    task_id=first_task.id,
+                    previous_task_id=third_task.id,
+                    next_task_id=second_task.id,
+                )
+            )
+
+    def test_rebalance_task_positions_keeps_order_and_shortens_ranks(self) -> None:
+        first_task, second_task = self.create_multiple_test_tasks(account_id=self.account.id, count=2)
+        moved_tasks = []
+        for _ in range(60):
+            moved_tasks.append(
+                TaskService.move_task(
+                    params=MoveTaskParams(
+                        account_id=self.account.id,
+                        task_id=self.create_test_task(account_id=self.account.id).id,
+                        previous_task_id=first_task.id,
+                    )
+                )
+            )
+        sort_params = SortParams(sort_by="position", sort_direction=SortDirection.ASC)
+        list_params = GetPaginatedTasksParams(
+            account_id=self.account.id,
+            pagination_params=PaginationParams(page=1, size=100, offset=0),
+            sort_params=sort_params,
+        )
+        order_before = [task.id for task in TaskService.get_paginated_tasks(params=list_params).items]
+
+        result = TaskService.rebalance_task_positions(account_id=self.account.id)
+        tasks_after = TaskService.get_paginated_tasks(params=list_params).items
+
+        assert max(len(task.position) for task in moved_tasks) > len(first_task.position)
+        assert result.rebalanced_count == 62
+        assert [task.id for task in tasks_after] == order_before
+        assert {len(task.position) for task in tasks_after} == {len(first_task.position)}
+        assert max(task.position for task in tasks_after) < self.create_test_task(account_id=self.account.id).position
+
+    def test_task_counter_tracks_create_and_delete(self) -> None:
+        tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=tasks[0].id))
+
+        counter_bson = TaskCounterRepository.collection().find_one({"account_id": self.account.id})
+
+        assert counter_bson["active_task_count"] == 2
+
+    def test_task_counter_is_seeded_from_existing_tasks_on_first_write(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        # As for an account whose tasks predate the counters
+        TaskCounterRepository.collection().delete_many({"account_id": self.account.id})
+
+        self.create_test_task(account_id=self.account.id)
+
+        counter_bson = TaskCounterRepository.collection().find_one({"account_id": self.account.id})
+        assert counter_bson["active_task_count"] == 4
+        assert counter_bson["repaired_at"] is not None
+
+    def test_task_list_version_bumps_on_every_mutation(self) -> None:
+        initial_version = TaskService.get_task_list_version(account_id=self.account.id)
+        created_task = self.create_test_task(account_id=self.account.id)
+        TaskService.update_task(
+            params=UpdateTaskParams(
+                account_id=self.account.id, task_id=created_task.id, title="Updated", description="Updated"
+            )
+        )
+        TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=created_task.id))
+
+        assert TaskService.get_task_list_version(account_id=self.account.id) == initial_version + 3
+
+    def test_repair_task_counters_corrects_drift(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=3)
+        TaskCounterRepository.collection().update_one(
+            {"account_id": self.account.id}, {"$set": {"active_task_count": 42}}
+        )
+        TaskCounterRepository.collection().insert_one({"account_id": "account-without-tasks", "active_task_count": 7})
+
+        TaskService.repair_task_counters(batch_size=1)
+
+        pagination_params = PaginationParams(page=1, size=10, offset=0)
+        get_params = GetPaginatedTasksParams(account_id=self.account.id, pagination_params=pagination_params)
+        assert TaskService.get_paginated_tasks(params=get_params).total_count == 3
+        orphan_counter_bson = TaskCounterRepository.collection().find_one({"account_id": "account-without-tasks"})
+        assert orphan_counter_bson["active_task_count"] == 0
+
+    def test_get_cursor_paginated_tasks_walks_all_pages(self) -> None:
+        created_tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=5)
+
+        seen_ids = []
+        cursor = None
+        while True:
+            get_params = GetCursorPaginatedTasksParams(
+                account_id=self.account.id, cursor_pagination_params=CursorPaginationParams(size=2, cursor=cursor)
+            )
+            result = TaskService.get_cursor_paginated_tasks(params=get_params)
+            seen_ids.extend(task.id for task in result.items)
+            if result.next_cursor is None:
+                break
+            cursor = result.next_cursor
+
+        assert seen_ids == [task.id for task in reversed(created_tasks)]
+
+    def test_get_cursor_paginated_tasks_invalid_cursor(self) -> None:
+        get_params = GetCursorPaginatedTasksParams(
+            account_id=self.account.id, cursor_pagination_params=CursorPaginationParams(size=2, cursor="not-a-cursor")
+        )
+
+        with self.assertRaises(TaskBadRequestError) as context:
+            TaskService.get_cursor_paginated_tasks(params=get_params)
+
+        assert context.exception.code == TaskErrorCode.BAD_REQUEST
+
+    def test_apply_task_batch(self) -> None:
+        task_to_update, task_to_delete = self.create_multiple_test_tasks(account_id=self.account.id, count=2)
+        batch_params = TaskBatchParams(
+            account_id=self.account.id,
+            operations=[
+                TaskBatchOperation(op=TaskBatchOperationType.CREATE, title="New Task", description="New Description"),
+                TaskBatchOperation(
+                    op=TaskBatchOperationType.UPDATE, task_id=task_to_update.id, title="Updated", description="Updated"
+                ),
+                TaskBatchOperation(op=TaskBatchOperationType.DELETE, task_id=task_to_delete.id),
+                TaskBatchOperation(
+                    op=TaskBatchOperationType.UPDATE, task_id=task_to_delete.id, title="Gone", description="Gone"
+                ),
+            ],
+        )
+
+        result = TaskService.apply_task_batch(params=batch_params)
+
+        assert [operation_result.success for operation_result in result.results] == [True, True, True, False]
+        assert result.results[3].error.code == TaskErrorCode.NOT_FOUND
+        updated_task = TaskService.get_task(params=GetTaskParams(account_id=self.account.id, task_id=task_to_update.id))
+        assert updated_task.title == "Updated"
+        counter_bson = TaskCounterRepository.collection().find_one({"account_id": self.account.id})
+        assert counter_bson["active_task_count"] == 2
+
+    def test_apply_task_batch_rejects_invalid_operations(self) -> None:
+        batch_params = TaskBatchParams(
+            account_id=self.account.id,
+            operations=[TaskBatchOperation(op=TaskBatchOperationType.DELETE, task_id="not-an-object-id")],
+        )
+
+        with self.assertRaises(TaskBadRequestError) as context:
+            TaskService.apply_task_batch(params=batch_params)
+
+        assert context.exception.code == TaskErrorCode.BAD_REQUEST
+
+    def test_apply_task_batch_stops_an_ordered_batch_at_a_missing_task(self) -> None:
+        operations = [
+            TaskBatchOperation(op=TaskBatchOperationType.CREATE, title="Before", description="Created"),
+            TaskBatchOperation(op=TaskBatchOperationType.DELETE, task_id=str(ObjectId())),
+            TaskBatchOperation(op=TaskBatchOperationType.CREATE, title="After", description="Created"),
+        ]
+
+        ordered_result = TaskService.apply_task_batch(
+            params=TaskBatchParams(account_id=self.account.id, operations=operations)
+        )
+        unordered_result = TaskService.apply_task_batch(
+            params=TaskBatchParams(account_id=self.account.id, operations=operations, ordered=False)
+        )
+
+        assert [operation_result.success for operation_result in ordered_result.results] == [True, False, False]
+        assert ordered_result.results[1].error.code == TaskErrorCode.NOT_FOUND
+        assert ordered_result.results[2].error.code == TaskErrorCode.BAD_REQUEST
+        assert [operation_result.success for operation_result in unordered_result.results] == [True, False, True]
+        assert sorted(task_bson["title"] for task_bson in TaskRepository.collection().find()) == [
+            "After",
+            "Before",
+            "Before",
+        ]
+
+    def test_apply_task_batch_rejects_non_string_fields(self) -> None:
+        task = self.create_test_task(account_id=self.account.id)
+        batch_params = TaskBatchParams(
+            account_id=self.account.id,
+            operations=[
+                TaskBatchOperation(
+                    op=TaskBatchOperationType.UPDATE, task_id=task.id, title=123, description=["Description"]
+                )
+            ],
+        )
+
+        with self.assertRaises(TaskBadRequestError):
+            TaskService.apply_task_batch(params=batch_params)
+
+        assert TaskService.get_task(params=GetTaskParams(account_id=self.account.id, task_id=task.id)) == task
+
+    def test_apply_task_bulk_action_completes_overdue_tasks(self) -> None:
+        now = datetime.now()
+        for title, due_at in [("Overdue 1", now - timedelta(days=1)), ("Overdue 2", now - timedelta(hours=1))]:
+            TaskService.create_task(
+                params=CreateTaskParams(account_id=self.account.id, title=title, description="Open", due_at=due_at)
+            )
+        later_task = TaskService.create_task(
+            params=CreateTaskParams(
+                account_id=self.account.id, title="Later", description="Open", due_at=now + timedelta(days=1)
+            )
+        )
+        version_before = TaskCounterRepository.collection().find_one({"account_id": self.account.id})["version"]
+
+        ApplicationRepositoryClient.command_counter.reset()
+        result = TaskService.apply_task_bulk_action(
+            params=TaskBulkActionParams(
+                account_id=self.account.id,
+                action=TaskBulkActionType.UPDATE,
+                filter_params=TaskFilterParams(status=TaskStatus.OPEN, due_before=now),
+                status=TaskStatus.DONE,
+            )
+        )
+
+        assert (result.matched_count, result.modified_count) == (2, 2)
+        assert ApplicationRepositoryClient.command_counter.count(collection_name="tasks", command_name="update") == 1
+        done_tasks = TaskService.get_paginated_tasks(
+            params=GetPaginatedTasksParams(
+                account_id=self.account.id,
+                pagination_params=PaginationParams(page=1, size=10, offset=0),
+                filter_params=TaskFilterParams(status=TaskStatus.DONE),
+            )
+        )
+        assert sorted(task.title for task in done_tasks.items) == ["Overdue 1", "Overdue 2"]
+        assert (
+            TaskService.get_task(params=GetTaskParams(account_id=self.account.id, task_id=later_task.id)).status
+            == TaskStatus.OPEN
+        )
+        counter_bson = TaskCounterRepository.collection().find_one({"account_id": self.account.id})
+        assert counter_bson["version"] > version_before
+
+    def test_apply_task_bulk_action_deletes_matching_tasks(self) -> None:
+        self.create_multiple_test_tasks(account_id=self.account.id, count=2)
+        TaskService.create_task(
+            params=CreateTaskParams(
+                account_id=self.account.id, title="Done", description="Done", status=TaskStatus.DONE
+            )
+        )
+
+        result = TaskService.apply_task_bulk_action(
+            params=TaskBulkActionParams(
+                account_id=self.account.id,
+                action=TaskBulkActionType.DELETE,
+                filter_params=TaskFilterParams(status=TaskStatus.DONE),
+            )
+        )
+
+        assert result.modified_count == 1
+        counter_bson = TaskCounterRepository.collection().find_one({"account_id": self.account.id})
+        assert counter_bson["active_task_count"] == 2
+        assert TaskRepository.collection().count_documents({"account_id": self.account.id, "active": True}) == 2
+
+    def test_apply_task_bulk_action_update_requires_changes(self) -> None:
+        with self.assertRaises(TaskBadRequestError):
+            TaskService.apply_task_bulk_action(
+                params=TaskBulkActionParams(
+                    account_id=self.account.id,
+                    action=TaskBulkActionType.UPDATE,
+                    filter_params=TaskFilterParams(status=TaskStatus.OPEN),
+                )
+            )
+
+    def test_search_tasks_orders_by_relevance_and_paginates(self) -> None:
+        title_match = self.create_test_task(account_id=self.account.id, title="Quarterly report", description="Draft")
+        description_match = self.create_test_task(
+            account_id=self.account.id, title="Finance", description="Collect numbers for the quarterly report"
+        )
+        self.create_test_task(account_id=self.account.id, title="Unrelated", description="Nothing to see")
+        other_account = self.create_test_account(username="other@example.com")
+        self.create_test_task(account_id=other_account.id, title="Quarterly report", description="Other account")
+
+        seen_ids = []
+        cursor = None
+        while True:
+            search_params = SearchTasksParams(
+                account_id=self.account.id,
+                query="quarterly",
+                cursor_pagination_params=CursorPaginationParams(size=1, cursor=cursor),
+            )
+            result = TaskService.search_tasks(params=search_params)
+            seen_ids.extend(task.id for task in result.items)
+            if result.next_cursor is None:
+                break
+            cursor = result.next_cursor
+
+        assert seen_ids == [title_match.id, description_match.id]
+
+    def test_get_task_changes_includes_updates_and_tombstones(self) -> None:
+        unchanged_task, updated_task, deleted_task = self.create_multiple_test_tasks(
+            account_id=self.account.id, count=3
+        )
+        updated_since = datetime.now()
+        TaskService.update_task(
+            params=UpdateTaskParams(
+                account_id=self.account.id, task_id=updated_task.id, title="Updated", description="Updated"
+            )
+        )
+        TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=deleted_task.id))
+        created_task = self.create_test_task(account_id=self.account.id, title="Created")
+
+        task_changes = []
+        cursor = None
+        while True:
+            changes_params = GetTaskChangesParams(
+                account_id=self.account.id,
+                updated_since=updated_since,
+                cursor_pagination_params=CursorPaginationParams(size=2, cursor=cursor),
+            )
+            result = TaskService.get_task_changes(params=changes_params)
+            task_changes.extend(result.items)
+            if result.next_cursor is None:
+                break
+            cursor = result.next_cursor
+
+        assert [task_change.task_id for task_change in task_changes] == [
+            updated_task.id,
+            deleted_task.id,
+            created_task.id,
+        ]
+        assert task_changes[0].task.title == "Updated"
+        assert task_changes[1].active is False
+        assert task_changes[1].task is None
+        assert unchanged_task.id not in [task_change.task_id for task_change in task_changes]
+
+    def test_get_task_changes_rejects_updated_since_before_the_archival_cutoff(self) -> None:
+        TaskService.archive_inactive_tasks_batch(params=ArchiveInactiveTasksParams(min_age_days=30, batch_size=10))
+
+        with self.assertRaises(TaskChangesExpiredError):
+            TaskService.get_task_changes(
+                params=GetTaskChangesParams(
+                    account_id=self.account.id,
+                    updated_since=datetime.now() - timedelta(days=31),
+                    cursor_pagination_params=CursorPaginationParams(size=10),
+                )
+            )
+        recent_changes = TaskService.get_task_changes(
+            params=GetTaskChangesParams(
+                account_id=self.account.id,
+                updated_since=datetime.now() - timedelta(days=29),
+                cursor_pagination_params=CursorPaginationParams(size=10),
+            )
+        )
+        assert recent_changes.items == []
+
+    def test_archive_inactive_tasks_moves_old_soft_deleted_tasks(self) -> None:
+        active_task, old_task, another_old_task, recent_task = self.create_multiple_test_tasks(
+            account_id=self.account.id, count=4
+        )
+        for task in [old_task, another_old_task, recent_task]:
+            TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=task.id))
+        TaskRepository.collection().update_many(
+            {"_id": {"$in": [ObjectId(old_task.id), ObjectId(another_old_task.id)]}},
+            {"$set": {"updated_at": datetime.now() - timedelta(days=60)}},
+        )
+
+        archive_params = ArchiveInactiveTasksParams(min_age_days=30, batch_size=1)
+        first_batch = TaskService.archive_inactive_tasks_batch(params=archive_params)
+        archived_count = first_batch.archived_count
+        while True:
+            result = TaskService.archive_inactive_tasks_batch(params=archive_params)
+            archived_count += result.archived_count
+            if result.completed:
+                break
+
+        assert first_batch.completed is False
+        assert archived_count == 2
+        archived_ids = {str(task_bson["_id"]) for task_bson in TaskArchiveRepository.collection().find()}
+        assert archived_ids == {old_task.id, another_old_task.id}
+        remaining_ids = {str(task_bson["_id"]) for task_bson in TaskRepository.collection().find()}
+        assert remaining_ids == {active_task.id, recent_task.id}
+
+    def test_restore_archived_task(self) -> None:
+        created_task = self.create_test_task(account_id=self.account.id)
+        TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=created_task.id))
+        TaskRepository.collection().update_one(
+            {"_id": ObjectId(created_task.id)}, {"$set": {"updated_at": datetime.now() - timedelta(days=60)}}
+        )
+        TaskService.archive_inactive_tasks_batch(params=ArchiveInactiveTasksParams(min_age_days=30, batch_size=10))
+
+        restored_task = TaskService.restore_archived_task(
+            params=RestoreArchivedTaskParams(account_id=self.account.id, task_id=created_task.id)
+        )
+
+        assert restored_task == created_task
+        assert TaskService.get_task(params=GetTaskParams(account_id=self.account.id, task_id=created_task.id))
+        assert TaskArchiveRepository.collection().count_documents({}) == 0
+        activity = TaskService.get_task_activity(
+            params=GetTaskActivityParams(
+                account_id=self.account.id, cursor_pagination_params=CursorPaginationParams(size=1)
+            )
+        )
+        assert (activity.items[0].action, activity.items[0].task_id) == (TaskActivityAction.RESTORED, created_task.id)
+        counter_bson = TaskCounterRepository.collection().find_one({"account_id": self.account.id})
+        assert counter_bson["active_task_count"] == 1
+
+    def test_run_staged_task_import(self) -> None:
+        ndjson_rows = [f'{{"title": "Task {i}", "description": "Description {i}"}}' for i in range(5)]
+        ndjson_rows.append('{"title": "No description"}')
+        task_import = TaskService.stage_task_import(
+            params=StageTaskImportParams(
+                account_id=self.account.id,
+                file_format=TaskImportFormat.NDJSON,
+                stream=io.BytesIO("\n".join(ndjson_rows).encode("utf-8")),
+            )
+        )
+
+        TaskService.run_task_import(
+            params=RunTaskImportParams(import_id=task_import.id, batch_size=2, lease_seconds=600)
+        )
+
+        finished_import = TaskService.get_task_import(
+            params=GetTaskImportParams(account_id=self.account.id, import_id=task_import.id)
+        )
+        assert finished_import.status == TaskImportStatus.COMPLETED
+        assert finished_import.processed_rows == 6
+        assert finished_import.imported_count == 5
+        assert finished_import.failed_count == 1
+        assert finished_import.errors[0].row == 6
+        assert list(TaskImportRepository.file_bucket().find()) == []
+        counter_bson = TaskCounterRepository.collection().find_one({"account_id": self.account.id})
+        assert counter_bson["active_task_count"] == 5
+
+    def test_import_tasks_reports_an_unreadable_line_after_committed_rows(self) -> None:
+        csv_content = b"title,description\nFirst,Imported\nSecond,Imported\n\xff\xfe,Unreadable\nFourth,Skipped\n"
+
+        result = TaskService.import_tasks(
+            params=ImportTasksParams(
+                account_id=self.account.id,
+                file_format=TaskImportFormat.CSV,
+                stream=io.BytesIO(csv_content),
+                batch_size=1,
+            )
+        )
+
+        assert result.imported_count == 2
+        assert result.failed_count == 1
+        assert result.errors[0].row == 3
+        assert "not valid UTF-8" in result.errors[0].message
+        assert TaskRepository.collection().count_documents({"account_id": self.account.id}) == 2
+
+    def test_run_task_import_fails_on_an_unexpected_error(self) -> None:
+        task_import = TaskService.stage_task_import(
+            params=StageTaskImportParams(
+                account_id=self.account.id,
+                file_format=TaskImportFormat.NDJSON,
+                stream=io.BytesIO(b'{"title": "Task", "description": "Description"}'),
+            )
+        )
+
+        with mock.patch.object(TaskImportWriter, "import_tasks", side_effect=PyMongoError("connection lost")):
+            finished_import = TaskService.run_task_import(
+                params=RunTaskImportParams(import_id=task_import.id, batch_size=2, lease_seconds=600)
+            )
+
+        assert finished_import.status == TaskImportStatus.FAILED
+        assert finished_import.failure_reason is not None
+        assert list(TaskImportRepository.file_bucket().find()) == []
+
+    def test_run_task_import_fails_an_abandoned_running_import(self) -> None:
+        task_import = TaskService.stage_task_import(
+            params=StageTaskImportParams(
+                account_id=self.account.id,
+                file_format=TaskImportFormat.NDJSON,
+                stream=io.BytesIO(b'{"title": "Task", "description": "Description"}'),
+            )
+        )
+        run_params = RunTaskImportParams(import_id=task_import.id, batch_size=2, lease_seconds=600)
+        TaskImportRepository.collection().update_one(
+            {"_id": ObjectId(task_import.id)},
+            {"$set": {"status": TaskImportStatus.RUNNING, "updated_at": datetime.now() - timedelta(seconds=60)}},
+        )
+
+        assert TaskService.run_task_import(params=run_params).status == TaskImportStatus.RUNNING
+
+        TaskImportRepository.collection().update_one(
+            {"_id": ObjectId(task_import.id)}, {"$set": {"updated_at": datetime.now() - timedelta(hours=1)}}
+        )
+        finished_import = TaskService.run_task_import(params=run_params)
+
+        assert finished_import.status == TaskImportStatus.FAILED
+        assert list(TaskImportRepository.file_bucket().find()) == []
+        assert TaskRepository.collection().count_documents({"account_id": self.account.id}) == 0
+
+    @mock.patch.object(SendGridService, "send_emails")
+    def test_dispatch_due_task_reminders_sends_and_removes_due_reminders(self, mock_send_emails) -> None:
+        now = datetime.now()
+        due_task = TaskService.create_task(
+            params=CreateTaskParams(
+                account_id=self.account.id, title="Due", description="Remind me", remind_at=now - timedelta(minutes=1)
+            )
+        )
+        TaskService.create_task(
+            params=CreateTaskParams(
+                account_id=self.account.id, title="Later", description="Not yet", remind_at=now + timedelta(days=1)
+            )
+        )
+
+        result = TaskService.dispatch_due_task_reminders(
+            params=DispatchTaskRemindersParams(batch_size=10, lease_seconds=60)
+        )
+
+        assert result.claimed_count == 1
+        assert result.sent_count == 1
+        sent_emails = mock_send_emails.call_args.args[0]
+        assert [email.recipient.email for email in sent_emails] == [self.account.username]
+        assert sent_emails[0].template_data["task_title"] == "Due"
+        assert TaskReminderRepository.collection().find_one({"_id": ObjectId(due_task.id)}) is None
+        assert TaskReminderRepository.collection().count_documents({}) == 1
+
+    @mock.patch.object(SendGridService, "send_emails")
+    def test_dispatch_due_task_reminders_claims_each_reminder_once(self, mock_send_emails) -> None:
+        remind_at = datetime.now() - timedelta(minutes=1)
+        for index in range(5):
+            TaskService.create_task(
+                params=CreateTaskParams(
+                    account_id=self.account.id, title=f"Task {index}", description="Remind me", remind_at=remind_at
+                )
+            )
+        dispatch_params = DispatchTaskRemindersParams(batch_size=3, lease_seconds=60)
+
+        first_result = TaskService.dispatch_due_task_reminders(params=dispatch_params)
+        second_result = TaskService.dispatch_due_task_reminders(params=dispatch_params)
+        third_result = TaskService.dispatch_due_task_reminders(params=dispatch_params)
+
+        assert [first_result.claimed_count, second_result.claimed_count, third_result.claimed_count] == [3, 2, 0]
+        sent_titles = [
+            email.template_data["task_title"] for call in mock_send_emails.call_args_list for email in call.args[0]
+        ]
+        assert sorted(sent_titles) == [f"Task {index}" for index in range(5)]
+
+    @mock.patch.object(SendGridService, "send_emails", side_effect=Exception("SendGrid unavailable"))
+    def test_failed_task_reminders_are_retried_after_the_lease(self, mock_send_emails) -> None:
+        TaskService.create_task(
+            params=CreateTaskParams(
+                account_id=self.account.id,
+                title="Due",
+                description="Remind me",
+                remind_at=datetime.now() - timedelta(minutes=1),
+            )
+        )
+
+        with self.assertRaises(Exception):
+            TaskService.dispatch_due_task_reminders(params=DispatchTaskRemindersParams(batch_size=10, lease_seconds=0))
+
+        reminder_bson = TaskReminderRepository.collection().find_one({})
+        assert reminder_bson is not None
+        assert reminder_bson["remind_at"] <= datetime.now()
+
+    @mock.patch("modules.notification.internals.sendgrid_service.MAX_PERSONALIZATIONS_PER_REQUEST", 1)
+    @mock.patch.object(SendGridService, "get_client")
+    def test_task_reminders_sent_before_a_failed_request_are_not_retried(self, mock_get_client) -> None:
+        mock_get_client.return_value.send.side_effect = [None, Exception("SendGrid unavailable")]
+        remind_at = datetime.now() - timedelta(minutes=1)
+        for index in range(2):
+            TaskService.create_task(
+                params=CreateTaskParams(
+                    account_id=self.account.id, title=f"Task {index}", description="Remind me", remind_at=remind_at
+                )
+            )
+
+        result = TaskService.dispatch_due_task_reminders(
+            params=DispatchTaskRemindersParams(batch_size=10, lease_seconds=60)
+        )
+
+        assert (result.claimed_count, result.sent_count, result.failed_count) == (2, 1, 1)
+        assert mock_get_client.return_value.send.call_count == 2
+        assert TaskReminderRepository.collection().count_documents({}) == 1
+
+    def test_deleting_a_task_removes_its_reminder(self) -> None:
+        task = TaskService.create_task(
+            params=CreateTaskParams(
+                account_id=self.account.id,
+                title="Due",
+                description="Remind me",
+                remind_at=datetime.now() + timedelta(days=1),
+            )
+        )
+
+        TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=task.id))
+
+        assert TaskReminderRepository.collection().count_documents({}) == 0
+
+    def test_upload_and_read_task_attachment(self) -> None:
+        task = self.create_test_task(account_id=self.account.id)
+        content = b"0123456789" * 100_000
+
+        attachment = TaskService.upload_task_attachment(
+            params=UploadTaskAttachmentParams(
+                account_id=self.account.id,
+                task_id=task.id,
+                filename="notes.txt",
+                content_type="text/plain",
+                stream=io.BytesIO(content),
+                max_size_bytes=len(content),
+            )
+        )
+
+        assert attachment.size == len(content)
+        attachments = TaskService.get_task_attachments(
+            params=GetTaskAttachmentsParams(account_id=self.account.id, task_id=task.id)
+        )
+        assert [listed_attachment.id for listed_attachment in attachments] == [attachment.id]
+        attachment_content = TaskService.open_task_attachment(
+            params=GetTaskAttachmentParams(account_id=self.account.id, task_id=task.id, attachment_id=attachment.id)
+        )
+        with attachment_content.stream as file_stream:
+            assert file_stream.read() == content
+        updated_task = TaskService.get_task(params=GetTaskParams(account_id=self.account.id, task_id=task.id))
+        assert updated_task.attachment_count == 1
+
+    def test_task_attachment_changes_move_task_versions(self) -> None:
+        task = self.create_test_task(account_id=self.account.id)
+        task_params = GetTaskParams(account_id=self.account.id, task_id=task.id)
+        long_ago = datetime(2020, 1, 1)
+        list_version_before = TaskService.get_task_list_version(account_id=self.account.id)
+
+        TaskRepository.collection().update_one({"_id": ObjectId(task.id)}, {"$set": {"updated_at": long_ago}})
+        attachment = TaskService.upload_task_attachment(
+            params=UploadTaskAttachmentParams(
+                account_id=self.account.id,
+                task_id=task.id,
+                filename="notes.txt",
+                content_type="text/plain",
+                stream=io.BytesIO(b"notes"),
+                max_size_bytes=1024,
+            )
+        )
+        assert TaskService.get_task_updated_at(params=task_params) > long_ago
+
+        TaskRepository.collection().update_one({"_id": ObjectId(task.id)}, {"$set": {"updated_at": long_ago}})
+        TaskService.delete_task_attachment(
+            params=DeleteTaskAttachmentParams(account_id=self.account.id, task_id=task.id, attachment_id=attachment.id)
+        )
+        assert TaskService.get_task_updated_at(params=task_params) > long_ago
+
+        assert TaskService.get_task_list_version(account_id=self.account.id) == list_version_before + 2
+
+    def test_upload_task_attachment_over_the_size_limit_leaves_no_file(self) -> None:
+        task = self.create_test_task(account_id=self.account.id)
+
+        with self.assertRaises(TaskAttachmentTooLargeError):
+            TaskService.upload_task_attachment(
+                params=UploadTaskAttachmentParams(
+                    account_id=self.account.id,
+                    task_id=task.id,
+                    filename="large.bin",
+                    content_type="application/octet-stream",
+                    stream=io.BytesIO(b"x" * 1_000_000),
+                    max_size_bytes=500_000,
+                )
+            )
+
+        assert list(TaskAttachmentRepository.file_bucket().find()) == []
+        assert TaskAttachmentRepository.collection().count_documents({}) == 0
+
+    def test_delete_orphaned_task_attachments_removes_only_deleted_tasks_files(self) -> None:
+        kept_task, deleted_task = self.create_multiple_test_tasks(account_id=self.account.id, count=2)
+        for task in (kept_task, deleted_task):
+            TaskService.upload_task_attachment(
+                params=UploadTaskAttachmentParams(
+                    account_id=self.account.id,
+                    task_id=task.id,
+                    filename="file.txt",
+                    content_type="text/plain",
+                    stream=io.BytesIO(b"content"),
+                    max_size_bytes=1024,
+                )
+            )
+        deletion_result = TaskService.delete_task(
+            params=DeleteTaskParams(account_id=self.account.id, task_id=deleted_task.id)
+        )
+
+        result = TaskService.delete_orphaned_task_attachments(account_id=self.account.id)
+
+        assert deletion_result.attachment_count == 1
+        assert result.deleted_count == 1
+        assert [attachment_bson["task_id"] for attachment_bson in TaskAttachmentRepository.collection().find()] == [
+            kept_task.id
+        ]
+        assert len(list(TaskAttachmentRepository.file_bucket().find())) == 1
+        with self.assertRaises(TaskNotFoundError):
+            TaskService.get_task_attachments(
+                params=GetTaskAttachmentsParams(account_id=self.account.id, task_id=deleted_task.id)
+            )
+
+    def test_task_events_are_recorded_in_buckets(self) -> None:
+        task = self.create_test_task(account_id=self.account.id)
+        TaskService.update_task(
+            params=UpdateTaskParams(
+                account_id=self.account.id,
+                task_id=task.id,
+                title="Updated",
+                description="Updated",
+                status=TaskStatus.DONE,
+            )
+        )
+        TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=task.id))
+
+        activity = TaskService.get_task_activity(
+            params=GetTaskActivityParams(
+                account_id=self.account.id, cursor_pagination_params=CursorPaginationParams(size=10)
+            )
+        )
+
+        assert [event.action for event in activity.items] == [
+            TaskActivityAction.DELETED,
+            TaskActivityAction.UPDATED,
+            TaskActivityAction.CREATED,
+        ]
+        assert {event.task_id for event in activity.items} == {task.id}
+        assert activity.items[1].fields == ["description", "status", "title"]
+        assert activity.next_cursor is None
+        assert TaskActivityBucketRepository.collection().count_documents({"account_id": self.account.id}) == 1
+
+    def test_get_task_activity_pages_across_buckets(self) -> None:
+        with mock.patch("modules.task.internal.task_activity_writer.TASK_ACTIVITY_BUCKET_SIZE", 2):
+            created_tasks = self.create_multiple_test_tasks(account_id=self.account.id, count=5)
+
+            first_page = TaskService.get_task_activity(
+                params=GetTaskActivityParams(
+                    account_id=self.account.id, cursor_pagination_params=CursorPaginationParams(size=3)
+                )
+            )
+            # Appended after the first page was read, so it is not part of the pages that follow
+            self.create_test_task(account_id=self.account.id)
+            second_page = TaskService.get_task_activity(
+                params=GetTaskActivityParams(
+                    account_id=self.account.id,
+                    cursor_pagination_params=CursorPaginationParams(size=3, cursor=first_page.next_cursor),
+                )
+            )
+
+        assert TaskActivityBucketRepository.collection().count_documents({"account_id": self.account.id}) == 3
+        assert [event.task_id for event in first_page.items + second_page.items] == [
+            task.id for task in reversed(created_tasks)
+        ]
+        assert second_page.next_cursor is None
+
     def test_update_task(self) -> None:
         created_task = self.create_test_task(
             account_id=self.account.id, title="Original Title", description="Original Description"
@@ -113,6 +1168,43 @@ class TestTaskService(BaseTestTask):
         assert updated_task.title == "Updated Title"
         assert updated_task.description == "Updated Description"
 
+    def test_update_task_keeps_fields_that_are_not_provided(self) -> None:
+        due_at = datetime.now().replace(microsecond=0) + timedelta(days=3)
+        created_task = TaskService.create_task(
+            params=CreateTaskParams(
+                account_id=self.account.id,
+                title="Title",
+                description="Description",
+                priority=TaskPriority.HIGH,
+                due_at=due_at,
+            )
+        )
+
+        updated_task = TaskService.update_task(
+            params=UpdateTaskParams(
+                account_id=self.account.id,
+                task_id=created_task.id,
+                title="Title",
+                description="Description",
+                status=TaskStatus.DONE,
+            )
+        )
+        cleared_task = TaskService.update_task(
+            params=UpdateTaskParams(
+                account_id=self.account.id,
+                task_id=created_task.id,
+                title="Title",
+                description="Description",
+                due_at=None,
+            )
+        )
+
+        assert updated_task.status == TaskStatus.DONE
+        assert updated_task.priority == TaskPriority.HIGH
+        assert updated_task.due_at == due_at.isoformat()
+        assert cleared_task.status == TaskStatus.DONE
+        assert cleared_task.due_at is None
+
     def test_update_task_not_found(self) -> None:
         non_existent_task_id = "507f1f77bcf86cd799439011"
         update_params = UpdateTaskParams(
@@ -142,6 +1234,14 @@ class TestTaskService(BaseTestTask):
         with self.assertRaises(TaskNotFoundError):
             TaskService.get_task(params=get_params)
 
+    def test_delete_task_uses_single_tasks_round_trip(self) -> None:
+        created_task = self.create_test_task(account_id=self.account.id)
+        ApplicationRepositoryClient.command_counter.reset()
+
+        TaskService.delete_task(params=DeleteTaskParams(account_id=self.account.id, task_id=created_task.id))
+
+        self.assert_task_write_round_trips("findAndModify")
+
     def test_delete_task_not_found(self) -> None:
         non_existent_task_id = "507f1f77bcf86cd799439011"
         delete_params = DeleteTaskParams(account_id=self.account.id, task_id=non_existent_task_id)